@@ -1,15 +1,162 @@
-import datetime as dates
+import functools
+import glob
 import math
+import os
 import pathlib as paths
+import re
 import shutil
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
-from VerifyInputType import VerifyInputType
+from VerifyInputType import VerifyInputType, validate_types
 from MetadataAcquisition import MetadataAcquisition
-from Render import Render
+from Render import Render, RenderPool
+
+# Extensions that support artwork, and which of them have artwork embedded by ffmpeg or by AtomicParsley.
+_ARTWORK_EXTS = frozenset({'.mp3', '.mp4', '.m4a', '.m4v'})
+_FFMPEG_ART_EXTS = frozenset({'.mp3', '.mp4'})
+_ATOMIC_EXTS = frozenset({'.m4a', '.m4v'})
+
+# Matches a decibel amount such as "-3.2 dB", "+3 dB" or volumedetect's "-inf dB" (the sign and the amount.)
+_DB_RE = re.compile(r'^([-+]?)(\d+(?:\.\d+)?|inf)\s*dB$')
+
+# Matches a pan_audio input such as "L100" (the direction and the percentage from 1-100.)
+_PAN_RE = re.compile(r'([LR])([1-9]\d?|100)')
+
+# add_aud_stream_to_vid arguments to copy every stream of the first input,
+# and to encode each added audio input (both with the language set to English.)
+_COPY_ALL_ENG_CMD = ('-map', '0', '-c', 'copy', '-metadata:s', 'language=eng')
+_AAC_ENG_CMD = ('-c:a', 'aac', '-metadata:s', 'language=eng')
+
+# Match change_image_resolution dimensions such as "1920:1080" and a width such as "1920".
+_DIM_RE = re.compile(r'(\d+):(\d+)', re.ASCII)
+_WIDTH_RE = re.compile(r'\d+', re.ASCII)
+
+# Match a timecode such as "1:06:05.7", "6:05.7" or "5" (hours, minutes, seconds, fraction of a second.)
+_TIMECODE_RE = re.compile(r'^(?:(\d+):)?(?:(\d+):)?(\d+)(?:\.(\d+))?$', re.ASCII)
+
+# Video filters rotate_footage uses for rotations by a multiple of 90 degrees (clockwise like the rotate filter.)
+_ORTHOGONAL_ROTATE_FILTERS = {
+	'0': '', '360': '', '-360': '',
+	'90': 'transpose=1', '-270': 'transpose=1',
+	'-90': 'transpose=2', '270': 'transpose=2',
+	'180': 'hflip,vflip', '-180': 'hflip,vflip',
+}
+
+# Containers that store a display matrix so the footage can be rotated by only changing it (-display_rotation.)
+_DISPLAY_MATRIX_EXTS = frozenset({'.mp4', '.mov', '.m4v'})
+
+# Extensions that can't have an artwork stream (so _add_to_ren_cmd__rm_art_stream_index_selector doesn't scan them.)
+_NO_ART_EXTS = frozenset({'.wav', '.aif', '.aiff', '.aac', '.ac3', '.srt', '.vtt', '.ass'})
+
+# Extensions concat can join with the concat protocol (the files can just be appended byte for byte.)
+_CONCAT_PROTOCOL_EXTS = frozenset({'.ts', '.mpg', '.aac'})
+
+# (codec, output extension) pairs where the codec can be copied into that container without re-encoding.
+_REMUX_SAFE = frozenset({
+	('h264', '.mp4'), ('h264', '.m4v'), ('h264', '.mov'), ('h264', '.mkv'),
+	('hevc', '.mp4'), ('hevc', '.m4v'), ('hevc', '.mov'), ('hevc', '.mkv'),
+	('prores', '.mov'), ('prores', '.mkv'),
+	('vp9', '.mkv'), ('vp9', '.webm'),
+	('av1', '.mp4'), ('av1', '.mkv'), ('av1', '.webm'),
+	('aac', '.mp4'), ('aac', '.m4v'), ('aac', '.m4a'), ('aac', '.mov'), ('aac', '.mkv'),
+	('alac', '.m4a'), ('alac', '.mov'), ('alac', '.mkv'),
+	('mp3', '.mp3'), ('mp3', '.mp4'), ('mp3', '.mov'), ('mp3', '.mkv'),
+	('ac3', '.mp4'), ('ac3', '.mov'), ('ac3', '.mkv'),
+	('opus', '.ogg'), ('opus', '.mkv'), ('opus', '.webm'),
+	('vorbis', '.ogg'), ('vorbis', '.mkv'), ('vorbis', '.webm'),
+	('flac', '.flac'), ('flac', '.mkv'),
+	# Artwork.
+	('mjpeg', '.mp3'), ('mjpeg', '.mp4'), ('mjpeg', '.m4v'), ('mjpeg', '.m4a'), ('mjpeg', '.mov'),
+	('png', '.mp3'), ('png', '.mp4'), ('png', '.m4v'), ('png', '.m4a'), ('png', '.mov'),
+	# Subtitles.
+	('mov_text', '.mp4'), ('mov_text', '.m4v'), ('mov_text', '.mov'),
+	('subrip', '.mkv'), ('ass', '.mkv'), ('webvtt', '.mkv'), ('webvtt', '.webm'),
+})
+
+
+def _stream_types_of(in_path):
+	"""Return the stream types of in_path (for inputs other than self.in_path which has its own cache.)
+	The ffprobe scan is cached by MetadataAcquisition.probe_all so an unchanged file is only ever probed once."""
+	return MetadataAcquisition(in_path).return_stream_types()
+
+
+@functools.lru_cache(maxsize=None)
+def _nvenc_available():
+	"""Return True if ffmpeg can encode with hevc_nvenc on this computer (checked once with a tiny test encode
+	because the encoder can be listed even without an NVIDIA GPU.)"""
+	import subprocess as sub
+	
+	try:
+		test_process = sub.run(['ffmpeg', '-hide_banner', '-loglevel', 'error', '-f', 'lavfi', '-i',
+		                        'color=size=256x256:duration=0.1', '-c:v', 'hevc_nvenc', '-f', 'null', '-'],
+		                       stdout=sub.DEVNULL, stderr=sub.DEVNULL, timeout=30)
+	except (OSError, sub.TimeoutExpired):
+		return False
+	return test_process.returncode == 0
+
+
+def _fade_filters(fade_begin: bool, fade_end: bool, fade_dur_sec: int, fade_out_sec: float,
+                  fade_out_at_sec: int) -> tuple:
+	"""Return the (video, audio) ffmpeg filters to fade the beginning and/or ending for
+	FileOperations.fade_begin_and_or_end__audio_and_or_video."""
+	# The beginning fade can be used for video or audio (by adding "a" at the beginning for the audio filter.)
+	fade_begin_cmd = f'fade=in:st=0:d={fade_dur_sec}'
+	# Subtract 0.2 seconds from the ending fade start time because otherwise the video doesn't get
+	# all the way to black.
+	fade_end_vid_cmd = f'fade=out:st={fade_out_sec - 0.2}:d={fade_dur_sec}'
+	fade_end_aud_cmd = f'afade=out:st={fade_out_sec}:d={fade_dur_sec}'
+	
+	# If fade_begin=True and fade_end=True then they need both parts of the command or,
+	# if fade_out_at_sec is specified then it needs the beginning and ending command.
+	if fade_end is True or fade_out_at_sec != 0:
+		if fade_begin is True:
+			return fade_begin_cmd + ',' + fade_end_vid_cmd, 'a' + fade_begin_cmd + ',' + fade_end_aud_cmd
+		return fade_end_vid_cmd, fade_end_aud_cmd
+	return fade_begin_cmd, 'a' + fade_begin_cmd
+
+
+class _FilterGraphBuilder:
+	"""Collect video and audio filters (e.g. "hflip", "rotate=...", "scale=W:H", "volume=...") so they're all
+	applied in one -vf/-af chain of a single ffmpeg command instead of decoding and encoding the input once per filter."""
+	def __init__(self):
+		self.vid_filters = []
+		self.aud_filters = []
+
+	def add_vid(self, *filters):
+		# Empty filters are skipped so optional filters can be passed in without checking them first.
+		self.vid_filters += [vid_filter for vid_filter in filters if vid_filter]
+		return self
+
+	def add_aud(self, *filters):
+		self.aud_filters += [aud_filter for aud_filter in filters if aud_filter]
+		return self
+
+	def to_args(self):
+		"""Return the ffmpeg arguments for every filter that was added (or an empty list if there aren't any.)"""
+		filter_args = []
+		if self.vid_filters != []:
+			filter_args += ('-vf', ','.join(self.vid_filters))
+		if self.aud_filters != []:
+			filter_args += ('-af', ','.join(self.aud_filters))
+		return filter_args
+
+
+def _run_file_operation(job):
+	"""Worker for FileOperations.map_parallel (it has to be a module level function so it can be sent to another process.)\n
+	job is a tuple of (in_path, out_dir, init_kwargs, method_name, method_kwargs)."""
+	in_path, out_dir, init_kwargs, method_name, method_kwargs = job
+	return getattr(FileOperations(in_path, out_dir, **init_kwargs), method_name)(**method_kwargs)
+
 
 class FileOperations(VerifyInputType):
+	# The ffmpeg metadata keywords for each change_metadata argument (in the same order as the arguments.)
+	_METADATA_KEYWORDS = ('artist=', 'album=', 'description=', 'lyrics=', 'genre=', 'composer=', 'performer=',
+	                      'track=', 'disc=', 'date=', 'comment=', 'title=', '')
+	
 	def __init__(self, in_path, out_dir, print_success=True, print_err=True,
-	             print_ren_info=False, print_ren_time=True, open_after_ren=False):
+	             print_ren_info=False, print_ren_time=True, open_after_ren=False, pool=None, max_threads=0,
+	             tmpfs_dir=None):
 		"""This class contains many different methods for altering video/audio files.\n
 		in_path (path to the input file) and out_dir (path to a separate output folder)
 		are both required for all methods and must be pathlib paths.\n
@@ -18,15 +165,24 @@ class FileOperations(VerifyInputType):
 		print_ren_info will print all the file and render info ffmpeg produces.\n
 		print_ren_time will display how long the output took to render
 		(and if a method requires scanning the file first it will print how long that took).\n
-		open_after_ren is True it will automatically open the output file(s) after they're done rendering."""
+		open_after_ren is True it will automatically open the output file(s) after they're done rendering.\n
+		pool can be a RenderPool to render in the background, in which case the method's render is queued in the pool
+		(see RenderPool.join to wait for the outputs.)\n
+		max_threads is how many threads each ffmpeg render can use (the default 0 lets ffmpeg use every core.)\n
+		tmpfs_dir can be a path to a RAM backed directory (e.g. pathlib.Path('/dev/shm') on Linux) to render into before
+		the original metadata/artwork is embedded so only the final output is written to the drive
+		(see Render, the default None doesn't use it.)"""
 		
 		# Run function to print an error and quit if the input type is not the correct type.
-		self.is_type_or_print_err_and_quit(type(out_dir), paths.Path, 'out_dir')
-		self.is_type_or_print_err_and_quit(type(print_success), bool, 'print_success')
-		self.is_type_or_print_err_and_quit(type(print_err), bool, 'print_err')
-		self.is_type_or_print_err_and_quit(type(print_ren_info), bool, 'print_ren_info')
-		self.is_type_or_print_err_and_quit(type(print_ren_time), bool, 'print_ren_time')
-		self.is_type_or_print_err_and_quit(type(open_after_ren), bool, 'open_after_ren')
+		self.is_type_or_print_err_and_quit(out_dir, paths.Path, 'out_dir')
+		self.is_type_or_print_err_and_quit(print_success, bool, 'print_success')
+		self.is_type_or_print_err_and_quit(print_err, bool, 'print_err')
+		self.is_type_or_print_err_and_quit(print_ren_info, bool, 'print_ren_info')
+		self.is_type_or_print_err_and_quit(print_ren_time, bool, 'print_ren_time')
+		self.is_type_or_print_err_and_quit(open_after_ren, bool, 'open_after_ren')
+		self.is_type_or_print_err_and_quit(max_threads, int, 'max_threads')
+		if tmpfs_dir is not None:
+			self.is_type_or_print_err_and_quit(tmpfs_dir, paths.Path, 'tmpfs_dir')
 		
 		# Pathlib path to a input file for the terminal command.
 		self.in_path = in_path
@@ -35,9 +191,12 @@ class FileOperations(VerifyInputType):
 		
 		# The concat method requires a list input, but otherwise it should just be one path.
 		if type(in_path) is not list:
-			self.is_type_or_print_err_and_quit(type(in_path), paths.Path, 'in_path')
+			self.is_type_or_print_err_and_quit(in_path, paths.Path, 'in_path')
 			# Path to standard ffmpeg output file which is just the name of the input file in a different directory.
-			self.standard_out_path = paths.Path().joinpath(self.out_dir, self.in_path.name)
+			self.standard_out_path = self.out_dir / self.in_path.name
+			# The input basename (without the extension) and extension are used to name most outputs.
+			self.in_stem = self.in_path.stem
+			self.in_suffix = self.in_path.suffix
 		
 		# Boolean to toggle the terminal outputting a successful messages (with output path)
 		self.print_success = print_success
@@ -52,7 +211,86 @@ class FileOperations(VerifyInputType):
 		self.print_ren_info = print_ren_info
 		# Boolean value to toggle on or off opening the output file once it finishes rendering.
 		self.open_after_ren = open_after_ren
-
+		# Optional RenderPool for rendering in the background.
+		self.pool = pool
+		# Number of threads for each ffmpeg render (0 is automatic.)
+		self.max_threads = max_threads
+		# RAM backed directory to render into before the original metadata is embedded (None to not use one.)
+		self.tmpfs_dir = tmpfs_dir
+		
+		# The input is only scanned by ffprobe the first time any stream or format info is needed and then reused
+		# (along with the stream types and duration in seconds) for any other method called on this instance
+		# (see refresh_metadata.)
+		self._probe_cache = None
+		self._stream_types_cache = None
+		self._stream_type_set_cache = None
+		self._duration_cache = None
+
+	@classmethod
+	def map_parallel(cls, in_paths, out_dir, method_name, *, max_workers=None, threads_per_ffmpeg=1,
+	                 print_success=True, print_err=True, print_ren_info=False, open_after_ren=False, **kwargs):
+		"""Run the same method on multiple input files at the same time (one ffmpeg process per file).\n
+		in_paths is a list of pathlib paths, method_name is the name of the method to run for every input
+		(e.g. 'trim') and any other keyword arguments are passed to that method.\n
+		max_workers defaults to the number of CPU cores divided by threads_per_ffmpeg
+		(how many threads each ffmpeg process can use, see max_threads.)\n
+		If tqdm is installed a progress bar is displayed.\n
+		NOTE: print_ren_time is always False for each file because the output from every process would be mixed together.
+		Returns a list with the result of each method call in the same order as in_paths
+		(the render result True or False for methods that render, but None for the few that don't return anything,
+		e.g. if the output was just copied.)"""
+		
+		cls.is_type_or_print_err_and_quit(in_paths, list, 'in_paths')
+		cls.is_type_or_print_err_and_quit(method_name, str, 'method_name')
+		cls.is_type_or_print_err_and_quit(threads_per_ffmpeg, int, 'threads_per_ffmpeg')
+		if hasattr(cls, method_name) is False or method_name.startswith('_'):
+			print(f'Error, "{method_name}" is not a FileOperations method.')
+			quit()
+		
+		if max_workers is None:
+			max_workers = max(1, (os.cpu_count() or 1) // max(1, threads_per_ffmpeg))
+		init_kwargs = dict(print_success=print_success, print_err=print_err, print_ren_info=print_ren_info,
+		                   print_ren_time=False, open_after_ren=open_after_ren, max_threads=threads_per_ffmpeg)
+		jobs = [(in_path, out_dir, init_kwargs, method_name, kwargs) for in_path in in_paths]
+		
+		# tqdm is optional, so if it isn't installed just run the jobs without a progress bar.
+		try:
+			from tqdm.contrib.concurrent import process_map
+		except ImportError:
+			with ProcessPoolExecutor(max_workers=max_workers) as executor:
+				return list(executor.map(_run_file_operation, jobs))
+		return process_map(_run_file_operation, jobs, max_workers=max_workers, desc=method_name)
+	
+	@classmethod
+	def run_batch(cls, operations, max_parallel=None, **init_kwargs):
+		"""Run a list of operations with several ffmpeg renders at the same time (see RenderPool.)\n
+		operations is a list of (in_path, out_dir, method_name, method_kwargs) tuples, e.g.
+		[(path, out_dir, 'fade_begin_and_or_end__audio_and_or_video', {'fade_begin': True}), ...]\n
+		Each command is built in order while the previous ones keep rendering in the background.
+		max_parallel is how many renders can run at once (default is half the CPU cores, up to 4) and
+		any other keyword arguments are passed to each FileOperations init.\n
+		NOTE: An operation can't use the output of a previous operation as its input
+		because they can be rendering at the same time.\n
+		Returns a list with the result of each operation in the same order as operations (methods that render in the
+		pool return a Future which is replaced with its render result, the others already rendered before returning.)"""
+		
+		cls.is_type_or_print_err_and_quit(operations, list, 'operations')
+		for in_path, out_dir, method_name, method_kwargs in operations:
+			if hasattr(cls, method_name) is False or method_name.startswith('_'):
+				print(f'Error, "{method_name}" is not a FileOperations method.')
+				quit()
+		
+		if max_parallel is None:
+			max_parallel = max(1, min((os.cpu_count() or 1) // 2, 4))
+		with RenderPool(max_parallel) as pool:
+			# Keep each operation's own return value because not every method renders in the pool
+			# (so the pool's results wouldn't line up with operations.)
+			op_results = [getattr(cls(in_path, out_dir, pool=pool, **init_kwargs), method_name)(**method_kwargs)
+			              for in_path, out_dir, method_name, method_kwargs in operations]
+			# Wait for every render in the pool (including any a method queued without returning it.)
+			pool.join()
+		return [op_result.result() if isinstance(op_result, Future) else op_result for op_result in op_results]
+	
 	def change_metadata(self, artist_author='', album='', description='', lyrics='', genre='', composer='', performer='',
 	                    track_num='', disc_num='', date_y_m_d='', comment='', title='', arbitrary_key_value_pair=''):
 		"""This method changes metadata values of files. The only valid input types are str() and None.\n
@@ -62,101 +300,150 @@ class FileOperations(VerifyInputType):
 		arbitrary_key_value_pair should be a string in the form of "key=value"\n
 		NOTE: At least one new value must be specified or this method will print an error and return False."""
 		
-		# Dictionary to store the ffmpeg metadata value keywords.
-		meta_dict = dict([
-			(artist_author, 'artist='),
-			(album, 'album='),
-			(description, 'description='),
-			(lyrics, 'lyrics='),
-			(genre, 'genre='),
-			(composer, 'composer='),
-			(performer, 'performer='),
-			(track_num, 'track='),
-			(disc_num, 'disc='),
-			(date_y_m_d, 'date='),
-			(comment, 'comment='),
-			(title, 'title='),
-			(arbitrary_key_value_pair, ''),
-		])
-		
-		# Check if all input values are the same and is so print an error.
-		all_inputs_are_equal = all(meta_dict.keys())
-		if all_inputs_are_equal is True:
+		# The user inputs in the same order as the keywords in _METADATA_KEYWORDS.
+		meta_values = (artist_author, album, description, lyrics, genre, composer, performer,
+		               track_num, disc_num, date_y_m_d, comment, title, arbitrary_key_value_pair)
+		ffmpeg_cmd = self._change_metadata_cmd(meta_values)
+		if ffmpeg_cmd is False:
+			return False
+		
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		       self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
+	
+	async def change_metadata_async(self, artist_author='', album='', description='', lyrics='', genre='', composer='',
+	                                performer='', track_num='', disc_num='', date_y_m_d='', comment='', title='',
+	                                arbitrary_key_value_pair=''):
+		"""Async version of change_metadata (see change_metadata) so multiple files can be changed at the same time
+		from one event loop, e.g. await asyncio.gather(*(op.change_metadata_async(title=t) for op, t in jobs))"""
+		
+		meta_values = (artist_author, album, description, lyrics, genre, composer, performer,
+		               track_num, disc_num, date_y_m_d, comment, title, arbitrary_key_value_pair)
+		ffmpeg_cmd = self._change_metadata_cmd(meta_values)
+		if ffmpeg_cmd is False:
+			return False
+		
+		return await Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		                    self.print_ren_info, self.print_ren_time,
+		                    self.open_after_ren).check_depend_then_ren_async()
+	
+	def _change_metadata_cmd(self, meta_values):
+		"""Local method for change_metadata(_async) to return the ffmpeg command to change the metadata to meta_values
+		(in the same order as _METADATA_KEYWORDS), or False if no values were specified."""
+		
+		# Check if every input value was left as the default empty string and if so print an error.
+		if not any(meta_value != '' for meta_value in meta_values):
 			print('Error, at least one value must be specified for any metadata to be changed.')
 			return False
 
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-c', 'copy']
 		
 		# Any values to change will be appended with the keyword "-metadata" before each using a
-		# for loop going over all possible values from the dictionary.
-		for meta_value in meta_dict.keys():
-			# If the key (user input) is not an empty string then append that option to the ffmpeg command.
-			if type(meta_value) is str and meta_value != '':
-				ffmpeg_cmd += ('-metadata', meta_dict[meta_value] + meta_value)
-			# If the meta_value type is None then set the value for that key (user input)
+		# for loop going over all possible values paired with their keyword.
+		for meta_keyword, meta_value in zip(self._METADATA_KEYWORDS, meta_values):
+			# If a metadata value is set to the default empty string skip that empty value and continue the loop.
+			if meta_value == '':
+				continue
+			# If the meta_value is None then set the value for that keyword
 			# to nothing (so that key will not have a value in the output.)
 			# e.g., -metadata artist= as apposed to -metadata artist="Artist"
 			elif meta_value is None:
-				ffmpeg_cmd += ('-metadata', (meta_dict[meta_value]))
-			# If a metadata value is set to the default empty string skip that empty value and continue the loop.
-			elif meta_value == '':
-				continue
+				ffmpeg_cmd += ('-metadata', meta_keyword)
+			# If the user input is a string then append that option to the ffmpeg command.
+			elif isinstance(meta_value, str):
+				ffmpeg_cmd += ('-metadata', meta_keyword + meta_value)
 			else:
 				if self.print_err is True:
-					(f'Error, metadata values can only be a string or None, but "{meta_value}" is {type(meta_value)}')
+					print(f'Error, metadata values can only be a string or None, but "{meta_value}" is {type(meta_value)}')
 				quit()
 		
 		# Append output path to the ffmpeg_cmd list.
 		ffmpeg_cmd.append(self.standard_out_path)
-		
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-		       self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return ffmpeg_cmd
 	
+	@validate_types(copy_this_metadata_file=paths.Path, copy_chapters=bool)
 	def copy_over_metadata(self, copy_this_metadata_file, copy_chapters=True):
 		"""This method will copy any metadata values from copy_this_metadata_file to the output."""
 
-		self.is_type_or_print_err_and_quit(type(copy_this_metadata_file), paths.Path, 'copy_this_metadata_file')
-		self.is_type_or_print_err_and_quit(type(copy_chapters), bool, 'copy_chapters')
-
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-i', copy_this_metadata_file]
 		if copy_chapters is False:
 			ffmpeg_cmd += ('-map_chapters', '-1')
 		ffmpeg_cmd += ['-map', '0', '-c', 'copy', '-map_metadata', '1', self.standard_out_path]
 
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-		       self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		       self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
+		
+	@validate_types(in_meta_file=paths.Path, copy_chapters=bool, copy_metadata=bool, artwork=bool)
+	def copy_metadata_and_artwork(self, in_meta_file, copy_chapters=True, copy_metadata=True, artwork=True):
+		"""This method copies the metadata values (like copy_over_metadata) and the artwork from in_meta_file to the
+		output in one render (instead of a render to copy the metadata, one to extract the artwork and one to embed it.)\n
+		The artwork can only be copied this way for ".mp3" and ".mp4" outputs so it returns False if artwork is True
+		for any other output (then the artwork has to be embedded with embed_artwork), otherwise True.\n
+		Nothing is rendered if there's nothing to copy."""
+		
+		# The index of the artwork stream in in_meta_file (None if it isn't being copied or there isn't one.)
+		art_strm_index = None
+		if artwork is True:
+			if self.in_suffix not in _FFMPEG_ART_EXTS:
+				art_copied = False
+			else:
+				art_copied = True
+				meta_strm_types = MetadataAcquisition(in_meta_file).return_stream_types() or []
+				if 'Artwork' in meta_strm_types:
+					art_strm_index = meta_strm_types.index('Artwork')
+		else:
+			art_copied = True
+		if copy_metadata is False and art_strm_index is None:
+			return art_copied
+		
+		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-i', in_meta_file, '-map', '0']
+		if art_strm_index is not None:
+			# Leave out any artwork the output already has so the artwork from in_meta_file replaces it,
+			# and add the artwork as the video stream after every video stream of the output (see embed_artwork.)
+			ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
+			new_art_index = (self._get_stream_types() or []).count('Video')
+			ffmpeg_cmd += ['-map', f'1:{art_strm_index}', '-c', 'copy',
+			               f'-disposition:v:{new_art_index}', 'attached_pic']
+		else:
+			ffmpeg_cmd += ('-c', 'copy')
+		if copy_metadata is True:
+			ffmpeg_cmd += ('-map_metadata', '1')
+			if copy_chapters is False:
+				ffmpeg_cmd += ('-map_chapters', '-1')
+		ffmpeg_cmd.append(self.standard_out_path)
 		
+		Render([self.in_path, in_meta_file], self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		       self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return art_copied
+	
 	def rm_metadata(self):
 		"""This method will not maintain any metadata values from the input to the output."""
 
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-c', 'copy', '-map_chapters', '-1', '-map_metadata', '-1', '-map', '-0:s', self.standard_out_path]
 
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-		       self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		       self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
 
+	@validate_types(new_title=str)
 	def change_file_name_and_meta_title(self, new_title):
 		"""This method changes the filename and metadata title of a file."""
 
-		self.is_type_or_print_err_and_quit(type(new_title), str, 'new_title')
-		
 		# path object to rename the output basename.
-		full_out_path = paths.Path().joinpath(self.out_dir, new_title + self.in_path.suffix)
+		full_out_path = self.out_dir / (new_title + self.in_suffix)
 		# If there are video, audio, or subtitle streams copy those to the output and change the -metadata title.
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-c',
 		              'copy', '-metadata', 'title=' + new_title, full_out_path]
 		
 		# Run the check_depend_then_ren method in the Render class to check that the input file and output directory
 		#   exist then render the output file with the given ffmpeg command.
-		Render(self.in_path, full_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-		       self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return Render(self.in_path, full_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		       self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
 	
+	@validate_types(in_artwork=paths.Path)
 	def embed_artwork(self, in_artwork):
 		"""This method embeds artwork into the output file.\n
 		in_artwork is required.
 		NOTE: This method does not work if the input is a .m4a file and has chapters embedded."""
 		
-		self.is_type_or_print_err_and_quit(type(in_artwork), paths.Path, 'in_artwork')
-
 		# The input artwork file does not have the ".jpg" extension so print an error.
 		if in_artwork.exists() and in_artwork.suffix != '.jpg':
 			print(f'Error, input artwork "{in_artwork}" is not a ".jpg" file.')
@@ -166,60 +453,51 @@ class FileOperations(VerifyInputType):
 			print(f'Error, input artwork "{in_artwork}" not found.')
 			return False
 		
-		# The input file may already have artwork, so create a temporary file that will have the artwork removed
-		# (if it had any in the first place,) so that temporary file can be used as the input for the desired output
-		# file with the new artwork. This is because if the input file already
-		# has artwork then the output artwork may not be changed.
-		temp_rm_art_exists = FileOperations(self.in_path, self.out_dir, False, False, False, False).rm_artwork()
-		# The input file doesn't have any artwork so copy the file to use the same logic below.
-		if temp_rm_art_exists is False:
-			shutil.copy2(self.in_path, self.standard_out_path)
-		
-		# Rename the temporary output with no artwork and use that as the input.
-		temp_rm_artwork_path = paths.Path().joinpath(self.out_dir, self.in_path.stem
-		                                             + '-temp_rm_art_before_renaming' + self.in_path.suffix)
-		self.standard_out_path.rename(temp_rm_artwork_path)
-
 		# If the input extension is ".mp4" or ".mp3" then render with ffmpeg, but if it's a different valid format then
 		# render with AtomicParsley. Otherwise print an error that the input file extension isn't valid.
-		if self.in_path.suffix == '.mp3' or self.in_path.suffix == '.mp4':
+		if self.in_suffix in _FFMPEG_ART_EXTS:
+			# The input may already have artwork, and if it does the new artwork may not replace it, so the old artwork
+			# stream is left out of the same command that embeds the new artwork (instead of rendering a separate
+			# temporary file without artwork first.)
+			stream_types = self._get_stream_type_set()
 			# '-map', '0', '-c', 'copy', says to copy every stream from the first input (video/audio file).
-			#   '-map', '1', '-c:v:1' selects the video stream for the output,
-			#   and 'png', '-disposition:v:1', 'attached_pic' is to embed the artwork.
-			ffmpeg_cmd = ['ffmpeg', '-i', temp_rm_artwork_path, '-i', in_artwork, '-map', '0', '-c', 'copy',
-			              '-map', '1', '-c:v:1', 'png', '-disposition:v:1', 'attached_pic', self.standard_out_path]
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
-				   self.print_err, self.print_ren_info, self.print_ren_time).check_depend_then_ren()
-			# Delete the temporary file that didn't have any artwork that was used as the input to embed the artwork.
-			temp_rm_artwork_path.unlink()
+			ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-i', in_artwork, '-map', '0']
+			if 'Artwork' in stream_types:
+				ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
+			# The new artwork is the video stream after every video stream from the input
+			# (0 for audio files and 1 for a video with one video stream.)
+			new_art_index = (self._get_stream_types() or []).count('Video')
+			#   '-map', '1', '-c:v:X' selects the new artwork stream for the output,
+			#   and 'png', '-disposition:v:X', 'attached_pic' is to embed the artwork.
+			ffmpeg_cmd += ['-map', '1', '-c', 'copy', f'-c:v:{new_art_index}', 'png',
+			               f'-disposition:v:{new_art_index}', 'attached_pic', self.standard_out_path]
+			return Render([self.in_path, in_artwork], self.standard_out_path, ffmpeg_cmd, self.print_success,
+			       self.print_err, self.print_ren_info, self.print_ren_time,
+			       self.open_after_ren, pool=self.pool).check_depend_then_ren()
 		# If the input file extension is a different valid extension then use AtomicParsley to embed artwork.
-		elif self.in_path.suffix == '.m4v' or self.in_path.suffix == '.m4a':
-			# AtomicParsley command syntax (change the artwork of the output file directly without creating another
-			# file.)
-			atomic_parsley_cmd = ['AtomicParsley', temp_rm_artwork_path, '--overWrite', '--artwork', in_artwork]
+		elif self.in_suffix in _ATOMIC_EXTS:
+			# AtomicParsley changes the output file directly, so copy the input to the output then remove any existing
+			# artwork and add the new artwork in one AtomicParsley command.
+			FileOperations._fast_clone(self.in_path, self.standard_out_path)
+			atomic_parsley_cmd = ['AtomicParsley', self.standard_out_path, '--artwork', 'REMOVE_ALL',
+			                      '--artwork', in_artwork, '--overWrite']
 			# Render with AtomicParsley
-			ren_result = Render(temp_rm_artwork_path, self.standard_out_path, atomic_parsley_cmd, 
+			ren_result = Render(self.in_path, self.standard_out_path, atomic_parsley_cmd,
 			                    self.print_success, self.print_err, self.print_ren_info, self.print_ren_time,
 			                    self.open_after_ren).run_terminal_cmd(append_hide_banner=False, append_faststart=False)
 			# AtomicParsley creates a duplicate artwork file NAME-resized-0000.jpg so delete that temporary file.
-			for file in in_artwork.parent.iterdir():
-				if file.stem.startswith(in_artwork.stem):
-					# Scan string beginning after the length of the original input to see if it has the keyword -resized-
-					# filename<HERE>-resized-0000.jpg (the number is randomized.)
-					if str(file.stem[len(in_artwork.stem):]).startswith('-resized-') and file.suffix == '.jpg':
-						file.unlink()
+			# (Only files matching filename-resized-*.jpg are listed, the number is randomized.)
+			for file in in_artwork.parent.glob(f'{glob.escape(in_artwork.stem)}-resized-*.jpg'):
+				file.unlink(missing_ok=True)
 			
 			# Custom output message to specify the problem occurred with AtomicParsley and not ffmpeg.
 			if ren_result is False and self.print_err is True:
 				print('\nError, a problem occurred with AtomicParsley while rendering:')
 				print(f'Terminal input command: {atomic_parsley_cmd}')
-			
-			# Rename temporary output file (originally with no artwork) to the out_path name since it has the artwork now.
-			temp_rm_artwork_path.rename(self.standard_out_path)
 		else:
 			# Target output extension is not supported for artwork embedding so print an error and return False.
 			if self.print_err is True:
-				print(f'\nError, artwork embedding is not supported for target output extension "{self.in_path.suffix}"'
+				print(f'\nError, artwork embedding is not supported for target output extension "{self.in_suffix}"'
 				      f'\nPlease convert "{self.in_path}"\nto a valid extension (.mp3, .mp4, .m4v, .m4a) '
 				      f'for artwork embedding.\n')
 			return False
@@ -228,21 +506,20 @@ class FileOperations(VerifyInputType):
 		"""This method extracts the artwork from the input file and exports it to a ".jpg" file."""
 		
 		# Artwork extracting is not supported for the target output extension so print an error and return False.
-		if self.in_path.suffix != '.mp3' and self.in_path.suffix != '.mp4' \
-			and self.in_path.suffix != '.m4a' and self.in_path.suffix != '.m4v' and self.print_err is True:
-			print(f'\nError, artwork extraction is not supported for input extension "{self.in_path.suffix}"'
+		if self.in_suffix not in _ARTWORK_EXTS and self.print_err is True:
+			print(f'\nError, artwork extraction is not supported for input extension "{self.in_suffix}"'
 			      f'\nPlease convert "{self.in_path}" to a valid extension (.mp3, .mp4, .m4v, .m4a) for artwork extraction '
 			      f'(if it has artwork in the first place).\n')
 			return False
 
 		# path to output file with the same name as the input, but with the ".jpg" extension.
-		art_ext_out_path = paths.Path.joinpath(self.out_dir, self.in_path.stem + '.jpg')
+		art_ext_out_path = self.out_dir / (self.in_stem + '.jpg')
 		
 		# -map select the artwork stream if it exists ('0:v'),
 		# then deselect every other video stream except the artwork stream ("-0:V") and output to a jpg file.
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0:v?', '-map', '-0:V?', '-c', 'copy', art_ext_out_path]
 
-		in_strms = MetadataAcquisition(self.in_path).return_stream_types()
+		in_strms = self._get_stream_type_set()
 		art_exists = 'Artwork' in in_strms
 		if art_exists is False:
 			if self.print_err is True:
@@ -261,8 +538,8 @@ class FileOperations(VerifyInputType):
 		NOTE: This method will not quit if the input does not have any artwork."""
 		
 		# If the extension is .m4v or .m4a use AtomicParsley to remove the artwork
-		if self.in_path.suffix == '.m4v' or self.in_path.suffix == '.m4a':
-			shutil.copy2(self.in_path, self.standard_out_path)
+		if self.in_suffix in _ATOMIC_EXTS:
+			FileOperations._fast_clone(self.in_path, self.standard_out_path)
 			# AtomicParsley command syntax (change the artwork of the output file directly
 			# without creating another file.)
 			atomic_parsley_cmd = ['AtomicParsley', self.standard_out_path, '--artwork', 'REMOVE_ALL', '--overWrite']
@@ -272,7 +549,7 @@ class FileOperations(VerifyInputType):
 			return ren_result
 
 		# Print an error if the input doesn't have artwork and copy to output.
-		stream_types = MetadataAcquisition(self.in_path, self.print_ren_info, False, False).return_stream_types()
+		stream_types = self._get_stream_type_set()
 		art_stream = 'Artwork' in stream_types
 		if art_stream is None or art_stream is False and self.print_err is True:
 			print(f'Error, no artwork found in input:\n{self.in_path}\nFor output:\n{self.standard_out_path}')
@@ -282,35 +559,61 @@ class FileOperations(VerifyInputType):
 			ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
 			ffmpeg_cmd.append(self.standard_out_path)
 			
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				   self.print_err, self.print_ren_info, self.print_ren_time,
-			       self.open_after_ren).check_depend_then_ren(append_faststart=False)
-		return True
+			       self.open_after_ren, pool=self.pool).check_depend_then_ren(append_faststart=False)
 	
 	def change_ext(self, new_ext, codec_copy=False):
-		"""This method changes the self.in_path extension to new_ext."""
+		"""This method changes the self.in_path extension to new_ext.\n
+		If every video and audio codec from the input can be stored in the new_ext container the streams are copied
+		(which is much faster than re-encoding) even if codec_copy is False."""
+		
+		new_ext_out_path, ffmpeg_cmd = self._change_ext_cmd(new_ext, codec_copy)
+		if ffmpeg_cmd is not None:
+			return Render(self.in_path, new_ext_out_path, ffmpeg_cmd, self.print_success, self.print_err, self.print_ren_info,
+			       self.print_ren_time, self.open_after_ren, pool=self.pool,
+			       tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata()
+	
+	async def change_ext_async(self, new_ext, codec_copy=False):
+		"""Async version of change_ext (see change_ext) so multiple files can be converted at the same time
+		from one event loop."""
+		
+		new_ext_out_path, ffmpeg_cmd = self._change_ext_cmd(new_ext, codec_copy)
+		if ffmpeg_cmd is not None:
+			return await Render(self.in_path, new_ext_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+			                    self.print_ren_info, self.print_ren_time,
+			                    self.open_after_ren,
+			                    tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata_async()
+	
+	@validate_types(new_ext=str)
+	def _change_ext_cmd(self, new_ext, codec_copy):
+		"""Local method for change_ext(_async) to return the output path and the ffmpeg command to render it.
+		If new_ext is the same as the input extension the input is just copied and the command is None.\n
+		If every video, audio and subtitle stream can be copied into the new container (see _can_remux_to) they're all
+		copied without re-encoding, otherwise ffmpeg re-encodes with its default stream selection
+		(so a subtitle the new container can't hold as is makes it re-encode instead of leaving the subtitles out.)"""
 		
-		self.is_type_or_print_err_and_quit(type(new_ext), str, 'new_ext')
-
 		# Path to output file with the new target extension.
-		new_ext_out_path = paths.Path().joinpath(self.out_dir, self.in_path.stem + new_ext)
-		
-		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path]
-		if codec_copy is True:
-			ffmpeg_cmd += ('-c', 'copy')
-		ffmpeg_cmd.append(new_ext_out_path)
+		new_ext_out_path = self.out_dir / (self.in_stem + new_ext)
 		
 		# Confirm the target output extension isn't the same as the input extension.
 		# If it is the same extension then print a message and just copy the file.
-		if self.in_path.suffix == new_ext_out_path.suffix:
-			shutil.copy2(self.in_path, new_ext_out_path)
+		if self.in_suffix == new_ext_out_path.suffix:
+			FileOperations._fast_clone(self.in_path, new_ext_out_path)
 			print(f'Error, target output extension, "{new_ext_out_path.suffix}" is the same as '
 			      f'the input extension so the target output file, "{new_ext_out_path}" was just copied.')
-		else:
-			Render(self.in_path, new_ext_out_path, ffmpeg_cmd, self.print_success, self.print_err, self.print_ren_info,
-			       self.print_ren_time, self.open_after_ren).check_depend_then_ren_and_embed_original_metadata()
+			return new_ext_out_path, None
+		
+		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path]
+		if codec_copy is True:
+			ffmpeg_cmd += ('-c', 'copy')
+		elif self._can_remux_to(new_ext_out_path.suffix) is True:
+			ffmpeg_cmd += ('-map', '0:v?', '-map', '0:a?', '-map', '0:s?', '-c', 'copy')
+		ffmpeg_cmd.append(new_ext_out_path)
+		return new_ext_out_path, ffmpeg_cmd
 	
-	def trim(self, start_timecode='', stop_timecode='', codec_copy=False, verify_trim_ranges=True):
+	@validate_types(start_timecode=str, stop_timecode=str, codec_copy=bool, keyframe_seek=bool)
+	def trim(self, start_timecode='', stop_timecode='', codec_copy=False, verify_trim_ranges=True, keyframe_seek=False):
 		"""This method changes the duration of the input from start_timecode to stop_timecode\n
 		Timecode format = "00:00:00.00" (hours, minutes, seconds, and fractions of seconds.)\n
 		At least start_timecode or stop_timecode must be set, but if one of them isn't set it will
@@ -318,13 +621,11 @@ class FileOperations(VerifyInputType):
 		So if stop_timecode="0:35" then start at the beginning and keep everything until it's 35 seconds in.\n
 		codec_copy toggles copying the codec for the output which is False by default because
 		otherwise there's a few second margin of error for some codecs (such as .mp4).\n
+		keyframe_seek copies the codecs and starts at the closest keyframe to start_timecode (instead of re-encoding
+		to start at the exact frame) which is much faster if the exact start doesn't matter.\n
 		NOTE: This method will remove any already existing chapter(s)
 		from the input because otherwise the output won't be trimmed."""
 		
-		self.is_type_or_print_err_and_quit(type(start_timecode), str, 'start_timecode')
-		self.is_type_or_print_err_and_quit(type(stop_timecode), str, 'stop_timecode')
-		self.is_type_or_print_err_and_quit(type(codec_copy), bool, 'codec_copy')
-
 		if start_timecode == '' and stop_timecode == '':
 			if self.print_err is True:
 				print('Error, at least start_timecode or stop_timecode must be set for the output to be changed.')
@@ -334,8 +635,7 @@ class FileOperations(VerifyInputType):
 				print(f'Error, start_timecode and stop_timecode are both set to "{start_timecode}" so no output will be produced.')
 			return False
 		
-		stream_types = MetadataAcquisition(self.in_path, self.print_ren_info,
-										   False, False).return_stream_types()
+		stream_types = self._get_stream_type_set()
 		has_vid_stream = 'Video' in stream_types
 		has_aud_stream = 'Audio' in stream_types
 		if has_vid_stream is False and has_aud_stream is False:
@@ -345,7 +645,7 @@ class FileOperations(VerifyInputType):
 		
 		ffmpeg_cmd = ['ffmpeg']
 		if verify_trim_ranges == True:
-			sec_dur = self._return_input_duration_in_sec()
+			sec_dur = self._get_duration_sec()
 			if sec_dur is None or sec_dur < 1:
 				if self.print_err is True:
 					print(f'''Error, there's no length to trim from input "{self.in_path}"\n''')
@@ -391,21 +691,26 @@ class FileOperations(VerifyInputType):
 		if self.in_path.suffix == '.m4a':
 			ffmpeg_cmd += ('-c', 'copy')
 			ffmpeg_cmd += end_cmd
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				   self.print_err, self.print_ren_info, self.print_ren_time,
-			       self.open_after_ren).check_depend_then_ren()
-		elif codec_copy is True:
+			       self.open_after_ren, pool=self.pool).check_depend_then_ren()
+		elif codec_copy is True or keyframe_seek is True:
 			ffmpeg_cmd += ('-map', '0', '-c', 'copy')
+			# -ss is before the input so ffmpeg seeks to the keyframe before it, so shift the timestamps to start at 0.
+			if keyframe_seek is True:
+				ffmpeg_cmd += ('-avoid_negative_ts', 'make_zero')
 			ffmpeg_cmd += end_cmd
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd,
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd,
                    self.print_success, self.print_err, self.print_ren_info,
-				   self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+				   self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
 		else:
 			ffmpeg_cmd += end_cmd
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				   self.print_err, self.print_ren_info, self.print_ren_time,
-			       self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+			       self.open_after_ren, pool=self.pool,
+			       tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
 
+	@validate_types(num_loop_times=int, loop_to_hours=int, codec_copy=bool)
 	def loop(self, num_loop_times=0, loop_to_hours=0, codec_copy=False):
 		"""This method loops the input the given number of times.\n
 		num_loop_times is the default number of times to repeat.\n
@@ -413,12 +718,7 @@ class FileOperations(VerifyInputType):
 		so the output is at least one hour in length.\n
 		codec_copy toggles whether or not to copy the input codec(s)"""
 
-		self.is_type_or_print_err_and_quit(type(num_loop_times), int, 'num_loop_times')
-		self.is_type_or_print_err_and_quit(type(loop_to_hours), int, 'loop_to_hours')
-		self.is_type_or_print_err_and_quit(type(codec_copy), bool, 'codec_copy')
-
-		stream_types = MetadataAcquisition(self.in_path, self.print_ren_info,
-                                    	   False, False).return_stream_types()
+		stream_types = self._get_stream_type_set()
 		has_vid_stream = 'Video' in stream_types
 		has_aud_stream = 'Audio' in stream_types
 		if has_vid_stream is False and has_aud_stream is False:
@@ -438,9 +738,10 @@ class FileOperations(VerifyInputType):
 				print(f'Error, num_loop_times must be at least 2, not "{num_loop_times}"')
 				return False
 			else:
-				FileOperations.concat(self, codec_copy=codec_copy, _loop_times=num_loop_times)
-				if self.print_success is True:
+				ren_result = self._loop_render(num_loop_times, codec_copy)
+				if self.print_success is True and ren_result is True:
 					print(f'(Looped {num_loop_times} times.)')
+				return ren_result
 		elif loop_to_hours != 0:
 			# Loop input to be X hour(s) in length:
 			if loop_to_hours < 0:
@@ -449,7 +750,7 @@ class FileOperations(VerifyInputType):
 			# There are 3600 seconds in one hour, so multiply that times the number of how many hours long the output
 			# should be because ffmpeg requires that the output be specified in seconds.
 			target_total_sec = loop_to_hours * 3600
-			actual_sec_length = self._return_input_duration_in_sec()
+			actual_sec_length = self._get_duration_sec()
 			# See if the input has no duration, like if it was a static image.
 			if actual_sec_length is None:
 				return False
@@ -457,11 +758,12 @@ class FileOperations(VerifyInputType):
 				if actual_sec_length > target_total_sec:
 					print(f'Error, the input is already greater than or equal to '
 						  f'"{loop_to_hours}" hour(s) in length for input:\n"{self.in_path}"')
+					return False
 				else:
 					# Divide the target output seconds by the actual length and round that number up
 					# so the output is <= target_total_sec.
 					loop_times = int(math.ceil(target_total_sec / actual_sec_length))
-					ren_result = FileOperations.concat(self, codec_copy=codec_copy, _loop_times=loop_times)
+					ren_result = self._loop_render(loop_times, codec_copy, out_dur_sec=target_total_sec)
 					if self.print_success is True and ren_result is True:
 						if loop_to_hours != 0:
 							# Default to looping for multiple hours, but remove the "s" if it only loops for 1 hour.
@@ -469,7 +771,32 @@ class FileOperations(VerifyInputType):
 							if loop_to_hours == 1:
 								hour_singular_or_plural = hour_singular_or_plural[:-1]
 							print(f'Looped ({loop_times} times) to be at least {loop_to_hours} {hour_singular_or_plural} long.')
+					return ren_result
 
+	def _loop_render(self, loop_times, codec_copy, out_dur_sec=None):
+		"""Local method for the loop method to render self.in_path repeated loop_times times.\n
+		-stream_loop makes ffmpeg read the input again each time it reaches the end (instead of listing the same file
+		loop_times times for the concat demuxer.) If out_dur_sec is specified the output stops at that many seconds."""
+		
+		ffmpeg_cmd = ['ffmpeg', '-stream_loop', str(loop_times - 1), '-i', self.in_path, '-map', '0']
+		# Remove any artwork stream (it will be added after the input is looped.)
+		if 'Artwork' in self._get_stream_type_set():
+			ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
+		# Copy input codec by default, but otherwise omit those keywords.
+		if codec_copy is True:
+			ffmpeg_cmd += ('-c', 'copy')
+		if out_dur_sec is not None:
+			ffmpeg_cmd += ('-t', str(out_dur_sec))
+		# The chapters are only for the first loop so remove them.
+		ffmpeg_cmd += ('-map_chapters', '-1', self.standard_out_path)
+		
+		ren_result = Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+		                    self.print_err, self.print_ren_info, self.print_ren_time,
+		                    self.open_after_ren,
+		                    tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+		return ren_result
+	
+	@validate_types(playback_speed=float)
 	def speed(self, playback_speed, add_speed_to_basename=True):
 		"""This method changes the playback speed of the input video/audio. (The pitch is not altered.)\n
 		playback_speed must be a float number in the "1.25" format. e.g., 1.25x playback speed.\n
@@ -477,39 +804,20 @@ class FileOperations(VerifyInputType):
 		(Output Basename-1.50x.mp3).
 		NOTE: This method only works with up to one audio and one video track."""
 
-		self.is_type_or_print_err_and_quit(type(playback_speed), float, 'playback_speed')
+		# A speed of 0 or less can't be rendered (and _atempo_chain would never finish trying to reach it.)
+		if playback_speed <= 0:
+			if self.print_err is True:
+				print(f'\nError, playback_speed must be greater than 0 but it was set to "{playback_speed}".\n')
+			return False
 
-		stream_types = MetadataAcquisition(self.in_path, self.print_ren_info, False, False).return_stream_types()
-		if 'Video' in stream_types is False and 'Audio' in stream_types is False:
+		stream_types = self._get_stream_type_set()
+		if 'Video' not in stream_types and 'Audio' not in stream_types:
 			if self.print_err is True:
 				print(f'\nError, there are not any video or audio streams to change the speed for from input:\n"{self.in_path}"\n')
 				return False
 
-		# I couldn't get the "atempo=2.0,atempo=2.0" system to work but I left the outline here.
-		# new_aud_speed_cmd_num = playback_speed
-		# aud_speed_cmd_keyword = 'atempo='
-		# aud_speed_cmd = aud_speed_cmd_keyword
-		# if new_aud_speed_cmd_num > 2:
-		# 	change_until_devisable = new_aud_speed_cmd_num
-		# 	while change_until_devisable > 2:
-		# 		aud_speed_cmd += '2.0,' + aud_speed_cmd_keyword
-		# 		change_until_devisable -= 2
-		# 	if change_until_devisable != 0:
-		# 		aud_speed_cmd += str(change_until_devisable)
-		# 	else:
-		# 		aud_speed_cmd += '0.0'
-		# elif new_aud_speed_cmd_num < 0.5:
-		# 	change_until_devisable = new_aud_speed_cmd_num
-		# 	aud_speed_cmd = ''
-		# 	while change_until_devisable < 0.5:
-		# 		aud_speed_cmd = aud_speed_cmd + '0.5'
-		# 		change_until_devisable += 2.5
-		# 	if change_until_devisable != 0:
-		# 		aud_speed_cmd = aud_speed_cmd + str(new_aud_speed_cmd_num)
-		# else:
-		# 	aud_speed_cmd = aud_speed_cmd + str(new_aud_speed_cmd_num)
-
-		aud_speed_cmd = f'atempo={playback_speed}'
+		# atempo only accepts 0.5-2.0 so chain multiple atempo filters for speeds outside that range.
+		aud_speed_cmd = FileOperations._atempo_chain(playback_speed)
 		vid_speed_cmd = f'setpts={1 / playback_speed}*PTS'
 
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map_chapters', '-1', '-map_metadata', '0', '-filter_complex']
@@ -531,8 +839,9 @@ class FileOperations(VerifyInputType):
 			ffmpeg_cmd += ('-map', '[a]')
 		ffmpeg_cmd.append(self.standard_out_path)
 
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err, self.print_ren_info,
-			   self.print_ren_time, self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+		ren_result = Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		                    self.print_ren_info, self.print_ren_time, self.open_after_ren, tmpfs_dir=self.tmpfs_dir
+		                    ).check_depend_then_ren_and_embed_original_metadata(artwork=True)
 		# Rename the output to have the new speed on the end.
 		# Rename it here became the original output loses artwork,
 		# and the above method extracts artwork with the same basename as the input, so it couldn't match that artwork
@@ -540,16 +849,16 @@ class FileOperations(VerifyInputType):
 		# (e.g., it can't match "filename.jpg" with "filename-2x.mp3" so rename it afterwards.)
 		if add_speed_to_basename is True:
 			if self.standard_out_path.exists():
-				out_path = paths.Path().joinpath(self.standard_out_path.parent, self.standard_out_path.stem +
-				                                 f'-{playback_speed}x' + self.standard_out_path.suffix)
+				out_path = self.out_dir / (self.in_stem + f'-{playback_speed}x' + self.in_suffix)
 				self.standard_out_path.rename(out_path)
+		return ren_result
 
 	def reverse(self):
 		"""This method will change the output to play backwards (even with multiple audio streams).
 		NOTE: This automatically removes subtitles and chapters."""
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-map', '-0:s']
 
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_type_set()
 		input_has_video = 'Video' in strm_types
 		input_has_aud = 'Audio' in strm_types
 		input_has_art = 'Artwork' in strm_types
@@ -567,57 +876,85 @@ class FileOperations(VerifyInputType):
 			ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
 
 		ffmpeg_cmd.append(self.standard_out_path)
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 			   self.print_err, self.print_ren_info, self.print_ren_time,
-			   False).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+			   False, pool=self.pool,
+			   tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
 
-	def extract_frames(self, new_out_dir=False):
-		"""This method will export every frame in the input video into its own image in an accessending order."""
+	def extract_frames(self, new_out_dir=False, segments=1):
+		"""This method will export every frame in the input video into its own image in an accessending order.\n
+		segments is how many ffmpeg processes extract separate parts of the input at the same time (the default 1
+		extracts everything with one process.) 0 uses half the CPU cores for constant frame rate inputs
+		(at least 5 seconds per part), otherwise 1. The threads (max_threads or every core) are split between the parts."""
 
 		if new_out_dir is not False and type(new_out_dir) is not paths.PosixPath\
 			and type(new_out_dir) is not paths.WindowsPath:
 			print(f'Error, new_out_dir can only be a pathlib Path or a False, not {type(new_out_dir)} "{new_out_dir}"')
 			return False
+		self.is_type_or_print_err_and_quit(segments, int, 'segments')
 
 		if self.open_after_ren is True:
 			print(f"Error, self.open_after_ren can't be True when extracting the frames from a video.")
 		
 		# Confirm input has a video stream and if so export each frame as an image.
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_type_set()
 		vid_exists = 'Video' in strm_types
 		if vid_exists is False:
 			print(f'''\nError, there's no video stream to extract frames from for input:\n"{self.in_path}"\n''')
 		else:
 			if new_out_dir is False:
-				out_path_frame_num = paths.Path.joinpath(self.out_dir, f'{self.in_path.stem}-%1d.jpg')
+				out_path_frame_num = self.out_dir / f'{self.in_stem}-%1d.jpg'
 			else:
-				out_path_frame_num = paths.Path.joinpath(new_out_dir, f'{self.in_path.stem}-%1d.jpg')
-
-			ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-q:v', '1', out_path_frame_num]
+				out_path_frame_num = new_out_dir / f'{self.in_stem}-%1d.jpg'
 
+			# Thread the decoder as well as the JPEG encoder, skip decoding audio/subtitles,
+			# and write every decoded frame once (passthrough doesn't duplicate or drop frames to match a frame rate.)
+			frame_segments = self._frame_segments(segments)
+			if frame_segments == []:
+				threads = str(self.max_threads)
+			else:
+				# Split the threads between the parts so they don't each try to use every core.
+				threads = str(max(1, (self.max_threads or os.cpu_count() or 1) // len(frame_segments)))
+			frame_cmd = ['-i', self.in_path, '-an', '-sn', '-q:v', '1', '-threads', threads, '-vsync', 'passthrough']
+			
+			# Each part seeks to its first frame, extracts its number of frames,
+			# and numbers the images from where the previous part stopped.
+			ffmpeg_cmd_list = []
+			for start_sec, num_frames, start_number in frame_segments:
+				ffmpeg_cmd_list.append(['ffmpeg', '-threads', threads, '-ss', str(start_sec), *frame_cmd,
+				                        '-frames:v', str(num_frames), '-start_number', str(start_number),
+				                        out_path_frame_num])
+			if ffmpeg_cmd_list == []:
+				ffmpeg_cmd_list.append(['ffmpeg', '-threads', threads, *frame_cmd, out_path_frame_num])
+			
 			# Don't open after rendering (it doesn't have the path to the new images)
 			# and don't print the standard success message; use a custom one instead.
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd,
-				   False, self.print_err, self.print_ren_info,
-				   self.print_ren_time, False).check_depend_then_ren(append_faststart=False)
-			if self.print_success is True:
+			def ren_frames(ffmpeg_cmd):
+				return Render(self.in_path, self.standard_out_path, ffmpeg_cmd,
+				              False, self.print_err, self.print_ren_info,
+				              self.print_ren_time, False).check_depend_then_ren(append_faststart=False)
+			if len(ffmpeg_cmd_list) > 1:
+				with ThreadPoolExecutor(max_workers=len(ffmpeg_cmd_list)) as executor:
+					ren_results = list(executor.map(ren_frames, ffmpeg_cmd_list))
+			else:
+				ren_results = [ren_frames(ffmpeg_cmd_list[0])]
+			if self.print_success is True and all(ren_results):
 				print(f'All of the frames from input:\n"{self.in_path}" have rendered successfully!')
 	
+	@validate_types(in_aud_path_list=list, shortest=bool)
 	def change_vid_aud(self, in_aud_path_list, shortest=True):
 		"""This method replaces the audio for the input video.\n
 		in_aud_path_list needs to be a list containing pathlib paths to every audio track to add to the output.\n
 		shortest sets the length of the output video to the length of the shortest input.\n
 		If omitted/set to False then the length of the output will be the length of the longest input."""
 		
-		self.is_type_or_print_err_and_quit(type(in_aud_path_list), list, 'in_aud_path')
 		for aud_path in in_aud_path_list:
-			self.is_type_or_print_err_and_quit(type(aud_path), paths.Path, 'aud_path')
-		self.is_type_or_print_err_and_quit(type(shortest), bool, 'shortest')
+			self.is_type_or_print_err_and_quit(aud_path, paths.Path, 'aud_path')
 
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-map', '-0:a']
 		
 		# This doesn't work if the input has artwork so remove it for this output (it will be added again after this).
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_type_set()
 		has_art_stream = 'Artwork' in strm_types
 		has_vid_stream = 'Video' in strm_types
 		if has_vid_stream is False:
@@ -636,10 +973,12 @@ class FileOperations(VerifyInputType):
 
 		if shortest is True:
 			ffmpeg_cmd.append('-shortest')
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				self.print_err, self.print_ren_info, self.print_ren_time,
-				self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True, copy_chapters=True)
+				self.open_after_ren, pool=self.pool,
+				tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True, copy_chapters=True)
 
+	@validate_types(in_aud_path_list=list, codec_copy=bool, length_vid=bool)
 	def add_aud_stream_to_vid(self, in_aud_path_list, codec_copy=False, length_vid=True):
 		"""This method adds audio stream(s) to the input video.\n
 		in_aud_path_list must be a list with the paths to the different audio tracks to add to the output video.
@@ -653,67 +992,66 @@ class FileOperations(VerifyInputType):
 		# Future reader, multiple audio channels from the input could be retained by running
 		# MetadataAcquisition().return_stream_types() and specifying to copy over every audio stream individually.
 		
-		self.is_type_or_print_err_and_quit(type(in_aud_path_list), list, 'in_aud_path_list')
 		for aud_path in in_aud_path_list:
-			self.is_type_or_print_err_and_quit(type(aud_path), paths.Path, 'aud_path')
-		self.is_type_or_print_err_and_quit(type(codec_copy), bool, 'codec_copy')
-		self.is_type_or_print_err_and_quit(type(length_vid), bool, 'length_vid')
+			self.is_type_or_print_err_and_quit(aud_path, paths.Path, 'aud_path')
 
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path]
 
-		num_valid_in_aud = 0
-		# Sort input audio paths and add an ffmpeg input for each audio input path.
-		in_aud_path_list.sort()
+		# Sort a copy of the input audio paths (so the caller's list isn't changed) to add an ffmpeg input for each.
+		sorted_aud_paths = tuple(sorted(in_aud_path_list))
 		
 		# Confirm the input has a video stream.
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_types()
 		has_vid_stream = strm_types is None or 'Video' in strm_types
 		if has_vid_stream is False:
 			if self.print_err is True:
 				print(f'Error, no video stream to keep found from input:\n{self.in_path}')
 			return False
 		
-		# Confirm each input audio track actually has audio.
-		for aud_path in in_aud_path_list:
-			strm_types = MetadataAcquisition(aud_path).return_stream_types()
-			has_aud_stream = strm_types is None or 'Audio' in strm_types
-			if has_aud_stream is False:
-				if self.print_err is True:
-					print(f'Error, no audio stream to add found from input:\n{aud_path}')
-				return False
-			else:
-				ffmpeg_cmd += ('-i', aud_path)
-				num_valid_in_aud += 1
+		# Confirm each input audio track actually has audio
+		# (scanning the inputs at the same time because each scan is a separate ffprobe process.)
+		MetadataAcquisition.prefetch_probes(sorted_aud_paths)
+		aud_strm_types_list = [_stream_types_of(aud_path) for aud_path in sorted_aud_paths]
+		valid_aud_paths = [aud_path for aud_path, strm_types in zip(sorted_aud_paths, aud_strm_types_list)
+		                   if strm_types is None or 'Audio' in strm_types]
+		if len(valid_aud_paths) != len(sorted_aud_paths):
+			if self.print_err is True:
+				for aud_path in sorted_aud_paths:
+					if aud_path not in valid_aud_paths:
+						print(f'Error, no audio stream to add found from input:\n{aud_path}')
+			return False
+		# Add an ffmpeg input for every valid audio path.
+		num_valid_in_aud = len(valid_aud_paths)
+		ffmpeg_cmd += [in_arg for aud_path in valid_aud_paths for in_arg in ('-i', aud_path)]
 
 		# Copy over any video, audio, and subtitle streams from the original video input and set audio language to
 		# English. https://ffmpeg.org/ffmpeg.html#Stream-specifiers-1
-		ffmpeg_cmd += ['-map', '0', '-c', 'copy', f'-metadata:s', 'language=eng']
+		ffmpeg_cmd.extend(_COPY_ALL_ENG_CMD)
 
 		# Set codec for output audio tracks (to allow for multiple audio tracks) and set the audio language to English.
-		for aud_path_num in range(num_valid_in_aud):
-			# f'-metadata:s:a:{aud_path_num}', 'title=' could be added to the end of this command, but since it can't
-			# account for already existing audio streams and it's only visible in VLC I didn't bother.
-			ffmpeg_cmd += ['-map', f'{aud_path_num + 1}:a', '-c:a', 'aac', f'-metadata:s', 'language=eng']
+		# f'-metadata:s:a:{aud_path_num}', 'title=' could be added to each of these, but since it can't
+		# account for already existing audio streams and it's only visible in VLC I didn't bother.
+		ffmpeg_cmd.extend([map_arg for aud_path_num in range(num_valid_in_aud)
+		                   for map_arg in ('-map', f'{aud_path_num + 1}:a', *_AAC_ENG_CMD)])
 
 		# Trim to the length of the video (in case a separate audio track is longer than the video).
-		if length_vid is True:
-			ffmpeg_cmd += ('-to', f'{MetadataAcquisition(self.in_path).return_metadata(duration=1)[0]}')
+		if length_vid is True and self._get_duration_sec() is not None:
+			ffmpeg_cmd += ('-to', str(self._get_duration_sec()))
 		ffmpeg_cmd.append(self.standard_out_path)
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-			   self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+			   self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
 	
+	@validate_types(custom_db=str, aud_only=bool, print_vol_value=bool)
 	def change_volume(self, custom_db='3 dB', aud_only=False, print_vol_value=True):
 		"""This method will change the volume of the input audio/video with audio.\n
 		custom_db can be set to a string to change the file volume by that amount ('-0.0 dB' or '0.0 dB')\n
 		if print_vol_value is set to True then print the dB number the volume was changed by.\n"""
-		
-		self.is_type_or_print_err_and_quit(type(custom_db), str, 'custom_db')
-		self.is_type_or_print_err_and_quit(type(aud_only), bool, 'aud_only')
-		self.is_type_or_print_err_and_quit(type(print_vol_value), bool, 'print_vol_value')
 
 		# Set the custom_db from the loudnorm_stereo method to change the output volume.
-		FileOperations.loudnorm_stereo(self, custom_db=custom_db, aud_only=aud_only, print_vol_value=print_vol_value)
+		return FileOperations.loudnorm_stereo(self, custom_db=custom_db, aud_only=aud_only,
+		                                      print_vol_value=print_vol_value)
 	
+	@validate_types(custom_db=str, aud_only=bool, print_vol_value=bool, _do_render=bool)
 	def loudnorm_stereo(self, custom_db='', aud_only=False, print_vol_value=True, _do_render=True):
 		"""This method will run the input through a loudness normalization filter.\n
 		custom_db can be set to a string to change the file volume by that amount ('-0.0 dB' or '0.0 dB')\n
@@ -723,12 +1061,6 @@ class FileOperations(VerifyInputType):
 		NOTE: This method only works for one audio track. If the input has multiple audio tracks only one will be output.\n
 		NOTE: This method does not retain all subtitle tracks."""
 		
-		# Confirm input types are valid.
-		self.is_type_or_print_err_and_quit(type(custom_db), str, 'custom_db')
-		self.is_type_or_print_err_and_quit(type(aud_only), bool, 'aud_only')
-		self.is_type_or_print_err_and_quit(type(print_vol_value), bool, 'print_vol_value')
-		self.is_type_or_print_err_and_quit(type(_do_render), bool, '_do_render')
-		
 		if _do_render is False and aud_only is True:
 			print('Error, in order for _do_render to be False aud_only must also be False.')
 			quit()
@@ -737,72 +1069,89 @@ class FileOperations(VerifyInputType):
 			vol_level = custom_db
 			print()
 		else:
-			# Get the max volume for the input.
-			vol_level = MetadataAcquisition(self.in_path, self.print_ren_info, self.print_ren_time,
-			                                print_meta_value=False).return_metadata(max_volume=1)[0]
+			# Get the stream types and max volume for the input in one call
+			# (the volume scan is skipped if there isn't any audio.)
+			bundle = MetadataAcquisition(self.in_path, self.print_ren_info, self.print_ren_time,
+			                             print_meta_value=False).return_bundle(duration=False)
+			if self._stream_types_cache is None:
+				self._stream_types_cache = bundle['stream_types']
+			vol_level = bundle['max_volume']
+		
+		# The metadata value max_volume wasn't found so vol_level is None. Therefore, return False (it didn't work
+		# because the input doesn't have any audio.)
+		if vol_level is None:
+			return False
+		
+		# Split the volume level (e.g. "-3.2 dB") into its sign and amount.
+		db_match = _DB_RE.match(vol_level)
+		if db_match is None:
+			print(f'Error, "{vol_level}" is not a valid decibel amount (such as "-3.0 dB" or "3.0 dB").')
+			return False
+		db_sign = db_match.group(1)
+		db_magnitude = float(db_match.group(2))
+		
+		# A max volume of "-inf dB" means the audio is silent so there isn't a level to normalize to.
+		if math.isinf(db_magnitude):
+			print(f'Error, the volume can\'t be changed by "{vol_level}" for input:\n"{self.in_path}"\n')
+			return False
 		
 		# If the volume is already 0 then quit, otherwise increase the volume to get to 0dB automatically.
-		if vol_level == '0.0 dB' and custom_db == '' or vol_level == '-0.0 dB' and custom_db == '':
+		if db_magnitude == 0 and custom_db == '':
 			# If _do_render is True print an error,
 			# otherwise return None (no command) for the compress_h265_norm_aud method.
 			if _do_render is True:
 				print('Error, the output file was just copied because '
 					  f'the audio is already normalized for input:\n"{self.in_path}"\n')
-				shutil.copy2(self.in_path, self.standard_out_path)
+				FileOperations._fast_clone(self.in_path, self.standard_out_path)
 				return False
 			elif _do_render is False:
 				return None
-		elif custom_db == '0.0 dB' or custom_db == '-0.0 dB':
+		elif db_magnitude == 0:
 			print(f'''Error, setting custom_db to "{custom_db}" won't do anything.''')
 			quit()
 		
-		# The metadata value max_volume wasn't found so vol_level is None. Therefore, return False (it didn't work
-		# because the input doesn't have any audio.)
-		if vol_level is None:
-			return False
+		if custom_db != '':
+			# Change the volume by the custom amount.
+			db_change = -db_magnitude if db_sign == '-' else db_magnitude
+			vol_change_keyword = 'decreased' if db_sign == '-' else 'increased'
+		elif db_sign == '-':
+			# Raise the volume by however far the max volume is below 0 dB.
+			db_change = db_magnitude
+			vol_change_keyword = 'increased'
 		else:
-			if custom_db != '':
-				vol_db_change = 'volume=' + vol_level
-				if custom_db[0] == '-':
-					vol_change_keyword = 'decreased'
-				else:
-					vol_change_keyword = 'increased'
-			elif vol_level[0] == '-':
-				vol_change_keyword = 'increased'
-				vol_db_change = 'volume=' + vol_level[1:]
-			else:
-				print(f'Error, unable to find suitable output decibel amount for volume level "{vol_level}" '
-				      f'with custom dB "{custom_db}".')
-				quit()
-			
-			# String of decibel amount to raise by.
-			if vol_level[0] == '-':
-				db_amount = vol_level[1:]
-			else:
-				db_amount = vol_level
-			
-			# Boolean to allow for retrieving the dB info without rendering for the compress_h265_norm_aud method.
-			if _do_render is False:
-				if print_vol_value is True:
-					print(f'The volume was {vol_change_keyword} by {db_amount}')
-				return ['-af', vol_db_change, '-ac', '2']
-			
-			# Set the output extension to out_ext or default (.mp3) and render.
-			elif aud_only is True:
-				out_path = self.standard_out_path.with_suffix('.mp3')
-				ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-vn', '-sn', '-af', vol_db_change, '-ac', '2', out_path]
-			else:
-				out_path = self.standard_out_path
-				ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-af', vol_db_change, '-ac', '2',
-				              '-c:v', 'copy', '-c:s', 'copy', '-map_metadata', '0', self.standard_out_path]
-			
-			if _do_render is True:
-				ren_result = Render(self.in_path, out_path, ffmpeg_cmd, self.print_success, self.print_err,
-									self.print_ren_info, self.print_ren_time,
-									self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True)
-				if print_vol_value is True and ren_result is True:
-					print(f'The volume was {vol_change_keyword} by {db_amount}\n')
+			print(f'Error, unable to find suitable output decibel amount for volume level "{vol_level}" '
+			      f'with custom dB "{custom_db}".')
+			quit()
+		vol_db_change = f'volume={db_change}dB'
+		# String of decibel amount to raise/lower by.
+		db_amount = f'{db_magnitude} dB'
+		
+		# Boolean to allow for retrieving the dB info without rendering for the compress_h265_norm_aud method.
+		if _do_render is False:
+			if print_vol_value is True:
+				print(f'The volume was {vol_change_keyword} by {db_amount}')
+			return ['-af', vol_db_change, '-ac', '2']
+		
+		# Set the output extension to out_ext or default (.mp3) and render.
+		elif aud_only is True:
+			out_path = self.standard_out_path.with_suffix('.mp3')
+			ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-vn', '-sn', '-af', vol_db_change, '-ac', '2', out_path]
+		else:
+			out_path = self.standard_out_path
+			ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-af', vol_db_change, '-ac', '2',
+			              '-c:v', 'copy', '-c:s', 'copy', '-map_metadata', '0', self.standard_out_path]
+		
+		if _do_render is True:
+			ren_result = Render(self.in_path, out_path, ffmpeg_cmd, self.print_success, self.print_err,
+								self.print_ren_info, self.print_ren_time,
+								self.open_after_ren,
+								tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+			if print_vol_value is True and ren_result is True:
+				print(f'The volume was {vol_change_keyword} by {db_amount}\n')
+			return ren_result
 	
+	@validate_types(gausssize=int, framelen_ms=int, maxgain=float, targetrms=float, compress=float, threshold=float,
+	                out_aud_ext=str)
 	def dynaudnorm(self, gausssize=31, framelen_ms=500, maxgain=10.0, targetrms=0.0, compress=0.0, threshold=0.0, out_aud_ext=''):
 		"""This method dynamically normalizes the volume of the input
 		See https://ffmpeg.org/ffmpeg-all.html#toc-dynaudnorm for more info
@@ -817,15 +1166,6 @@ class FileOperations(VerifyInputType):
 			out_aud_ext (str, optional): Allows you to specify what the output extension should be instead of the current extension.
 		"""
 		
-		# Confirm all the inputs are the correct types.
-		self.is_type_or_print_err_and_quit(type(gausssize), int, 'gausssize')
-		self.is_type_or_print_err_and_quit(type(framelen_ms), int, 'framelen_ms')
-		self.is_type_or_print_err_and_quit(type(maxgain), float, 'maxgain')
-		self.is_type_or_print_err_and_quit(type(targetrms), float, 'targetrms')
-		self.is_type_or_print_err_and_quit(type(compress), float, 'compress')
-		self.is_type_or_print_err_and_quit(type(threshold), float, 'threshold')
-		self.is_type_or_print_err_and_quit(type(out_aud_ext), str, 'out_aud_ext')
-
 		# Remove all metadata for this output because for some reason it can cause weird bugs when trying to convert
 		# the file afterwards and '-tag:v', 'hvc1' tells macs that it can play the output video file.
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-af', f'dynaudnorm=g={gausssize}:f={framelen_ms}:m={maxgain}:r={targetrms}:s={compress}:t={threshold}']
@@ -835,14 +1175,16 @@ class FileOperations(VerifyInputType):
 			out_ext = self.in_path.suffix
 		else:
 			out_ext = out_aud_ext
-		out_path = paths.Path().joinpath(self.out_dir, self.in_path.stem + out_ext)
+		out_path = self.out_dir / (self.in_stem + out_ext)
 		# # Append the output path.
 		ffmpeg_cmd.append(out_path)
 
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				self.print_err, self.print_ren_info, self.print_ren_time,
-				self.open_after_ren).check_depend_then_ren()
+				self.open_after_ren, pool=self.pool).check_depend_then_ren()
 
+	@validate_types(peak=float, expansion=float, compression=float, threshold=float, raise_by=float, fall=float,
+	                out_aud_ext=str)
 	def speechnorm(self, peak=0.95, expansion=2.0, compression=2.0, threshold=0.0, raise_by=0.001, fall=0.001, out_aud_ext=''):
 		"""This method dynamically normalizes the volume of the input specifically designed for voices
 		See https://ffmpeg.org/ffmpeg-filters.html#toc-speechnorm for more info
@@ -857,15 +1199,6 @@ class FileOperations(VerifyInputType):
 			out_aud_ext (str, optional): Allows you to specify what the output extension should be instead of the current extension.
 		"""
 		
-		# Confirm all the inputs are the correct types.
-		self.is_type_or_print_err_and_quit(type(peak), float, 'peak')
-		self.is_type_or_print_err_and_quit(type(expansion), float, 'expansion')
-		self.is_type_or_print_err_and_quit(type(compression), float, 'compression')
-		self.is_type_or_print_err_and_quit(type(threshold), float, 'threshold')
-		self.is_type_or_print_err_and_quit(type(raise_by), float, 'raise_by')
-		self.is_type_or_print_err_and_quit(type(fall), float, 'fall')
-		self.is_type_or_print_err_and_quit(type(out_aud_ext), str, 'out_aud_ext')
-
 		# Remove all metadata for this output because for some reason it can cause weird bugs when trying to convert
 		# the file afterwards and '-tag:v', 'hvc1' tells macs that it can play the output video file.
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-af', f'speechnorm=p={peak}:e={expansion}:c={compression}:t={threshold}:r={raise_by}:f={fall}']
@@ -875,23 +1208,21 @@ class FileOperations(VerifyInputType):
 			out_ext = self.in_path.suffix
 		else:
 			out_ext = out_aud_ext
-		out_path = paths.Path().joinpath(self.out_dir, self.in_path.stem + out_ext)
+		out_path = self.out_dir / (self.in_stem + out_ext)
 		# # Append the output path.
 		ffmpeg_cmd.append(out_path)
 
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				self.print_err, self.print_ren_info, self.print_ren_time,
-				self.open_after_ren).check_depend_then_ren()
+				self.open_after_ren, pool=self.pool).check_depend_then_ren()
 	
+	@validate_types(out_aud_ext=str, order_out_names=bool)
 	def extract_audio(self, out_aud_ext='', order_out_names=True):
 		"""This method extracts audio track(s) from the input.\n
 		This is primarily intended for use with video files that have multiple audio tracks
 		because otherwise you can just use the change_ext method.
 		out_aud_ext allows you to specify what the output extension should be.
 		order_out_names will append "-Audio Track {number}" to the output basename(s)"""
-		
-		self.is_type_or_print_err_and_quit(type(out_aud_ext), str, 'out_aud_ext')
-		self.is_type_or_print_err_and_quit(type(order_out_names), bool, 'order_out_names')
 
 		# Option to change the extension for the output audio.
 		if out_aud_ext == '':
@@ -902,7 +1233,7 @@ class FileOperations(VerifyInputType):
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path]
 
 		# Determine what the artwork index may be and get stream types.
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_types()
 		art_exists = 'Artwork' in strm_types
 
 		# There are no audio streams in the input file to extract so return False.
@@ -918,39 +1249,66 @@ class FileOperations(VerifyInputType):
 		else:
 			art_strm_index = '0'
 		
+		# Only embed input artwork if it exists and the output extension is ".mp3" (the same for every output.)
+		if art_exists is True and out_ext == '.mp3':
+			art_map_cmd = ('-map', f'0:v:{art_strm_index}')
+		else:
+			art_map_cmd = ()
+		
 		# Empty list that will have the audio output paths appended to it enabling it to print a success message.
 		out_paths_list = []
 		for strm_index, strm in enumerate(strm_types):
 			# Map the output if it's an audio stream.
 			if strm == 'Audio':
-				ffmpeg_cmd += ('-map', f'0:{strm_index}')
-				# Only embed input artwork if it exists and the output extension is ".mp3"
-				if art_exists is True and out_ext == '.mp3':
-					ffmpeg_cmd += ('-map', f'0:v:{art_strm_index}')
 				if order_out_names is True:
-					out_path = paths.Path().joinpath(self.out_dir, self.in_path.stem
-					                                 + f'-Audio Track {strm_index + 1}' + out_ext)
+					out_path = self.out_dir / f'{self.in_stem}-Audio Track {strm_index + 1}{out_ext}'
 				else:
-					out_path = paths.Path().joinpath(self.out_dir, self.in_path.stem + out_ext)
-				ffmpeg_cmd.append(out_path)
+					out_path = self.out_dir / (self.in_stem + out_ext)
+				ffmpeg_cmd.extend(('-map', f'0:{strm_index}', *art_map_cmd, out_path))
 				out_paths_list.append(out_path)
 			
-		Render(self.in_path, out_paths_list, ffmpeg_cmd, self.print_success, self.print_err,
-		       self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return Render(self.in_path, out_paths_list, ffmpeg_cmd, self.print_success, self.print_err,
+		       self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
 	
 	def rm_begin_end_silence(self):
-		"""This method will remove the silence from the beginning and end of audio tracks.
+		"""This method will remove the silence from the beginning and end of audio tracks.\n
+		The input is scanned for silence once and then the codecs are copied between the end of the beginning silence
+		and the start of the ending silence (so video is cut at the closest keyframes.)
 		NOTE: This method will remove any already existing subtitles and chapters."""
-		ffmpeg_cmd = ['ffmpeg', '-i',
-		              self.in_path, '-map', '0', '-c:v', 'copy', '-map_chapters', '-1', '-map', '-0:s', '-af',
-		              'silenceremove=start_periods=1:start_duration=0:start_threshold=-60dB:detection=peak'
-		              ',aformat=dblp,areverse,silenceremove=start_periods=1:start_duration=0:'
-		              'start_threshold=-60dB:detection=peak,aformat=dblp,areverse', self.standard_out_path]
 		
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+		silence_list = MetadataAcquisition(self.in_path, self.print_ren_info,
+		                                   self.print_ren_time).return_silence(noise='-60dB')
+		total_length_sec = self._get_duration_sec()
+		if total_length_sec is None:
+			return False
+		
+		# Silence that's within 10 milliseconds of the beginning/end counts as starting/ending there.
+		start_sec = 0.0
+		stop_sec = total_length_sec
+		if silence_list != [] and silence_list[0][0] <= 0.01:
+			start_sec = silence_list[0][1] if silence_list[0][1] is not None else total_length_sec
+		if silence_list != [] and (silence_list[-1][1] is None or silence_list[-1][1] >= total_length_sec - 0.01):
+			stop_sec = silence_list[-1][0]
+		
+		if start_sec >= stop_sec:
+			if self.print_err is True:
+				print(f'''Error, the entire input is silent so there's nothing to keep for input:\n"{self.in_path}"\n''')
+			return False
+		elif start_sec == 0.0 and stop_sec == total_length_sec:
+			if self.print_err is True:
+				print(f'Error, no silence to remove was found at the beginning or end of input:\n"{self.in_path}"\n')
+			return False
+		
+		ffmpeg_cmd = ['ffmpeg', '-ss', str(start_sec), '-to', str(stop_sec), '-i', self.in_path, '-map', '0',
+		              '-c', 'copy', '-map_chapters', '-1', '-map', '-0:s', '-avoid_negative_ts', 'make_zero',
+		              self.standard_out_path]
+		
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 			   self.print_err, self.print_ren_info, self.print_ren_time,
-		       self.open_after_ren).check_depend_then_ren_and_embed_original_metadata()
+		       self.open_after_ren, pool=self.pool,
+		       tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata()
 	
+	@validate_types(fade_vid=bool, fade_aud=bool, fade_begin=bool, fade_end=bool, fade_dur_sec=int, fade_out_at_sec=int)
 	def fade_begin_and_or_end__audio_and_or_video(self, fade_vid=True, fade_aud=True, fade_begin=False,
 												  fade_end=True, fade_dur_sec=3, fade_out_at_sec=0):
 		"""This method will fade the input audio from full to 0 dB and fade video to black.\n
@@ -962,13 +1320,6 @@ class FileOperations(VerifyInputType):
 		the automatically computed second to begin fading at the end of the input.
 		e.g., start fading at 1 minute and 9 seconds in = "69", then the rest of the duration would be black/silent."""
 
-		self.is_type_or_print_err_and_quit(type(fade_vid), bool, 'fade_vid')
-		self.is_type_or_print_err_and_quit(type(fade_aud), bool, 'fade_aud')
-		self.is_type_or_print_err_and_quit(type(fade_begin), bool, 'fade_begin')
-		self.is_type_or_print_err_and_quit(type(fade_end), bool, 'fade_end')
-		self.is_type_or_print_err_and_quit(type(fade_dur_sec), int, 'fade_dur_sec')
-		self.is_type_or_print_err_and_quit(type(fade_out_at_sec), int, 'fade_out_at_sec')
-
 		if fade_dur_sec <= 0:
 			print(f'Error, fade_dur_sec has to be greater than 0 seconds, not "{fade_dur_sec}"')
 			quit()
@@ -980,7 +1331,7 @@ class FileOperations(VerifyInputType):
 			quit()
 		else:
 			# Get the duration for the input video and or audio in seconds.
-			total_length_sec = self._return_input_duration_in_sec()
+			total_length_sec = self._get_duration_sec()
 
 			# Either begin ending fade at fade_out_at_sec if it's specified or,
 			# begin ending fade at the automatically calculated time,
@@ -990,90 +1341,45 @@ class FileOperations(VerifyInputType):
 			else:
 				fade_out_sec = total_length_sec - fade_dur_sec
 
-			# Generate the specific ffmpeg commands to fade the beginning and/or ending audio and/or video.
-			# fade_begin_cmd can be used for video or audio
-			# (by adding "a" at the beginning of the audio command if fade_aud is True)
-			# so the video and audio don't need their own specifc command.
-			fade_begin_cmd = f'fade=in:st=0:d={fade_dur_sec}'
-			# Subtract 0.2 seconds from the ending fade start time because otherwise the video doesn't get
-			# all the way to black.
-			fade_end_vid_cmd = f'fade=out:st={fade_out_sec - 0.2}:d={fade_dur_sec}'
-			# Generate the equivalent fade ending audio command.
-			fade_end_aud_cmd = f'afade=out:st={fade_out_sec}:d={fade_dur_sec}'
-			# If fade_begin=True and fade_end=True then they need both parts of the command or,
-			# if fade_out_at_sec is specified then it needs the beginning and ending command.
-			fade_both_vid_cmd = fade_begin_cmd + ',' + fade_end_vid_cmd
-			fade_both_aud_cmd = 'a' + fade_begin_cmd + ',' + fade_end_aud_cmd
+			vid_fade_filter, aud_fade_filter = _fade_filters(fade_begin, fade_end, fade_dur_sec, fade_out_sec,
+			                                                 fade_out_at_sec)
 			# Remove artwork.
 			ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0']
 			ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
 			
-			# Append command to fade video.
+			# Append command to fade video and/or audio.
+			filter_graph = _FilterGraphBuilder()
 			if fade_vid is True:
-				ffmpeg_cmd.append('-vf')
-				# Either fade beginning, end, or both.
-				if fade_begin is True and fade_end is True:
-					ffmpeg_cmd.append(fade_both_vid_cmd)
-				elif fade_begin is True:
-					if fade_out_at_sec != 0:
-						ffmpeg_cmd.append(fade_both_vid_cmd)
-					else:
-						ffmpeg_cmd.append(fade_begin_cmd)
-				elif fade_end is True:
-					ffmpeg_cmd.append(fade_end_vid_cmd)
-
-			# Append command to fade audio.
+				filter_graph.add_vid(vid_fade_filter)
 			if fade_aud is True:
-				ffmpeg_cmd.append('-af')
-				# Either fade beginning, end, or both.
-				if fade_begin is True and fade_end is True:
-					ffmpeg_cmd.append(fade_both_aud_cmd)
-				elif fade_begin is True:
-					if fade_out_at_sec != 0:
-						ffmpeg_cmd.append(fade_both_aud_cmd)
-					else:
-						ffmpeg_cmd.append('a' + fade_begin_cmd)
-				elif fade_end is True:
-					ffmpeg_cmd.append(fade_end_aud_cmd)
+				filter_graph.add_aud(aud_fade_filter)
+			ffmpeg_cmd += filter_graph.to_args()
 
 			# The entire command is there so append the output path.
+			ffmpeg_cmd += self._threads_args(filters=True)
 			ffmpeg_cmd.append(self.standard_out_path)
 			
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd,
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd,
 			       self.print_success, self.print_err, self.print_ren_info, self.print_ren_time,
-			       self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+			       self.open_after_ren, pool=self.pool,
+			       tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
 	
+	@validate_types(pan_strm=list)
 	def pan_audio(self, pan_strm=[]):
 		"""Input list set to R or L and the percentage, and a new item on te list ofr each audio channel.
 		[L100, R100, L75] pan the first audio channel all the way to the left, the second audio channel all the way to
 		the right, and the third channel 75% of the way to the left."""
 
-		self.is_type_or_print_err_and_quit(type(pan_strm), list, 'pan_strm')
-
 		# Confirm input is valid (such as L100).
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, 'pan command']
 		for strm in pan_strm:
-			if type(strm) != str:
+			if isinstance(strm, str) is False or _PAN_RE.fullmatch(strm) is None:
 				if self.print_err is True:
-					print(f'Error, input "{strm}" is not a string.')
-			elif strm[0] != 'L' and strm[0] != 'R':
-				if self.print_err is True:
-					print(f'Error, the first character of the input must be "L" or "R" to specify which '
-						  f'direction to pan the audio, but "{strm[0]}" was received.')
-			else:
-				try:
-					pan_percentage = int(strm[:-1])
-				except:
-					if self.print_err is True:
-						print(f'Error, after specifing which direction to pan (L or R), '
-							  f'the percentage to pan by must be a number between 1-100, not "{strm[:-1]}"')
-				if pan_percentage < 1 or pan_percentage > 100:
-						if self.print_err is True:
-							print(f'Error, the percentage to pan by must be between 1-100, not "{pan_percentage}"')
-				else:
-					ffmpeg_cmd.append()
+					print(f'Error, each pan input must be "L" or "R" (the direction to pan the audio) followed by '
+					      f'the percentage to pan by from 1-100 (such as "L100"), not "{strm}"')
+				return False
 
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_types()
 		has_aud = 'Audio' in strm_types
 		if has_aud is False:
 			if self.print_err is True:
@@ -1085,15 +1391,14 @@ class FileOperations(VerifyInputType):
 					ffmpeg_cmd.append(f'0:{strm_index}')
 		pass
 
+	@validate_types(right_aud_in_path=paths.Path)
 	def two_separate_stereo_aud_files_to_one_stereo_aud_file(self, right_aud_in_path):
 		"""This method will pan the main input stereo audio to the left, and the second stereo input audio to the right for one stereo output.
 		NOTE: The default self.in_path will be used as the input for the left audio channel."""
 
-		self.is_type_or_print_err_and_quit(type(right_aud_in_path), paths.Path, 'right_aud_in_path')
-
-		main_in_strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		main_in_strm_types = self._get_stream_type_set()
 		main_in_has_aud = 'Audio' in main_in_strm_types
-		right_aud_in_strm_types = MetadataAcquisition(right_aud_in_path).return_stream_types()
+		right_aud_in_strm_types = _stream_types_of(right_aud_in_path)
 		right_aud_in_has_aud = 'Audio' in right_aud_in_strm_types
 		if main_in_has_aud is False:
 			if self.print_err is True:
@@ -1106,60 +1411,42 @@ class FileOperations(VerifyInputType):
 		else:
 			ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-i', right_aud_in_path, '-map', '0', '-c', 'copy']
 			# ffmpeg -i input1.wav -i input2.wav -filter_complex "[0:a][1:a]amerge=inputs=2,pan=stereo|c0<c0+c2|c1<c1+c3[a]" -map "[a]" output.mp3
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-				   self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+				   self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
 
+	@validate_types(keep_aspect_ratio_input_width=str, conform_to_dimensions=str)
 	def change_image_resolution(self, keep_aspect_ratio_input_width='', conform_to_dimensions=''):
 		"""This method will change the resolution of an image (which includes file artwork).
 		keep_aspect_ratio_width can only contain one number, but conform_to_dimensions
 		must contain two numbers seperated by a colon\n
 		"1920" vs "1920:1080"."""
 
-		self.is_type_or_print_err_and_quit(type(keep_aspect_ratio_input_width), str, 'scale_dim')
 		if keep_aspect_ratio_input_width != '' and conform_to_dimensions != '':
 			print('Error, keep_aspect_ratio_width and conform_to_dimensions are mutually exclusive but both were specified.')
 			return False
 		elif keep_aspect_ratio_input_width == '' and conform_to_dimensions == '':
 			print('Error, either keep_aspect_ratio_width or conform_to_dimensions must be specified.')
 			return False
-		scale = ''
-		# conform_to_dimensions must 
 		if conform_to_dimensions != '':
-			# Confirm there aren't any characters besides one ":" and the dimension numbers.
-			try:
-				int(conform_to_dimensions.replace(':', ''))
-			except ValueError:
-				print(f'Error, conform_to_dimensions can only contain two numbers separated by a ":", not "{conform_to_dimensions}"')
-				return False
-
-			colon_count = conform_to_dimensions.count(':')
-			if colon_count != 1:
-				print(f'Error, conform_to_dimensions input "{conform_to_dimensions}" must have 1 colon, but {colon_count} were found.')
-				return False
-			# Check if the first characer is a ":" instead of a number like it should be (input=":100").
-			elif conform_to_dimensions[0] == ':':
-				print(f'Error, a number must be specified before the colon for conform_to_dimensions "[HERE]{conform_to_dimensions}"')
+			# Confirm it's two numbers separated by one colon ("1920:1080").
+			if _DIM_RE.fullmatch(conform_to_dimensions) is None:
+				print(f'Error, conform_to_dimensions must be two numbers separated by a ":" (such as "1920:1080"), '
+				      f'not "{conform_to_dimensions}"')
 				return False
-			# Check if the last characer is a ":" instead of a number like it should be (input="100:").
-			elif conform_to_dimensions[-1:] == ':':
-				print(f'Error, a number must be specified after the colon for conform_to_dimensions "{conform_to_dimensions}[HERE]"')
-				return False
-			else:
-				scale = conform_to_dimensions
+			scale = conform_to_dimensions
 		else:
-			# keep_aspect_ratio_width only allows for one number so see if it can be converted to an int.
-			try:
-				int(keep_aspect_ratio_input_width)
-				scale = keep_aspect_ratio_input_width + ':-1'
-			except ValueError:
+			# keep_aspect_ratio_width only allows for one number.
+			if _WIDTH_RE.fullmatch(keep_aspect_ratio_input_width) is None:
 				print(f'Error, keep_aspect_ratio_width can only contain one number, not "{keep_aspect_ratio_input_width}"')
 				return False
+			scale = keep_aspect_ratio_input_width + ':-1'
 		
 		# If there are video, audio, or subtitle streams copy those to the output and change -metadata title value.
-		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-vf', 'scale='+scale, self.standard_out_path]
+		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-vf', 'scale='+scale, *self._threads_args(filters=True),
+		              self.standard_out_path]
 		
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-		       self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		       self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
 	
 	def crop(self, scale_dim):
 		"""Crop"""
@@ -1205,19 +1492,20 @@ class FileOperations(VerifyInputType):
 
 			# Remove any already existing artwork stream.
 			ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
-					
+			
+			ffmpeg_cmd += self._threads_args(filters=True)
 			ffmpeg_cmd.append(self.standard_out_path)
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				   self.print_err, self.print_ren_info, self.print_ren_time,
-			       self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+			       self.open_after_ren, pool=self.pool,
+			       tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
 	
+	@validate_types(rotate_frame_by_degrees=str)
 	def rotate_vid_frame(self, rotate_frame_by_degrees='90'):
 		"""This method rotates the input frame by rotate_by_degrees degrees.\n
 		NOTE: rotate_by_degrees can only be set to 90, 180, or 270, otherwise nothing changes."""
 
-		self.is_type_or_print_err_and_quit(type(rotate_frame_by_degrees), str, 'rotate_by_degrees')
-
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_type_set()
 		has_vid = 'Video' in strm_types
 		if has_vid is False:
 			if self.print_err is True:
@@ -1227,20 +1515,18 @@ class FileOperations(VerifyInputType):
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-metadata:s:v',
 		              f'rotate=-{rotate_frame_by_degrees}', '-c', 'copy', self.standard_out_path]
 
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 			   self.print_err, self.print_ren_info, self.print_ren_time,
-			   self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+			   self.open_after_ren, pool=self.pool,
+			   tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
 
+	@validate_types(rotate_footage_by_degrees=str, hflip=bool, vflip=bool)
 	def rotate_footage(self, rotate_footage_by_degrees='0', hflip=False, vflip=False):
 		"""This method rotates the input video footage by rotate_footage_by_degrees degrees.\n
 		hflip flips the footage horizontally and vflip flips the footage vertically.\n
 		NOTE: This method doesn't preserve video artwork."""
 
-		self.is_type_or_print_err_and_quit(type(rotate_footage_by_degrees), str, 'rotate_footage_by_degrees')
-		self.is_type_or_print_err_and_quit(type(hflip), bool, 'hflip')
-		self.is_type_or_print_err_and_quit(type(vflip), bool, 'vflip')
-
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_type_set()
 		has_vid = 'Video' in strm_types
 		if has_vid is False:
 			if self.print_err is True:
@@ -1250,28 +1536,41 @@ class FileOperations(VerifyInputType):
 			print('Error, at least one rotation value must be specified for the output to change, '
 			      'but all were left with the default values.')
 			return False
+		
+		# Rotating by 180 degrees without flipping keeps the same frame size, so (as long as the input isn't already
+		# rotated by its metadata) it can be done by only setting the display matrix of the first video stream
+		# instead of re-encoding every frame. Only some containers store a display matrix (and newer ffmpeg versions
+		# ignore the old "rotate" metadata tag) so every other container is re-encoded below.
+		if rotate_footage_by_degrees in ('180', '-180') and hflip is False and vflip is False \
+				and self.in_suffix.lower() in _DISPLAY_MATRIX_EXTS and self._has_rotation_metadata() is False:
+			ffmpeg_cmd = ['ffmpeg', '-display_rotation:v:0', '180', '-i', self.in_path, '-map', '0', '-c', 'copy',
+			              self.standard_out_path]
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+			              self.print_err, self.print_ren_info, self.print_ren_time,
+			              self.open_after_ren, pool=self.pool,
+			              tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
 
 		# Start of command and determine to add hflip/vflip keywords or not.
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0']
-		if hflip is True:
-			hflip_cmd = 'hflip,'
-		else:
-			hflip_cmd = ''
-		if vflip is True:
-			vflip_cmd = 'vflip,'
-		else:
-			vflip_cmd = ''
+		filter_graph = _FilterGraphBuilder()
+		# Multiples of 90 degrees only move pixels around (transpose/flip) so the slower rotate filter, which resamples
+		# every pixel, is only used for other angles.
+		rotate_filter = _ORTHOGONAL_ROTATE_FILTERS.get(rotate_footage_by_degrees,
+		                                               f'rotate={rotate_footage_by_degrees}*(PI/180)')
+		filter_graph.add_vid('hflip' if hflip is True else '', 'vflip' if vflip is True else '', rotate_filter)
 
 		# Remove any artwork stream.
 		ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
-		ffmpeg_cmd += ['-vf', hflip_cmd + vflip_cmd + f'rotate={rotate_footage_by_degrees}*(PI/180)',
-		               '-metadata:s:v','rotate=0', '-c:a', 'copy', self.standard_out_path]  
+		ffmpeg_cmd += filter_graph.to_args()
+		ffmpeg_cmd += ['-metadata:s:v','rotate=0', '-c:a', 'copy', self.standard_out_path]
 		
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
-			   self.print_err, self.print_ren_info, self.print_ren_time,
-		       self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+		              self.print_err, self.print_ren_info, self.print_ren_time,
+		              self.open_after_ren, pool=self.pool,
+		              tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
 		
-	def concat(self, new_basename='', new_ext='', codec_copy=True, _loop_times=0):
+	@validate_types(new_basename=str, new_ext=str, codec_copy=bool, hw_accel=str)
+	def concat(self, new_basename='', new_ext='', codec_copy=True, hw_accel='cpu'):
 		"""This method concatenates multiple files together to form one long continuous file.\n
 		WARNING: This method will not work if any of the input files have multiple audio tracks.\n
 		At this point just use the rm_chapters method before running it through this one.\n
@@ -1280,111 +1579,131 @@ class FileOperations(VerifyInputType):
 		NOTE: All input files must have the same streams (same codecs, same time base, etc.)
 			but can be wrapped in different container formats because otherwise it won't work.\n
 		NOTE: This method will remove any already existing chapters because otherwise it won't work.\n
-		_loop_times is local because it's only designed to be used by FileOperations.loop\n
+		If codec_copy is False hw_accel can be "nvenc" to decode and encode (h264_nvenc) on an NVIDIA GPU,
+		"auto" to use the GPU if ffmpeg can encode with NVENC on this computer, or the default "cpu".\n
 		See "https://trac.ffmpeg.org/wiki/Concatenate" for ffmpeg concatenation documentation."""
 		
-		self.is_type_or_print_err_and_quit(type(new_basename), str, 'new_basename')
-		self.is_type_or_print_err_and_quit(type(new_ext), str, 'new_ext')
-		self.is_type_or_print_err_and_quit(type(codec_copy), bool, 'codec_copy')
-		self.is_type_or_print_err_and_quit(type(_loop_times), int, '_loop_times')
+		if hw_accel not in ('auto', 'nvenc', 'cpu'):
+			print(f'Error, hw_accel must be "auto", "nvenc", or "cpu", not "{hw_accel}"')
+			quit()
 		
 		# Set in_path_list to a list of inputs from self.in_path for the sake of code clarity.
 		in_path_list = self.in_path
 		
-		if _loop_times != 0:
-			full_out_path = self.standard_out_path
+		if type(in_path_list) is not list:
+			print(f'Error, for the concat method the in_path must be a list containing the paths of files '
+		    	  f'to concatenate in order (0, is first one, 1 is second, etc.), '
+			      f'not {type(self.in_path)} {self.in_path}')
+		
+		# There were 0 valid input paths so nothing could be concatenated so print an error and quit.
+		if len(in_path_list) == 0:
+			print(f'\nError, at least two files must be provided for the "self.in_path" list in order to append '
+				  f'one file to another, but none were given.\n')
+			return False
+		
+		# Assign first path in list to "path_list_item_0" for the default output path.
+		path_list_item_0 = paths.Path(self.in_path[0])
+		
+		# If new_ext is not the default value of '' assign the value of new_ext to out_ext.
+		if new_ext != '':
+			out_ext = new_ext
+		# new_ext is the default '' so set out_ext to extension of path_list_item_0.
 		else:
-			if type(in_path_list) is not list:
-				print(f'Error, for the concat method the in_path must be a list containing the paths of files '
-			    	  f'to concatenate in order (0, is first one, 1 is second, etc.), '
-				      f'not {type(self.in_path)} {self.in_path}')
-		
-			# There were 0 or 1 valid input paths so nothing could be concatenated so print an error and quit.
-			if len(in_path_list) == 0 or len(in_path_list) == 1:
-				print(f'\nError, at least two files must be provided for the "self.in_path" list in order to append '
-					  f'one file to another, but only \n"', sep='', end='')
-				for input_path in self.in_path:
-					print(str(input_path), sep=',', end='')
-				print('" was given.\n')
-				return False
-			
-			# Assign first path in list to "path_list_item_0" for the default output path.
-			path_list_item_0 = paths.Path(self.in_path[0])
-			
-			# If new_ext is not the default value of '' assign the value of new_ext to out_ext.
-			if new_ext != '':
-				out_ext = new_ext
-			# new_ext is the default '' so set out_ext to extension of path_list_item_0.
-			else:
-				out_ext = path_list_item_0.suffix
-			
-			# If new_basename is not the default value of '' assign the value of new_basename to out_basename.
-			if new_basename != '':
-				out_basename = new_basename
-			else:
-				# new_basename is the default '' so set out_basename to basename (no extension) of path_list_item_0
-				out_basename = path_list_item_0.stem
-			
-			# Path to new file with basename out_basename with extension out_ext in the directory self.out_dir.
-			full_out_path = paths.Path.joinpath(self.out_dir, out_basename + out_ext)
+			out_ext = path_list_item_0.suffix
+		
+		# If new_basename is not the default value of '' assign the value of new_basename to out_basename.
+		if new_basename != '':
+			out_basename = new_basename
+		else:
+			# new_basename is the default '' so set out_basename to basename (no extension) of path_list_item_0
+			out_basename = path_list_item_0.stem
+		
+		# Path to new file with basename out_basename with extension out_ext in the directory self.out_dir.
+		full_out_path = self.out_dir / (out_basename + out_ext)
+
+		# There's only one input so there's nothing to append, but if the output would be an exact copy of it
+		# (same extension and codec_copy) then just clone it instead of running ffmpeg.
+		if len(in_path_list) == 1:
+			if codec_copy is True and out_ext == path_list_item_0.suffix:
+				# The clone doesn't go through Render so check the output doesn't exist (it would be overwritten.)
+				if full_out_path.exists():
+					if self.print_err is True:
+						print(f'Error, target output file, "{full_out_path}" already exists.')
+					return False
+				FileOperations._fast_clone(path_list_item_0, full_out_path)
+				if self.print_success is True:
+					print(f'Success! "{full_out_path}" is a copy of the only input.')
+				return True
+			print(f'\nError, at least two files must be provided for the "self.in_path" list in order to append '
+				  f'one file to another, but only \n"{path_list_item_0}" was given.\n')
+			return False
 
 		# Generate text for a temporary file so ffmpeg can read it to know the locations of the files.
-		paths_str = ''
-		if _loop_times != 0:
-			for index in range(_loop_times):
-				paths_str = paths_str + f"file '{str(self.in_path)}'\n"
-				# Ignore faulty "Unused Variable" error.
-				index = index
+		# (The lines are collected in a list and joined once because adding to a string in the loop copies it every time.)
+		paths_lines = []
+		first_file_ext = in_path_list[0].suffix
+		for in_concat_path in in_path_list:
+			paths_lines.append(f"file '{str(in_concat_path)}'\n")
+			if first_file_ext != in_concat_path.suffix:
+				if codec_copy is True:
+					if self.print_err is True:
+						print(f'Error, in order to concat files and copy the codec all input files must have '
+						      f'the same extension, but extension "{first_file_ext}" and '
+						      f'"{in_concat_path.suffix}" do not match.')
+						return False
+				elif codec_copy is False:
+					if self.print_err is True:
+						print(f'Error, extension "{first_file_ext}" and "{in_concat_path.suffix}" '
+						      f'do not match so the concatenated output may not include every input.')
+		
+		# Formats that can be joined byte for byte (MPEG transport/program streams and ADTS audio) can use
+		# the concat protocol which doesn't need a temporary .txt file.
+		if codec_copy is True and all(in_concat_path.suffix.lower() in _CONCAT_PROTOCOL_EXTS
+		                              for in_concat_path in in_path_list):
+			temp_paths_txt_file = None
+			ffmpeg_cmd = ['ffmpeg', '-i', 'concat:' + '|'.join(map(str, in_path_list)), '-map', '0']
 		else:
-			first_file_ext = in_path_list[0].suffix
-			for in_concat_path in in_path_list:
-				paths_str = paths_str + f"file '{str(in_concat_path)}'\n"
-				if first_file_ext != in_concat_path.suffix:
-					if codec_copy is True:
-						if self.print_err is True:
-							print(f'Error, in order to concat files and copy the codec all input files must have '
-							      f'the same extension, but extension "{first_file_ext}" and '
-							      f'"{in_concat_path.suffix}" do not match.')
-							return False
-					elif codec_copy is False:
-						if self.print_err is True:
-							print(f'Error, extension "{first_file_ext}" and "{in_concat_path.suffix}" '
-							      f'do not match so the concatenated output may not include every input.')
-		
-		# Create temporary .txt file with the paths to the input files in order from top to bottom.
-		temp_paths_txt_file = full_out_path.with_name('temp_paths_txt_file_for_' + full_out_path.stem + '.txt')
-		temp_paths_txt_file.touch()
-		# Write the paths string to the file.
-		temp_paths_txt_file.write_text(paths_str)
-
-		ffmpeg_cmd = ['ffmpeg', '-f', 'concat', '-safe', '0', '-i', temp_paths_txt_file, '-map', '0']
+			# Create temporary .txt file with the paths to the input files in order from top to bottom.
+			temp_paths_txt_file = full_out_path.with_name('temp_paths_txt_file_for_' + full_out_path.stem + '.txt')
+			# Write the paths to the file (opening it in "w" mode creates it.)
+			with temp_paths_txt_file.open('w') as paths_txt_file:
+				paths_txt_file.write(''.join(paths_lines))
+			ffmpeg_cmd = ['ffmpeg', '-f', 'concat', '-safe', '0', '-i', temp_paths_txt_file, '-map', '0']
 
 		# Copy input codec by default, but otherwise omit those keywords.
 		if codec_copy is True:
 			ffmpeg_cmd += ('-c', 'copy')
 		else:
+			# Decode the inputs on the GPU and keep the frames there for the NVENC encoder.
+			if hw_accel == 'nvenc' or hw_accel == 'auto' and _nvenc_available() is True:
+				ffmpeg_cmd[1:1] = ('-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda')
+				ffmpeg_cmd += ('-c:v', 'h264_nvenc')
 			# If the input has artwork remove it because otherwise it may not render properly.
 			ffmpeg_cmd += ('-map_metadata', '-1')
 			ffmpeg_cmd = FileOperations(self.in_path[0], self.out_dir, self.print_success,
 										self.print_err, self.print_ren_info,
 										self.print_ren_time)._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
 		
-		if _loop_times != 0:
-			# Determine if the input has an artwork stream or not.
-			ffmpeg_cmd = self._add_to_ren_cmd__rm_art_stream_index_selector(ffmpeg_cmd)
 		ffmpeg_cmd.append(full_out_path)
 		
-		ren_result = Render(in_path_list, full_out_path, ffmpeg_cmd, self.print_success,
-			   				self.print_err, self.print_ren_info, self.print_ren_time,
-		       				self.open_after_ren).check_depend_then_ren_and_embed_original_metadata(artwork=True)
-		# Delete the temporary file
-		temp_paths_txt_file.unlink()
+		try:
+			ren_result = Render(in_path_list, full_out_path, ffmpeg_cmd, self.print_success,
+				   				self.print_err, self.print_ren_info, self.print_ren_time,
+			       				self.open_after_ren,
+			       				tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata(artwork=True)
+		finally:
+			# Delete the temporary file (even if the render failed.)
+			if temp_paths_txt_file is not None and temp_paths_txt_file.exists():
+				temp_paths_txt_file.unlink()
 		return ren_result
 	
+	@validate_types(new_res_dimensions=str, insert_pixel_format=bool, video_only=bool, custom_db=str,
+	                print_vol_value=bool, maintain_multiple_aud_strms=bool, speed_preset=str, maintain_metadata=bool,
+	                hw_accel=str)
 	def compress_using_h265_and_norm_aud(self, new_res_dimensions='0000:0000',
 										 insert_pixel_format=False, video_only=False, custom_db='',
 										 print_vol_value=True, maintain_multiple_aud_strms=True,
-										 speed_preset='', maintain_metadata=True):
+										 speed_preset='', maintain_metadata=True, hw_accel='cpu'):
 		"""This method compresses the input video using the H.265 (HEVC) codec.
 		See https://trac.ffmpeg.org/wiki/Encode/H.265 for more info
 
@@ -1410,21 +1729,20 @@ class FileOperations(VerifyInputType):
 				Be default metadata is copied from the input file to the output file but this can cause problems
 				sometimes depending on the codec so add the option to not keep the input metadata.
 				Defaults to ''.
+			hw_accel (str, optional): "nvenc" decodes/encodes on an NVIDIA GPU (hevc_nvenc), "cpu" uses libx265 and
+				"auto" uses the GPU if ffmpeg can encode with hevc_nvenc on this computer, otherwise libx265.
+				speed_preset is only used on the GPU if it's an NVENC preset (p1-p7). Defaults to 'cpu'
+				(the GPU encoder produces different output so it has to be chosen.)
 
 		Returns:
 			True: It was successful.
 			False: Received invalid input file extension.
 		"""
 		
-		# Confirm all the inputs are the correct types.
-		self.is_type_or_print_err_and_quit(type(new_res_dimensions), str, 'new_res_dimensions')
-		self.is_type_or_print_err_and_quit(type(insert_pixel_format), bool, 'insert_pixel_format')
-		self.is_type_or_print_err_and_quit(type(video_only), bool, 'video_only')
-		self.is_type_or_print_err_and_quit(type(custom_db), str, 'custom_db')
-		self.is_type_or_print_err_and_quit(type(print_vol_value), bool, 'print_vol_value')
-		self.is_type_or_print_err_and_quit(type(maintain_multiple_aud_strms), bool, 'maintain_multiple_aud_strms')
-		self.is_type_or_print_err_and_quit(type(speed_preset), str, 'speed_preset')
-		self.is_type_or_print_err_and_quit(type(maintain_metadata), bool, 'maintain_metadata')
+		if hw_accel not in ('auto', 'nvenc', 'cpu'):
+			print(f'Error, hw_accel must be "auto", "nvenc", or "cpu", not "{hw_accel}"')
+			quit()
+		use_nvenc = hw_accel == 'nvenc' or hw_accel == 'auto' and _nvenc_available() is True
 
 		# The input file extension is referenced multiple times so give it a variable.
 		in_ext = self.in_path.suffix
@@ -1442,13 +1760,27 @@ class FileOperations(VerifyInputType):
 
 		# Remove all metadata for this output because for some reason it can cause weird bugs when trying to convert
 		# the file afterwards and '-tag:v', 'hvc1' tells macs that it can play the output video file.
-		ffmpeg_cmd = ['ffmpeg', '-ss', '0:0', '-i', self.in_path, '-map_metadata', '-1', '-map', '0:v', '-c:s', 'copy',
-					  '-c:v', 'libx265', '-preset', speed, '-crf', '20', '-tag:v', 'hvc1']
+		if use_nvenc is True:
+			# Decode on the GPU and keep the frames there for the encoder (and scale_cuda) unless the pixel format has
+			# to be changed, in which case the decoded frames come back to system memory.
+			frames_on_gpu = insert_pixel_format is False
+			ffmpeg_cmd = ['ffmpeg', '-hwaccel', 'cuda']
+			if frames_on_gpu is True:
+				ffmpeg_cmd += ('-hwaccel_output_format', 'cuda')
+			if speed_preset not in ('p1', 'p2', 'p3', 'p4', 'p5', 'p6', 'p7'):
+				speed = 'p5'
+			ffmpeg_cmd += ['-ss', '0:0', '-i', self.in_path, '-map_metadata', '-1', '-map', '0:v', '-c:s', 'copy',
+			               '-c:v', 'hevc_nvenc', '-preset', speed, '-rc', 'vbr', '-cq', '22', '-tag:v', 'hvc1']
+		else:
+			frames_on_gpu = False
+			ffmpeg_cmd = ['ffmpeg', '-ss', '0:0', '-i', self.in_path, '-map_metadata', '-1', '-map', '0:v', '-c:s', 'copy',
+						  '-c:v', 'libx265', '-preset', speed, '-crf', '20', '-tag:v', 'hvc1']
 		
 		# * Add '-pix_fmt', 'yuv420p' in case the input video is prores or some other weird encoder.
 		if insert_pixel_format is True:
 			ffmpeg_cmd += ('-pix_fmt', 'yuv420p')
 
+		filter_graph = _FilterGraphBuilder()
 		if video_only is True:
 			ffmpeg_cmd.append('-an')
 		else:
@@ -1464,66 +1796,79 @@ class FileOperations(VerifyInputType):
 			audio_cmd = FileOperations.loudnorm_stereo(self, _do_render=False, print_vol_value=print_vol_value,
 			                                           custom_db=custom_db)
 			if audio_cmd is not None and audio_cmd is not False:
-				ffmpeg_cmd += audio_cmd
+				# audio_cmd is ['-af', volume_filter, '-ac', '2'] so only the filter goes in the filter graph.
+				filter_graph.add_aud(audio_cmd[1])
+				ffmpeg_cmd += audio_cmd[2:]
 		
 		# If a new resolution was specified then append that to ren_cmd.
 		if new_res_dimensions != '0000:0000':
-			ffmpeg_cmd += ('-vf', 'scale=' + new_res_dimensions)
+			if frames_on_gpu is True:
+				filter_graph.add_vid('scale_cuda=' + new_res_dimensions)
+			else:
+				filter_graph.add_vid('scale=' + new_res_dimensions)
+		ffmpeg_cmd += filter_graph.to_args()
 		
 		# Append the output path.
 		ffmpeg_cmd.append(self.standard_out_path)
 		
 		if maintain_metadata is True:
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				   self.print_err, self.print_ren_info, self.print_ren_time,
-				   self.open_after_ren).check_depend_then_ren_and_embed_original_metadata()
+				   self.open_after_ren, pool=self.pool,
+				   tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata()
 		else:
-			Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
+			return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success,
 				   self.print_err, self.print_ren_info, self.print_ren_time,
-				   self.open_after_ren).check_depend_then_ren()
-
-		return True
+				   self.open_after_ren, pool=self.pool).check_depend_then_ren()
 
+	@validate_types(in_subs_list=list)
 	def embed_subs(self, in_subs_list):
 		"""This method will embed the input subtitle file(s) into the output.\n
 		in_subs_list must be a list of pathlib paths to the subtitle files to embed."""
-		self.is_type_or_print_err_and_quit(type(in_subs_list), list, 'in_subs_list')
 		# temp_sub_dir = paths.Path.joinpath(self.out_paths_list, 'temp_directory_to_embed_subtitle_files.')
 		# paths.Path.mkdir(temp_sub_dir)
 		#
 		# in_sub_dir = paths.Path(in_sub_dir)
 		
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path]
+		# Only the subtitle files that are added as inputs get mapped so the input indexes line up.
+		valid_sub_files = []
 		for sub_file in in_subs_list:
 			if sub_file.suffix != '.vtt':
 				if self.print_err is True:
 					print(f'Error, the input "{sub_file}" is not a subtitle file so it will be omitted.')
 			else:
 				ffmpeg_cmd += ('-i', sub_file)
+				valid_sub_files.append(sub_file)
 		ffmpeg_cmd += ('-map', '0')
-		for sub_file_index, sub_file in enumerate(in_subs_list):
+		# The subtitle language only depends on the file name (no file is scanned) so it's looked up once per file.
+		for sub_file_index, sub_file in enumerate(valid_sub_files):
 			ffmpeg_cmd += ('-map', f'{sub_file_index + 1}:0', f'-metadata:s:s:{sub_file_index}',
 						   f'language={MetadataAcquisition(sub_file)._return_sub_lang()}')
 			# -metadata:s:s:0 language=eng
 			# ffmpeg -i input.mp4 -f srt -i input.srt -i input2.srt\ -map 0:0 -map 0:1 -map 1:0 -map 2:0
 		# -c:v copy -c:a copy \ -c:s srt -c:s srt output.mkv
 		ffmpeg_cmd += ('-c', 'copy', '-c:s', 'mov_text', self.standard_out_path)
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd,
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd,
 			   self.print_success, self.print_err, self.print_ren_info,
-			   self.print_ren_time, self.open_after_ren).check_depend_then_ren_and_embed_original_metadata()
+			   self.print_ren_time, self.open_after_ren, pool=self.pool,
+			   tmpfs_dir=self.tmpfs_dir).check_depend_then_ren_and_embed_original_metadata()
 	
+	@validate_types(include_other_metadata=bool)
 	def extract_subs(self, include_other_metadata=False):
 		"""This method will extract subtitles from the input then output each language to its own file.\n
 		By default metadata is included (artist, chapters, etc.)
 		but include_other_metadata can be set to False to disable this."""
-		self.is_type_or_print_err_and_quit(type(include_other_metadata), bool, 'include_other_metadata')
 
 		out_paths_list = []
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-y']
 		# Get all the streams form the input.
-		strm_types = MetadataAcquisition(self.in_path).return_stream_types()
+		strm_types = self._get_stream_types()
 		# Get language extension and ffmpeg keyword dictionary.
 		lang_key_dict = MetadataAcquisition(self.in_path)._return_sub_lang(check_file=False)
+		# The output paths only differ by the language extension so build the start of them once
+		# (as a string so each output doesn't have to parse a new Path until it's needed.)
+		out_path_prefix = os.path.join(os.fspath(self.out_dir), self.in_stem + '.')
 		for strm_index, strm_cont in enumerate(strm_types):
 			# Subtitles from the streams list will be formatted as "Subtitle=xxx" so match by the beginning.
 			if strm_cont.startswith('Subtitle='):
@@ -1531,7 +1876,7 @@ class FileOperations(VerifyInputType):
 				ffmpeg_sub_key = strm_cont[-3:]
 				for ext_key, cmd_key in lang_key_dict.items():
 					if ffmpeg_sub_key == cmd_key:
-						out_path = paths.Path().joinpath(self.out_dir, self.in_path.stem + '.' + ext_key + '.vtt')
+						out_path = paths.Path(out_path_prefix + ext_key + '.vtt')
 						ffmpeg_cmd += ('-map', f'0:{strm_index}')
 						if include_other_metadata is False:
 							ffmpeg_cmd += ('-map_metadata', '-1', '-map_chapters', '-1')
@@ -1540,15 +1885,19 @@ class FileOperations(VerifyInputType):
 		if out_paths_list == [] and self.print_err is True:
 			print(f'\nError, no subtitles to extract were found from input:\n"{self.in_path}"\n')
 			return False
-		Render(self.in_path, out_paths_list, ffmpeg_cmd, self.print_success, self.print_err,
-			   self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return Render(self.in_path, out_paths_list, ffmpeg_cmd, self.print_success, self.print_err,
+			   self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
 
 	def rm_subs(self):
 		"""This method will remove any subtitles from the input."""
-		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-c', 'copy', '-map', '-0:s', self.standard_out_path]
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-			   self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()		
-
+		# -avoid_negative_ts shifts the copied timestamps to start at 0 so the output doesn't need another pass to play
+		# properly (Render adds -movflags +faststart.)
+		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-c', 'copy', '-map', '-0:s',
+		              '-avoid_negative_ts', 'make_zero', self.standard_out_path]
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+			   self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()		
+
+	@validate_types(timecode_title_list=list, add_chap_headings=bool)
 	def embed_chapters(self, timecode_title_list, add_chap_headings=True, print_new_chapters=False):
 		"""This method will assign the input timecodes to chapters for the output video.\n
 		NOTE: This method overwrites any existing chapters.\n
@@ -1560,22 +1909,12 @@ class FileOperations(VerifyInputType):
 		If add_chap_headings is True add a chapter heading in the format of: "Chapter 1: Title".
 		If print_new_chapters is True print the timecode and title for each new chapter."""
 		
-		# Confirm all inputs are the correct type and if they aren't print an error and quit.
-		self.is_type_or_print_err_and_quit(type(timecode_title_list), list, 'timecode_title_list')
-		self.is_type_or_print_err_and_quit(type(add_chap_headings), bool, 'add_chap_headings')
-
-		# Render temporary file of the input except with any already existing chapters removed.
-		# Otherwise it just keeps the original chapters without allowing for new ones.
-		temp_rm_chap_file = paths.Path().joinpath(self.out_dir, self.in_path.stem
-		                                          + '-temp_rm_chapter' + self.in_path.suffix)
-		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map', '0', '-c', 'copy', '-map_chapters', '-1', temp_rm_chap_file]
-		Render(self.in_path, temp_rm_chap_file, ffmpeg_cmd, False, self.print_err,
-		       False, False, False).check_depend_then_ren()
-
-		# Extract metadata from temp input without chapters, export it to a txt file, and read that data.
-		meta_file_path = MetadataAcquisition(temp_rm_chap_file, self.print_ren_info,
+		# Extract the input's metadata to a txt file and read that data.
+		meta_file_path = MetadataAcquisition(self.in_path, self.print_ren_info,
 		False, print_meta_value=False).extract_metadata_txt_file()
-		existing_metadata = paths.Path(meta_file_path).read_text()
+		# Drop any already existing chapters (they're always after the global metadata) so only the new ones are
+		# embedded. This replaces rendering a temporary copy of the input without chapters first.
+		existing_metadata = paths.Path(meta_file_path).read_text().split('\n[CHAPTER]')[0]
 		
 		# Lists for just string timecodes and just string titles.
 		timecode_str_list = []
@@ -1588,12 +1927,8 @@ class FileOperations(VerifyInputType):
 		
 		# Convert string timecodes into equivalent total seconds as ints.
 		# '0:05.00' = 5 (5 seconds in), '1:30.00' = 90 (1 minutes 30 seconds/90 seconds in).
-		timecode_sec_int_list = []
-		for timecode_str in timecode_str_list:
-			timecode_sec_int_list.append(int(FileOperations(self.in_path, self.out_dir,
-			print_ren_time=False)._return_input_duration_in_sec(convert_str_timecode_to_sec=timecode_str)))
-		timecode_sec_int_list.append(int(FileOperations(self.in_path, self.out_dir,
-		                                                print_ren_time=False)._return_input_duration_in_sec()))
+		timecode_sec_int_list = [int(self._timecode_to_sec(timecode_str)) for timecode_str in timecode_str_list]
+		timecode_sec_int_list.append(int(self._get_duration_sec()))
 		
 		# Add chapter headings to all chapters (Chapter 1: TITLE).
 		if add_chap_headings is True:
@@ -1606,45 +1941,163 @@ class FileOperations(VerifyInputType):
 		# START=0
 		# END=5
 		# title=0 Seconds in
-		embed_chapters_cmd = ''
-		start_timecode_int = 0
-		for chapter_title in chap_titles_list:
-			embed_chapters_cmd += f'\n[CHAPTER]\nTIMEBASE=1/1\nSTART={str(timecode_sec_int_list[start_timecode_int])}' \
-								f'\nEND={str(timecode_sec_int_list[start_timecode_int + 1])}\ntitle={chapter_title}\n'
-			start_timecode_int += 1
-		embed_chapters_cmd = existing_metadata + embed_chapters_cmd
+		# (Each chapter is added to a list that's joined once instead of adding to a string in the loop.)
+		embed_chapters_list = [existing_metadata]
+		for start_timecode_int, chapter_title in enumerate(chap_titles_list):
+			embed_chapters_list.append(f'\n[CHAPTER]\nTIMEBASE=1/1\nSTART={str(timecode_sec_int_list[start_timecode_int])}'
+			                           f'\nEND={str(timecode_sec_int_list[start_timecode_int + 1])}\ntitle={chapter_title}\n')
+		embed_chapters_cmd = ''.join(embed_chapters_list)
 		paths.Path(meta_file_path).write_text(embed_chapters_cmd)
 	
 		# Main command and render.
-		ffmpeg_cmd = ['ffmpeg', '-i', temp_rm_chap_file, '-i', meta_file_path, '-map_metadata',
-		              '1', '-map', '0', '-c', 'copy', self.standard_out_path]
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-			   self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()	
+		# Only take the chapters from the metadata file, otherwise the input's original chapters are kept.
+		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-i', meta_file_path, '-map_metadata', '1',
+		              '-map_chapters', '1', '-map', '0', '-c', 'copy', self.standard_out_path]
+		ren_result = Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+		                    self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
 		
-		# Delete temporary input with no chapters and delete temporary text file containing the other metadata from that
-		#   temp no chapters input.
+		# Delete the temporary text file containing the other metadata.
 		meta_file_path.unlink()
-		temp_rm_chap_file.unlink()
+		return ren_result
 	
 	def rm_chapters(self):
 		"""This method removes chapters from the input (if there are any)."""
 		
 		ffmpeg_cmd = ['ffmpeg', '-i', self.in_path, '-map_chapters', '-1', '-c', 'copy',
-		              '-map', '0:a?', '-map', '0:v?', '-map', '0:s?', self.standard_out_path]
+		              '-map', '0:a?', '-map', '0:v?', '-map', '0:s?', '-avoid_negative_ts', 'make_zero',
+		              self.standard_out_path]
 		
-		Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
-			   self.print_ren_info, self.print_ren_time, self.open_after_ren).check_depend_then_ren()
+		return Render(self.in_path, self.standard_out_path, ffmpeg_cmd, self.print_success, self.print_err,
+			   self.print_ren_info, self.print_ren_time, self.open_after_ren, pool=self.pool).check_depend_then_ren()
+	
+	def _can_remux_to(self, out_ext):
+		"""Local method to return True if every video, audio and subtitle stream codec from self.in_path can be copied
+		into an out_ext file without re-encoding (see _REMUX_SAFE), otherwise False."""
+		strm_codecs = [strm.get('codec_name') for strm in self._probe().get('streams', [])
+		               if strm.get('codec_type') in ('video', 'audio', 'subtitle')]
+		if strm_codecs == []:
+			return False
+		out_ext = out_ext.lower()
+		return all((codec, out_ext) in _REMUX_SAFE for codec in strm_codecs)
+	
+	def refresh_metadata(self):
+		"""Clear the cached stream types and duration so the next method that needs them scans self.in_path again.\n
+		Only needed if the input file was changed after this instance was created."""
+		self._probe_cache = None
+		self._stream_types_cache = None
+		self._stream_type_set_cache = None
+		self._duration_cache = None
+	
+	def _threads_args(self, filters=False):
+		"""Local method to return the ffmpeg arguments that set how many threads (self.max_threads) the encoder
+		and, if filters is True, the filters can use."""
+		threads = str(self.max_threads)
+		if filters is True:
+			return ['-threads', threads, '-filter_threads', threads, '-filter_complex_threads', threads]
+		return ['-threads', threads]
 	
+	def _probe(self):
+		"""Local method to return the ffprobe stream and format info dictionary for self.in_path
+		(see MetadataAcquisition.probe_all), only running ffprobe the first time it's called."""
+		if self._probe_cache is None:
+			self._probe_cache = MetadataAcquisition(self.in_path, self.print_ren_info, False, False).probe_all()
+		return self._probe_cache
+	
+	def _get_stream_types(self):
+		"""Local method to return the stream types of self.in_path from the cached probe."""
+		if self._stream_types_cache is None:
+			self._stream_types_cache = MetadataAcquisition._stream_types_from_probe(self._probe())
+		return self._stream_types_cache
+	
+	def _get_stream_type_set(self):
+		"""Local method to return a frozenset of the stream types of self.in_path for checking if it has a stream type
+		(use _get_stream_types when the order/index of the streams matters.)"""
+		if self._stream_type_set_cache is None:
+			self._stream_type_set_cache = frozenset(self._get_stream_types() or ())
+		return self._stream_type_set_cache
+	
+	def _has_rotation_metadata(self):
+		"""Local method to return True if the first video stream of self.in_path has any rotation metadata
+		(a rotate tag or a display matrix rotation.)"""
+		for strm in self._probe().get('streams', []):
+			if strm.get('codec_type') == 'video' and strm.get('disposition', {}).get('attached_pic') != 1:
+				if strm.get('tags', {}).get('rotate', '0') != '0':
+					return True
+				return any(side_data.get('rotation', 0) != 0 for side_data in strm.get('side_data_list', []))
+		return False
+	
+	def _frame_segments(self, segments=1):
+		"""Local method for extract_frames to split self.in_path into segments parts with a whole number of frames each.\n
+		Returns a list of (start second, number of frames, first frame number) for each part, or an empty list if the
+		input should be done in one part (segments is 1, there aren't enough frames, or the frame rate isn't constant
+		and segments is 0 for automatic.)"""
+		vid_strm = None
+		for strm in self._probe().get('streams', []):
+			if strm.get('codec_type') == 'video' and strm.get('disposition', {}).get('attached_pic') != 1:
+				vid_strm = strm
+				break
+		if vid_strm is None:
+			return []
+		try:
+			fps_num, fps_den = vid_strm['avg_frame_rate'].split('/')
+			fps = int(fps_num) / int(fps_den)
+		except (KeyError, ValueError, ZeroDivisionError):
+			return []
+		# The parts can only line up exactly if every frame is the same length.
+		if segments == 0:
+			if vid_strm.get('avg_frame_rate') != vid_strm.get('r_frame_rate'):
+				return []
+			segments = max(1, (os.cpu_count() or 1) // 2)
+		if fps <= 0:
+			return []
+		# Use the length of the video stream itself (the container's duration can include longer audio streams.)
+		try:
+			total_length_sec = float(vid_strm['duration'])
+		except (KeyError, ValueError):
+			total_length_sec = self._get_duration_sec()
+		if total_length_sec is None:
+			return []
+		# Don't split into parts shorter than 5 seconds (starting ffmpeg would take longer than it saves.)
+		segments = min(segments, int(total_length_sec // 5))
+		if segments <= 1:
+			return []
+		
+		# The number of frames the container lists for the video stream (otherwise calculate it from its length.)
+		try:
+			total_frames = int(vid_strm['nb_frames'])
+		except (KeyError, ValueError):
+			total_frames = 0
+		if total_frames <= 0:
+			total_frames = math.ceil(total_length_sec * fps)
+		frames_per_segment = math.ceil(total_frames / segments)
+		# Start each part half a frame early so rounding can't skip its first frame.
+		return [(max(0.0, (first_frame - 0.5) / fps), frames_per_segment, first_frame + 1)
+		        for first_frame in range(0, total_frames, frames_per_segment)]
+	
+	def _get_duration_sec(self):
+		"""Local method to return the duration of self.in_path in seconds from the cached probe
+		(if the container doesn't list a duration the input is decoded to calculate it.)"""
+		if self._duration_cache is None:
+			try:
+				self._duration_cache = float(self._probe()['format']['duration'])
+			except (KeyError, ValueError):
+				self._duration_cache = self._return_input_duration_in_sec()
+		return self._duration_cache
+	
+	@validate_types(convert_str_timecode_to_sec=str)
 	def _return_input_duration_in_sec(self, convert_str_timecode_to_sec=''):
 		"""Local method to return the duration of self.in_path vid/aud in seconds.\n
 		if convert_str_timecode_to_sec is specified it will convert a string of a timecode into seconds,
 		otherwise it's the self.in_path duration in seconds."""
 
-		self.is_type_or_print_err_and_quit(type(convert_str_timecode_to_sec), str, 'convert_str_timecode_to_sec')
-
 		if convert_str_timecode_to_sec != '':
-			duration = convert_str_timecode_to_sec
+			return self._timecode_to_sec(convert_str_timecode_to_sec)
 		else:
+			# Use the duration from the cached probe if the container lists one, otherwise decode the input.
+			try:
+				return float(self._probe()['format']['duration'])
+			except (KeyError, ValueError):
+				pass
 			duration = MetadataAcquisition(self.in_path, print_all_info=self.print_ren_info,
 			                               print_scan_time=self.print_ren_time).return_metadata(duration=1)[0]
 
@@ -1652,61 +2105,81 @@ class FileOperations(VerifyInputType):
 			if self.print_err is True:
 				print(f'''Error, no duration found for input:\n"{self.in_path}"\n''')
 			return None
-
-		# Use the string length of the timecode duration to determine what format it's in.
-		timecode_format = ''
-		try:
-			has_dot = duration.find('.')
-			if duration.find('.') == -1:
-				if len(duration) > 6:
-					timecode_format = '%H:%M:%S'
-				elif len(duration) > 3:
-					timecode_format = '%M:%S'
-				elif len(duration) == 2 or len(duration) == 1:
-					timecode_format =  '%S'
-				else:
-					raise ValueError
-			else:
-				if len(duration) > 9:
-					timecode_format = '%H:%M:%S.%f'
-				elif len(duration) > 5:
-					timecode_format = '%M:%S.%f'
-				elif len(duration) > 3:
-					timecode_format='%S.%f'
-				else:
-					raise ValueError
-			length = dates.datetime.strptime(duration, timecode_format).time()
-		except ValueError:
+		return self._timecode_to_sec(duration)
+	
+	def _timecode_to_sec(self, duration):
+		"""Local method to convert a string timecode ("1:06:05.7", "6:05.7", "5.7" or "5") into seconds as a float."""
+		# Split the timecode into hours, minutes, seconds and fractions of a second ("1:06:05.7", "6:05.7", "5.7", "5").
+		timecode_match = _TIMECODE_RE.match(duration)
+		if timecode_match is None:
 			if self.print_err is True:
 				print(f'Error, unable to calculate timecode duration for input "{duration}"\nTimecode numbers must be '
-				      f'in a "00:00:00.00" format, with a minimum of one number, no more than 2 digits after a period (".00") '
-					  f'and if fractions of a second are specified they must have a leading number ("0.4")')
+				      f'in a "00:00:00.00" format, with a minimum of one number, any number of digits after a period '
+				      f'(".00" or ".000000") and if fractions of a second are specified they must have a leading number ("0.4")')
 			quit()
-
+		
 		# Add up total seconds (there are 3600 seconds in an hour and 60 seconds in a minute.)
-		length_sec = int(length.hour * 3600) + int(length.minute * 60) + int(length.second)
-		# The microsecond will have any leading zeros removed (20000 instead of the accurate 020000)
-		# so if the input is 0.X seconds long, just add a decimal before appending the fractional seconds to the string.
-		# However, if it's 0.0X seconds long it would omit that first zero immediately after the decimal,
-		# so add a zero after the decimal for the length_sec string to have an accurate length.
-		if len(str(length.microsecond)) == 6:
-			length_sec = str(length_sec) + '.' + str(int(length.microsecond))
-		else:
-			length_sec = str(length_sec) + '.0' + str(int(length.microsecond))
-		# Return string as a float number with trailing zeros removed.
-		# e.g., str(length_sec) may be equal to "832.430000" seconds before being returned as a float.
+		hours, minutes, seconds, fraction = timecode_match.groups()
+		if minutes is None:
+			# With only one colon the first number is the minutes ("6:05.7").
+			hours, minutes = None, hours
+		length_sec = int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(seconds)
+		if fraction is not None:
+			length_sec += float('0.' + fraction)
 		return float(length_sec)
 	
+	@staticmethod
+	def _fast_clone(src_path, dst_path):
+		"""Copy src_path to dst_path as a copy-on-write clone if the file system supports it (btrfs/XFS on Linux or
+		APFS on macOS) so no data has to be copied, otherwise it's a normal copy (with the file dates kept like
+		shutil.copy2.)\n
+		NOTE: This isn't a hardlink because AtomicParsley may edit the copy in place which would also change src_path."""
+		if sys.platform.startswith('linux'):
+			# --reflink=auto falls back to a normal copy if a clone isn't possible.
+			clone_cmd = ['cp', '--reflink=auto', '--preserve=timestamps', src_path, dst_path]
+		elif sys.platform == 'darwin':
+			# -c clones with clonefile (and fails if it can't, so it falls back to shutil.copy2 below.)
+			clone_cmd = ['cp', '-c', '-p', src_path, dst_path]
+		else:
+			clone_cmd = None
+		if clone_cmd is not None:
+			import subprocess as sub
+			
+			clone_process = sub.run(clone_cmd, stdout=sub.DEVNULL, stderr=sub.DEVNULL)
+			if clone_process.returncode == 0:
+				return dst_path
+		shutil.copy2(src_path, dst_path)
+		return dst_path
+	
+	@staticmethod
+	def _atempo_chain(playback_speed):
+		"""Return the audio filter to change the playback speed by playback_speed.\n
+		The atempo filter only accepts values from 0.5 to 2.0 so for anything outside that range multiple atempo filters
+		are chained together so they multiply to playback_speed (4.0 = "atempo=2.0,atempo=2.0")."""
+		atempo_filters = []
+		remaining_speed = playback_speed
+		while remaining_speed > 2.0:
+			atempo_filters.append('atempo=2.0')
+			remaining_speed /= 2.0
+		while remaining_speed < 0.5:
+			atempo_filters.append('atempo=0.5')
+			remaining_speed /= 0.5
+		atempo_filters.append(f'atempo={remaining_speed}')
+		return ','.join(atempo_filters)
+	
 	def _add_to_ren_cmd__rm_art_stream_index_selector(self, ffmpeg_cmd):
 		"""This method determines if the main input has an artwork stream and what video index that would be.
 		If there's a video stream then it's 1 (the second video stream) but if there's no video then its 0 (the first
 		video stream.) Either way return the command."""
 		# Extract all the different stream types for the input.
-		stream_types = MetadataAcquisition(self.in_path).return_stream_types()
+		# These formats can't store artwork so don't scan the input.
+		if self.in_path.suffix.lower() in _NO_ART_EXTS:
+			return ffmpeg_cmd
+		stream_types = self._get_stream_type_set()
 
-		# If an artwork stream exists continue, otherwise return False.
+		# If an artwork stream exists continue, otherwise return the command unchanged.
 		art_stream = 'Artwork' in stream_types
-		if art_stream is None:
+		if art_stream is False:
 			return ffmpeg_cmd
 
 		# An artwork stream exists, so if a video stream exists remove the second video stream from the input.
@@ -1727,7 +2200,7 @@ class FileOperations(VerifyInputType):
 	def _add_to_ren_cmd__map_all_strms_of_type(self, in_path, strm_type, ffmpeg_cmd):
 		"""."""
 		# Extract all the different stream types for the input.
-		strm_types = MetadataAcquisition(in_path).return_stream_types()
+		strm_types = _stream_types_of(in_path)
 		if strm_types != None:
 			for strm_index, strm in enumerate(strm_types):
 				# Map the output if it's an audio stream.
@@ -1,10 +1,183 @@
+import json
+import os
 import pathlib as paths
+import re
+import threading
 import time
+import types
 import subprocess as sub
+from collections import Counter, OrderedDict
 
 from VerifyInputType import VerifyInputType
 from Render import Render
 
+# orjson is optional (it's faster at parsing ffprobe's JSON), otherwise use the standard library json module.
+try:
+	from orjson import loads as _json_loads
+except ImportError:
+	_json_loads = json.loads
+
+# The output path ffmpeg writes to when only its terminal output is needed (it depends on the OS.)
+_NULL_KEYWORD = '/dev/null' if os.name == 'posix' else 'NUL'
+
+# The only ffprobe entries read from probe_all (so ffprobe doesn't have to calculate and format everything else.)
+_PROBE_ENTRIES = ('stream=index,codec_type,codec_name,width,height,avg_frame_rate,r_frame_rate,duration,nb_frames'
+                  ':stream_disposition=attached_pic:stream_tags:stream_side_data_list:format=duration:format_tags'
+                  ':chapter=id')
+
+# The ffprobe keyword for each MetadataAcquisition.return_metadata argument (in the same order as its arguments.)
+_META_FIELDS = ('artist', 'album', 'description', 'lyrics', 'genre', 'composer', 'track', 'disc', 'date', 'start',
+                'comment', 'title', 'Duration', 'performer', 'max_volume', 'Audio', 'Video', 'Stream', 'crop',
+                'dimensions')
+
+# Patterns for the values _find_meta_value reads from ffmpeg's output.
+_STREAM_RE = re.compile(r'^\s*Stream #(.*)$', re.MULTILINE)
+# Groups: the stream info after "Stream #", the language, the stream type and the rest of the line.
+_STREAMTYPE_RE = re.compile(r'^\s*Stream #(\d+:\d+[^(:]*(?:\((\w+)\))?[^:]*: (Video|Audio|Data|Subtitle)(.*))$', re.MULTILINE)
+# The stream types that are returned as is (video and subtitle streams need more info from the stream.)
+# The keys are ffprobe's codec_type (the stream type from the file info is lowercased to match.)
+_PLAIN_STRM_TYPES = {
+	'audio': 'Audio',
+	'data': 'Chapter',
+}
+_META_VALUE_RES = {
+	'crop': re.compile(r'crop=(\S+)'),
+	'max_volume': re.compile(r'max_volume:\s*(.+)'),
+	'Duration': re.compile(r'Duration:\s*([^,]+)'),
+}
+
+# Subtitle file extensions that say the language (File_Name-.en.vtt) and the ffmpeg language keyword for each
+# so ffmpeg can assign the metadata for that file to the correct language ('-metadata:s:s: language=eng'.)
+# It's read only because _return_sub_lang(check_file=False) returns it.
+_SUB_LANG_MAP = types.MappingProxyType({
+	# English
+	'en': 'eng',
+	'en-CA': 'eng',
+	'en-GB': 'eng',
+	'en-US': 'eng',
+	# Chinese
+	'zh-Hans': 'zho',
+	'zh-Hant': 'zho',
+	'zh-TW': 'zho',
+	# Vietnamese
+	'vi': 'vie',
+	# Catalan
+	'ca': 'cat',
+	# Italian
+	'it': 'ita',
+	# Hebrew
+	'iw': 'heb',
+	# Arabic
+	'ar': 'ara',
+	# Czech
+	'cs': 'ces',
+	# Estonian
+	'et': 'est',
+	# Indonesian
+	'id': 'ind',
+	# Spanish
+	'es': 'spa',
+	'es-419': 'spa',
+	# Russian
+	'ru': 'rus',
+	# Dutch
+	'nl': 'nld',
+	# Portuguese
+	'pt': 'por',
+	# Norwegian
+	'no': 'nor',
+	# Turkish
+	'tr': 'tur',
+	# Lithuanian
+	'lt': 'lit',
+	# Thai
+	'th': 'tha',
+	# Romanian
+	'ro': 'ron',
+	# Polish
+	'pl': 'pol',
+	# French
+	'fr': 'fra',
+	# Bulgarian
+	'bg': 'bul',
+	# Ukrainian
+	'uk': 'ukr',
+	# Slovenian
+	'sl': 'slv',
+	# Croatian
+	'hr': 'hrv',
+	# Hungarian
+	'hu': 'hun',
+	# Portuguese
+	'pt-BR': 'por',
+	# Finnish
+	'fi': 'fin',
+	# Danish
+	'da': 'dan',
+	# Japanese
+	'ja': 'jpn',
+	# Serbian
+	'sr': 'srp',
+	# Korean
+	'ko': 'kor',
+	# Swedish
+	'sv': 'swe',
+	# Slovak
+	'sk': 'slk',
+	# German
+	'de': 'deu',
+	# Malay
+	'ms': 'msa',
+	# Greek/Modern
+	# '--': '---',
+})
+
+# Matches each "silence_start: 1.23" / "silence_end: 4.56" line from the silencedetect filter.
+_SILENCE_RE = re.compile(r'silence_(start|end): (-?[\d.]+)')
+
+
+# Process wide cache of ffprobe results keyed by (scan type, path) with the file's (modification time, size) stored
+# next to each result, so an unchanged file is only ever scanned once and a changed file replaces its old entry.
+# It's in least recently used order and only keeps the last _PROBE_CACHE_SIZE entries so a batch of thousands of
+# files doesn't keep every scan in memory. The lock lets threads (see prefetch_probes) share it.
+_PROBE_CACHE = OrderedDict()
+_PROBE_CACHE_SIZE = 256
+_PROBE_CACHE_LOCK = threading.Lock()
+
+
+def _cached_scan(scan_type, in_path, run_scan):
+	"""Return the cached result of run_scan() for in_path, only calling it if in_path hasn't been scanned with
+	scan_type since it last changed."""
+	in_stat = os.stat(in_path)
+	cache_key = (scan_type, str(in_path))
+	file_stamp = (in_stat.st_mtime_ns, in_stat.st_size)
+	with _PROBE_CACHE_LOCK:
+		cached = _PROBE_CACHE.get(cache_key)
+		if cached is not None and cached[0] == file_stamp:
+			_PROBE_CACHE.move_to_end(cache_key)
+			return cached[1]
+	# ffprobe runs outside the lock so other files can be scanned at the same time.
+	scan_result = run_scan()
+	with _PROBE_CACHE_LOCK:
+		_PROBE_CACHE[cache_key] = (file_stamp, scan_result)
+		_PROBE_CACHE.move_to_end(cache_key)
+		if len(_PROBE_CACHE) > _PROBE_CACHE_SIZE:
+			_PROBE_CACHE.popitem(last=False)
+	return scan_result
+
+
+def _probe_json(path_str):
+	"""Run ffprobe on path_str and return a tuple of (the parsed dictionary or None if it couldn't be parsed, stdout, stderr)
+	(see MetadataAcquisition.probe_all.)"""
+	probe_cmd = ['ffprobe', '-v', 'error', '-show_entries', _PROBE_ENTRIES, '-of', 'json', path_str]
+	# The output is left as bytes because both JSON parsers accept bytes directly.
+	probe_process = sub.run(probe_cmd, stdin=sub.DEVNULL, stdout=sub.PIPE, stderr=sub.PIPE)
+	try:
+		probe = _json_loads(probe_process.stdout)
+	except ValueError:
+		probe = None
+	return probe, probe_process.stdout, probe_process.stderr
+
 
 class MetadataAcquisition(VerifyInputType):
 	"""This class provides methods to get file metadata.
@@ -14,13 +187,17 @@ class MetadataAcquisition(VerifyInputType):
 		"""Requires a path object to an input file and optional file info printing"""
 		
 		# Run function to print an error and quit if the input type is not valid.
-		self.is_type_or_print_err_and_quit(type(in_path), paths.Path, 'in_path')
-		self.is_type_or_print_err_and_quit(type(print_all_info), bool, 'print_all_info')
-		self.is_type_or_print_err_and_quit(type(print_scan_time), bool, 'print_scan_time')
-		self.is_type_or_print_err_and_quit(type(print_meta_value), bool, 'print_meta_value')
+		self.is_type_or_print_err_and_quit(in_path, paths.Path, 'in_path')
+		self.is_type_or_print_err_and_quit(print_all_info, bool, 'print_all_info')
+		self.is_type_or_print_err_and_quit(print_scan_time, bool, 'print_scan_time')
+		self.is_type_or_print_err_and_quit(print_meta_value, bool, 'print_meta_value')
 		
 		# Create path object of input file.
 		self.in_path = paths.Path(in_path)
+		# Parts of the input path that are read more than once (pathlib works these out again every time they're read.)
+		self._suffixes = self.in_path.suffixes
+		self._parent = self.in_path.parent
+		self._stem = self.in_path.stem
 		
 		# Boolean value for printing all file info provided by ffprobe (default is False.)
 		self.print_all_info = print_all_info
@@ -56,24 +233,33 @@ class MetadataAcquisition(VerifyInputType):
 		
 		try:
 			start_time = time.perf_counter()
-			info_process = sub.run(info_cmd, stdout=sub.PIPE, stderr=sub.PIPE, universal_newlines=True)
 			# Run actual command and get output.
+			# The output is read as bytes and decoded once (a text mode pipe decodes it line by line and raises an
+			# error for metadata that isn't valid UTF-8.) stdin is DEVNULL so ffmpeg/ffprobe never waits on the terminal
+			# and stdout is DEVNULL because the info (and the output of every custom_cmd) is only written to stderr.
+			if custom_cmd == '':
+				# The file info doesn't change unless the file does so it's cached like probe_all.
+				info_process = _cached_scan('info', self.in_path, lambda: sub.run(info_cmd, stdin=sub.DEVNULL,
+				                                                                  stdout=sub.DEVNULL, stderr=sub.PIPE))
+			else:
+				info_process = sub.run(info_cmd, stdin=sub.DEVNULL, stdout=sub.DEVNULL, stderr=sub.PIPE)
 			end_time = time.perf_counter()
+			info_stderr = info_process.stderr.decode(errors='replace')
 			if self.print_all_info is True:
 				# Print all info from ffprobe.
-				print(info_process.stderr)
+				print(info_stderr)
 			if self.print_scan_time is True:
 				print('\n"', self.in_path, '"', sep='')
 				duration = Render.terminal_render_timer(start_time, end_time, operation_keyword=' to scan')
 				print(duration)
-			return info_process.stderr + info_process.stdout
+			return info_stderr
 		# Return True (it worked.)
 		except sub.CalledProcessError:
 			# Unknown error occurred so print an error and return False.
 			if self.print_all_info is True:
 				# The render failed, print an error message.
 				print(f'\nError, a problem occurred with metadata acquisition:')
-				print(f'Terminal input command: {info_cmd}\n{info_process.stderr}')
+				print(f'Terminal input command: {info_cmd}\n{info_process.stderr.decode(errors="replace")}')
 				quit()
 			return False
 	
@@ -87,44 +273,15 @@ class MetadataAcquisition(VerifyInputType):
 		assign them an int in ascending order\n
 		e.g. (title=1, lyrics=3, composer=2) will be returned with the list value: [title, composer, lyrics]."""
 		
-		# Dictionary to store the ffprobe keywords.
-		meta_dict = dict([
-			(artist_author, 'artist'),
-			(album, 'album'),
-			(description, 'description'),
-			(lyrics, 'lyrics'),
-			(genre, 'genre'),
-			(composer, 'composer'),
-			(track_num, 'track'),
-			(disc_num, 'disc'),
-			(date, 'date'),
-			(start_offset, 'start'),
-			(comment, 'comment'),
-			(title, 'title'),
-			(duration, 'Duration'),
-			(performer, 'performer'),
-			(max_volume, 'max_volume'),
-			(first_aud_strm_info, 'Audio'),
-			(first_vid_strm_info, 'Video'),
-			(every_stream_info, 'Stream'),
-			(crop_detect, 'crop'),
-			(vid_dim, 'dimensions'),
-		])
-		
-		# List to store all the possible return values for metadata for this method.
+		# List to store all the possible return values for metadata for this method (in the same order as _META_FIELDS.)
 		in_meta_value_list = [artist_author, album, description, lyrics, genre, composer, track_num, disc_num,
 		                      date, start_offset, comment, title, duration, performer, max_volume, first_aud_strm_info,
 		                      first_vid_strm_info, every_stream_info, crop_detect, vid_dim]
 		
 		# Make sure at least one value to return was specified.
-		all_input_equal = all(in_meta_value_list)
-		if all_input_equal is True:
+		if all(meta_key_int is False for meta_key_int in in_meta_value_list):
 			print('Error, at least one metadata value must be specified to return anything.')
-		
-		# List to store the keywords to obtain the metadata values.
-		in_meta_keyword_list = []
-		# List to store the output order integers.
-		out_order_int_list = []
+			quit()
 		
 		# Confirm input values are valid ints or False:
 		for meta_key_int in in_meta_value_list:
@@ -133,38 +290,24 @@ class MetadataAcquisition(VerifyInputType):
 				print(f'Error, metadata values to return can only be integers (in ascending order to return) '
 				      f'or False, not {type(meta_key_int)} "{meta_key_int}"')
 				quit()
-			elif type(meta_key_int) is int:
-				# Add each output order integer to a list and the input order integer
-				# before the metadata keyword_with_int (e.g. "01title").
-				out_order_int_list.append(meta_key_int)
-				in_meta_keyword_list.append(f'{meta_key_int:02d}' + meta_dict[meta_key_int])
 		
-		# Remove the output order integer before the keyword_with_int (e.g. "01title")
-		# now that the list has the correct order.
-		in_meta_keyword_list.sort()
-		out_order_int_list.sort()
-		out_keyword_sorted_list = []
-		for keyword_with_int in in_meta_keyword_list:
-			out_keyword_sorted_list.append(keyword_with_int[2:])
+		# Pair each output order integer with its ffprobe keyword and sort them by the output order.
+		out_order_keyword_list = sorted((meta_key_int, keyword) for meta_key_int, keyword
+		                                in zip(in_meta_value_list, _META_FIELDS) if meta_key_int is not False)
+		out_order_int_list = [meta_key_int for meta_key_int, _ in out_order_keyword_list]
+		out_keyword_sorted_list = [keyword for _, keyword in out_order_keyword_list]
 		
 		# Check if there are any duplicate output order integers.
-		dup_int_scanned = {}
-		dupe_in_int = []
-		for in_int in out_order_int_list:
-			if in_int not in dup_int_scanned:
-				dup_int_scanned[in_int] = 1
-			else:
-				if dup_int_scanned[in_int] == 1:
-					dupe_in_int.append(in_int)
-				dup_int_scanned[in_int] += 1
-		if len(dupe_in_int) > 0:
+		dupe_in_int = [in_int for in_int, in_int_count in Counter(out_order_int_list).items() if in_int_count > 1]
+		if dupe_in_int != []:
 			print(f'Error, output order number "{dupe_in_int[0]}" can only be specified once.')
 			quit()
 		
 		# Check if output order ints are within the valid range (1-4 if 4 metadata values to return are specified.)
-		for meta_key_int in out_order_int_list:
+		# (out_order_int_list is sorted so the first and last are the smallest and largest.)
+		for meta_key_int in (out_order_int_list[0], out_order_int_list[-1]):
 			if meta_key_int < 1 or meta_key_int > len(out_order_int_list):
-				print(f'Error, return order integer "{meta_key_int}" must be in range 1-{len(in_meta_keyword_list)}')
+				print(f'Error, return order integer "{meta_key_int}" must be in range 1-{len(out_order_int_list)}')
 				quit()
 		
 		# Confirm file exists (it will quit if it doesn't.)
@@ -173,49 +316,76 @@ class MetadataAcquisition(VerifyInputType):
 		# Make an empty list to be returned so values can be appended.
 		metadata_value_list = []
 			
-		# Determine null keyword_with_int for system based on the path type.
-		if type(self.in_path) is paths.PosixPath:
-			null_keyword = '/dev/null'
-		else:
-			null_keyword = 'NUL'
+		# max_volume and crop have to decode the input so they're scanned together in one ffmpeg command
+		# (which also prints the Duration) that only runs the first time one of them is needed.
+		scan_vol = 'max_volume' in out_keyword_sorted_list
+		scan_crop = 'crop' in out_keyword_sorted_list
+		filter_output = None
 		
-		# Nested function that runs a custom ffmpeg command that scans the input using a certain filter without
+		# Nested function that runs the ffmpeg command that scans the input using the requested filters without
 		# producing a file output.
-		def calculate_metadata(format_str, filter_str, output_keyword):
-			calculate_value_cmd = ['ffmpeg', '-i', self.in_path, format_str,
-								   filter_str, '-f', 'null', null_keyword, '-hide_banner']
-			info_with_calculated_value = self._term_return_file_info(calculate_value_cmd)
-			calculate_result = self._find_meta_value(info_with_calculated_value, output_keyword)
-			return calculate_result
+		# Streams that aren't being scanned are skipped so they aren't decoded for nothing and "-threads 0" lets the
+		# decoder use every core.
+		def calculate_metadata():
+			calculate_value_cmd = ['ffmpeg', '-threads', '0']
+			if scan_crop is True:
+				# The black bars are the same throughout the video so only the keyframes are decoded to detect them
+				# (every audio frame is a keyframe so this doesn't change the audio.)
+				calculate_value_cmd += ('-skip_frame', 'nokey')
+			calculate_value_cmd += ('-i', self.in_path)
+			calculate_value_cmd += ('-af', 'volumedetect') if scan_vol is True else ('-an',)
+			calculate_value_cmd += ('-vf', 'cropdetect') if scan_crop is True else ('-vn',)
+			calculate_value_cmd += ('-sn', '-dn', '-f', 'null', _NULL_KEYWORD, '-hide_banner')
+			return self._term_return_file_info(calculate_value_cmd)
 
+		# The metadata tags from the ffprobe scan (only read if a tag is requested.)
+		format_tags = None
 		# Go over all the specified inputs to retrieve their values.
 		for value_keyword in out_keyword_sorted_list:
 			# Run the input through a filter to retrieve a special value.	
-			if value_keyword == 'max_volume':
-				current_key_value = calculate_metadata('-af', 'volumedetect', 'max_volume')
-			elif value_keyword == 'crop':
-				current_key_value = calculate_metadata('-vf', 'cropdetect', 'crop')
+			if value_keyword == 'max_volume' or value_keyword == 'crop':
+				if filter_output is None:
+					filter_output = calculate_metadata()
+				current_key_value = self._find_meta_value(filter_output, value_keyword)
 			elif value_keyword == 'Stream':
 				file_info = self._term_return_file_info()
 				current_key_value = self._find_meta_value(file_info, value_keyword)
+			elif value_keyword == 'Audio' or value_keyword == 'Video':
+				# The info for the first stream of that type (without the "Stream #" at the beginning.)
+				current_key_value = None
+				for strm_info, _, strm_type, strm_details in _STREAMTYPE_RE.findall(self._term_return_file_info()):
+					if strm_type == value_keyword and '(attached pic)' not in strm_details:
+						current_key_value = strm_info
+						break
+				if self.print_meta_value is True:
+					print(f'\n{value_keyword}:\n{current_key_value}')
 			elif value_keyword == 'Duration':
-				cal_dur_cmd = ['ffmpeg', '-i', self.in_path, '-f', 'null', '-']
-				info_with_dur = self._term_return_file_info(cal_dur_cmd)
+				# The filter scan already prints the duration so only run a separate command if there isn't one.
+				if filter_output is None and (scan_vol is True or scan_crop is True):
+					filter_output = calculate_metadata()
+				if filter_output is not None:
+					info_with_dur = filter_output
+				else:
+					# The duration is in the container header so read it from the (cached) ffprobe scan instead of
+					# running ffmpeg, and format it the same way ffmpeg prints it ("Duration: 00:03:25.12".)
+					try:
+						dur_centisec = round(float(self.probe_all()['format']['duration']) * 100)
+						dur_min, dur_centisec = divmod(dur_centisec, 6000)
+						dur_hour, dur_min = divmod(dur_min, 60)
+						info_with_dur = (f'Duration: {dur_hour:02d}:{dur_min:02d}:'
+						                 f'{dur_centisec // 100:02d}.{dur_centisec % 100:02d}')
+					except (KeyError, ValueError):
+						# ffprobe couldn't read the duration so fall back to the Duration line from the file info.
+						info_with_dur = self._term_return_file_info()
 				current_key_value = self._find_meta_value(info_with_dur, value_keyword)
 			
-			# Run standard command that only returns the value of the input key.
+			# Every other keyword is a metadata tag so look it up from the (cached) ffprobe scan.
 			else:
-				return_value_cmd = ['ffprobe', '-v', 'quiet', '-show_entries',
-									f'format_tags={value_keyword}',
-									'-of', 'default=nw=1:nk=1', self.in_path]
-				value = self._term_return_file_info(return_value_cmd)
-				if value == '':
-					current_key_value = None
-				else:
-					# Remove the newline from the end of the value.
-					current_key_value = value[:-1]
-				# if self.print_meta_value is True:
-				# print(f'\n{key}:\n{current_key_value}')
+				if format_tags is None:
+					# Tag names can be upper or lowercase depending on the container so match them case insensitively.
+					format_tags = {tag.lower(): tag_value
+					               for tag, tag_value in self.probe_all().get('format', {}).get('tags', {}).items()}
+				current_key_value = format_tags.get(value_keyword.lower())
 			
 				# If the metadata keyword value isn't in the input file then potentially print an error.
 				if self.print_meta_value is True:
@@ -224,44 +394,183 @@ class MetadataAcquisition(VerifyInputType):
 					else:
 						print(f'\n{value_keyword}:\n{current_key_value}')
 			
-		metadata_value_list.append(current_key_value)
+			metadata_value_list.append(current_key_value)
 		return metadata_value_list
 	
+	def probe_all(self):
+		"""This method scans the input once with ffprobe and returns a dictionary of the stream and format info.\n
+		The dictionary has the "streams" list, "chapters" list and "format" dictionary from ffprobe's JSON output
+		(only the entries in _PROBE_ENTRIES: codec type/name, dimensions, frame rates, stream durations/frame counts,
+		attached_pic, tags, side data, duration and chapter ids)
+		(or it's empty if ffprobe couldn't read the input.)\n
+		The scan is cached until the input file changes so calling this again for the same file doesn't rerun ffprobe."""
+		
+		# Confirm file exists (it will quit if it doesn't.)
+		self._check_file_exists()
+		
+		start_time = time.perf_counter()
+		# The result is shared by every caller so it must not be modified.
+		probe, probe_stdout, probe_stderr = _cached_scan('json', self.in_path, lambda: _probe_json(str(self.in_path)))
+		end_time = time.perf_counter()
+		if self.print_all_info is True:
+			# Print all info from ffprobe.
+			print(probe_stdout.decode(errors='replace'))
+		if self.print_scan_time is True:
+			print('\n"', self.in_path, '"', sep='')
+			print(Render.terminal_render_timer(start_time, end_time, operation_keyword=' to scan'))
+		
+		if probe is None:
+			if self.print_all_info is True:
+				print(f'\nError, a problem occurred with metadata acquisition:')
+				print(f'Terminal input command: ffprobe -show_entries {_PROBE_ENTRIES} "{self.in_path}"\n'
+				      f'{probe_stderr.decode(errors="replace")}')
+			return {}
+		return probe
+	
+	@staticmethod
+	def clear_probe_cache():
+		"""This method clears every cached ffprobe scan (files that changed are scanned again anyway,
+		this is only needed to free the memory.)"""
+		with _PROBE_CACHE_LOCK:
+			_PROBE_CACHE.clear()
+	
+	@staticmethod
+	def prefetch_probes(in_paths, max_workers=8):
+		"""This method runs probe_all for every path in in_paths at the same time (each scan is a separate ffprobe
+		process so this overlaps their startup time) so later probe_all calls for those files use the cached scan.\n
+		Paths that aren't files are skipped (the error is printed when they're actually used.)"""
+		in_file_paths = [paths.Path(in_path) for in_path in in_paths if paths.Path(in_path).is_file()]
+		if len(in_file_paths) < 2:
+			return
+		from concurrent.futures import ThreadPoolExecutor
+		
+		with ThreadPoolExecutor(max_workers=min(max_workers, len(in_file_paths))) as executor:
+			# list() waits for every scan to finish.
+			list(executor.map(lambda in_path: MetadataAcquisition(in_path).probe_all(), in_file_paths))
+	
+	@staticmethod
+	def batch_return_metadata(in_paths, max_parallel=None, **metadata_keywords):
+		"""This method runs return_metadata(**metadata_keywords) for every path in in_paths at the same time
+		and returns a list of the results in the same order as in_paths,
+		e.g. batch_return_metadata(in_paths, title=1, duration=2) = [[title, duration], [title, duration], ...]\n
+		max_parallel is how many files are scanned at once (default is the number of CPU cores) so it can be lowered
+		if the files are on slow storage."""
+		from concurrent.futures import ThreadPoolExecutor
+		
+		in_paths = list(in_paths)
+		if in_paths == []:
+			return []
+		# Threads are enough because the scanning is done by the ffprobe/ffmpeg child processes.
+		with ThreadPoolExecutor(max_workers=min(max_parallel or os.cpu_count(), len(in_paths))) as executor:
+			return list(executor.map(
+				lambda in_path: MetadataAcquisition(in_path).return_metadata(**metadata_keywords), in_paths))
+	
+	def return_bundle(self, streams=True, duration=True, max_volume=True):
+		"""This method returns a dictionary of the stream types ("stream_types", see return_stream_types),
+		duration in seconds ("duration") and max volume string ("max_volume", e.g. "-3.2 dB") of the input
+		with as few scans as possible.
+
+		The stream types and duration come from the same ffprobe scan and the max volume needs one ffmpeg scan
+		(which is skipped when the input is known to not have any audio.) Values not requested are None."""
+		
+		self.is_type_or_print_err_and_quit(streams, bool, 'streams')
+		self.is_type_or_print_err_and_quit(duration, bool, 'duration')
+		self.is_type_or_print_err_and_quit(max_volume, bool, 'max_volume')
+		
+		bundle = {'stream_types': None, 'duration': None, 'max_volume': None}
+		if streams is True or duration is True:
+			probe = self.probe_all()
+			if streams is True:
+				bundle['stream_types'] = MetadataAcquisition._stream_types_from_probe(probe)
+			if duration is True:
+				try:
+					bundle['duration'] = float(probe['format']['duration'])
+				except (KeyError, ValueError):
+					pass
+		
+		if max_volume is True:
+			# There's no audio to scan so there isn't a max volume.
+			if bundle['stream_types'] is not None and 'Audio' not in bundle['stream_types']:
+				return bundle
+			# Confirm file exists (it will quit if it doesn't.)
+			self._check_file_exists()
+			# Only the audio is decoded.
+			vol_cmd = ['ffmpeg', '-i', self.in_path, '-vn', '-sn', '-dn', '-af', 'volumedetect',
+			           '-f', 'null', _NULL_KEYWORD, '-hide_banner']
+			bundle['max_volume'] = self._find_meta_value(self._term_return_file_info(vol_cmd), 'max_volume')
+		return bundle
+	
+	def return_silence(self, noise='-60dB'):
+		"""This method scans the input audio and returns a list of (start_sec, end_sec) tuples for every section
+		quieter than noise (end_sec is None if the silence lasts until the end of the input.)"""
+		
+		self.is_type_or_print_err_and_quit(noise, str, 'noise')
+		# Confirm file exists (it will quit if it doesn't.)
+		self._check_file_exists()
+		# Only the audio is decoded.
+		silence_cmd = ['ffmpeg', '-i', self.in_path, '-vn', '-sn', '-dn', '-af', f'silencedetect=n={noise}:d=0',
+		               '-f', 'null', _NULL_KEYWORD, '-hide_banner']
+		
+		silence_list = []
+		for start_or_end, sec in _SILENCE_RE.findall(self._term_return_file_info(silence_cmd)):
+			if start_or_end == 'start':
+				silence_list.append([float(sec), None])
+			elif silence_list:
+				silence_list[-1][1] = float(sec)
+		return [tuple(silence) for silence in silence_list]
+	
 	def return_stream_types(self):
 		"""This method returns the type of input streams in order of their index."""
 		
-		# Get one long string of all the info about the input file then split that into a list.
-		strm_types = self.return_metadata(every_stream_info=1)[0]
-		try:
-			strm_types = strm_types.splitlines()
-			# List of the stream types from the input.
-			strm_types_list = []
-			for strm in strm_types:
-				for stream_str_index in range(len(strm)):
-					if strm[stream_str_index:stream_str_index + 5] == 'Video':
-						if strm[-14:] == '(attached pic)':
-							strm_types_list.append('Artwork')
-							break
-						else:
-							strm_types_list.append('Video')
-							break
-					elif strm[stream_str_index:stream_str_index + 5] == 'Audio':
-						strm_types_list.append('Audio')
-						break
-					elif strm[stream_str_index:stream_str_index + 4] == 'Data':
-						strm_types_list.append('Chapter')
-						break
-					# If the stream is a subtitle then "restart" the loop and get the language before the "Stream" keyword.
-					elif strm[stream_str_index:stream_str_index + 8] == 'Subtitle':
-						for ffmpeg_strm_index, ffmpeg_strm_str in enumerate(strm):
-							if ffmpeg_strm_str == '(':
-								strm_types_list.append(f'Subtitle={strm[ffmpeg_strm_index + 1:ffmpeg_strm_index + 4]}')
-								break
-					else:
-						pass
-			return strm_types_list
-		except AttributeError:
+		strm_types = MetadataAcquisition._stream_types_from_probe(self.probe_all())
+		if strm_types is None:
+			# ffprobe's JSON couldn't be read so fall back to the streams listed in the (cached) file info.
+			strm_types = MetadataAcquisition._stream_types_from_info(self._term_return_file_info())
+		return strm_types
+	
+	@staticmethod
+	def _stream_types_from_info(file_info):
+		"""Convert the "Stream #0:1(eng): Audio: ..." lines from ffprobe's file info into the same list of stream types
+		as _stream_types_from_probe (or None if there aren't any streams listed.)"""
+		
+		strm_types_list = []
+		for _, strm_lang, strm_type, strm_details in _STREAMTYPE_RE.findall(file_info):
+			plain_strm_type = _PLAIN_STRM_TYPES.get(strm_type.lower())
+			if plain_strm_type is not None:
+				strm_types_list.append(plain_strm_type)
+			elif strm_type == 'Video':
+				strm_types_list.append('Artwork' if '(attached pic)' in strm_details else 'Video')
+			else:
+				strm_types_list.append(f"Subtitle={strm_lang or 'und'}")
+		if strm_types_list == []:
+			return None
+		return strm_types_list
+	
+	@staticmethod
+	def _stream_types_from_probe(probe):
+		"""Convert the dictionary from probe_all into a list of the stream types in order of their index
+		("Video", "Audio", "Artwork", "Chapter" or "Subtitle=xxx" with the subtitle language.)\n
+		Returns None if the probe doesn't have any stream info."""
+		
+		if 'streams' not in probe:
 			return None
+		# List of the stream types from the input.
+		strm_types_list = []
+		for strm in probe['streams']:
+			codec_type = strm.get('codec_type')
+			plain_strm_type = _PLAIN_STRM_TYPES.get(codec_type)
+			if plain_strm_type is not None:
+				strm_types_list.append(plain_strm_type)
+			elif codec_type == 'video':
+				# Artwork is stored as a video stream with only one (attached) picture.
+				if strm.get('disposition', {}).get('attached_pic') == 1:
+					strm_types_list.append('Artwork')
+				else:
+					strm_types_list.append('Video')
+			# Subtitles include the language so they can be matched with the subtitle files.
+			elif codec_type == 'subtitle':
+				strm_types_list.append(f"Subtitle={strm.get('tags', {}).get('language', 'und')}")
+		return strm_types_list
 	
 	def extract_metadata_txt_file(self):
 		"""This method extracts all the metadata from the input file into an output text file."""
@@ -270,11 +579,9 @@ class MetadataAcquisition(VerifyInputType):
 		MetadataAcquisition(self.in_path, self.print_all_info, self.print_scan_time,
 		                    self.print_meta_value)._check_file_exists()
 		
-		ren_meta_txt_file = paths.Path.joinpath(self.in_path.parent, self.in_path.stem + '-METADATA.txt')
+		ren_meta_txt_file = self._parent / (self._stem + '-METADATA.txt')
 		ren_meta_txt_file_cmd = ['ffmpeg', '-i', self.in_path, '-f', 'ffmetadata', '-hide_banner', ren_meta_txt_file]
 
-		ren_meta_txt_file = paths.Path(ren_meta_txt_file)
-
 		if ren_meta_txt_file.exists():
 			ren_meta_txt_file.unlink()
 
@@ -289,220 +596,50 @@ class MetadataAcquisition(VerifyInputType):
 			and return the equivalent subtitle language keyword for a ffmpeg command.\n
 			e.g., "File Name-.en.vtt returns "eng" (english subtitles) = '-metadata:s:s: language=eng'\n
 		if check_file is False return the dictionary."""
-
-		self.is_type_or_print_err_and_quit(type(check_file), bool, 'check_file')
 		
-		# Dictionary that holds a subtitle file extension which represents the language and the keyword
-		# so ffmpeg can assign the metadata for that file to the correct language.
-		# File_Name-.en.vtt
-		# '-metadata:s:s: language=eng'
-		lang_dict = dict([
-			# English
-			('en', 'eng'),
-			('en-CA', 'eng'),
-			('en-GB', 'eng'),
-			('en-US', 'eng'),
-			# Chinese
-			('zh-Hans', 'zho'),
-			('zh-Hant', 'zho'),
-			('zh-TW', 'zho'),
-			# Vietnamese
-			('vi', 'vie'),
-			# Catalan
-			('ca', 'cat'),
-			# Italian
-			('it', 'ita'),
-			# Hebrew
-			('iw', 'heb'),
-			# Arabic
-			('ar', 'ara'),
-			# Czech
-			('cs', 'ces'),
-			# Estonian
-			('et', 'est'),
-			# Indonesian
-			('id', 'ind'),
-			# Spanish
-			('es', 'spa'),
-			('es-419', 'spa'),
-			# Russian
-			('ru', 'rus'),
-			# Dutch
-			('nl', 'nld'),
-			# Portuguese
-			('pt', 'por'),
-			# Norwegian
-			('no', 'nor'),
-			# Turkish
-			('tr', 'tur'),
-			# Lithuanian
-			('lt', 'lit'),
-			# Thai
-			('th', 'tha'),
-			# Romanian
-			('ro', 'ron'),
-			# Polish
-			('pl', 'pol'),
-			# French
-			('fr', 'fra'),
-			# Bulgarian
-			('bg', 'bul'),
-			# Ukrainian
-			('uk', 'ukr'),
-			# Slovenian
-			('sl', 'slv'),
-			# Croatian
-			('hr', 'hrv'),
-			# Hungarian
-			('hu', 'hun'),
-			# Portuguese
-			('pt-BR', 'por'),
-			# Finnish
-			('fi', 'fin'),
-			# Danish
-			('da', 'dan'),
-			# Japanese
-			('ja', 'jpn'),
-			# Serbian
-			('sr', 'srp'),
-			# Korean
-			('ko', 'kor'),
-			# Swedish
-			('sv', 'swe'),
-			# Slovak
-			('sk', 'slk'),
-			# German
-			('de', 'deu'),
-			# Malay
-			('ms', 'msa'),
-			# Greek/Modern
-			# ('--', '---'),
-		])
-
-		if check_file is True:
-			try:
-				# Return the the second to last suffix which says which language the subtitles are.
-				# File Name."en".vtt
-				# (It's the second to last because if there's a "." in the file name that will be included in the suffixes list.)
-				# The file suffixes will be a list ['.en', '.vtt'] with ".en" used for this example.
-				# Select the file's second to last suffix [:-1] = ['.en'],
-				# the first (and only) element of that list which is a string of the desired suffix [0] = '.en',
-				# remove the first character from that string (the "." which says it's an extension) [1:] = 'en',
-				# and return the value for the 'en' key from the lang_dict.
-				return lang_dict[self.in_path.suffixes[:-1][0][1:]]
-			except KeyError:
+		# (check_file isn't type checked since this is called for every subtitle file and it's only used internally.)
+		if check_file is False:
+			return _SUB_LANG_MAP
+		else:
+			# Return the the second to last suffix which says which language the subtitles are.
+			# File Name."en".vtt
+			# (It's the second to last because if there's a "." in the file name that will be included in the suffixes list.)
+			# The file suffixes will be a list ['.en', '.vtt'] with ".en" used for this example, so the second to last
+			# suffix without the "." at the beginning is the key for the language.
+			lang_keyword = _SUB_LANG_MAP.get(self._suffixes[-2][1:]) if len(self._suffixes) > 1 else None
+			if lang_keyword is None:
 				if self.print_all_info is True or self.print_meta_value is True:
 					print(f'Error, unknown language found for input "{self.in_path}"')
 				return False
-		elif check_file is False:
-			return lang_dict
+			return lang_keyword
 
 	def _find_meta_value(self, filter_output, keyword):
 		"""Filter ffmpeg/ffprobe output to locate info about a file and return the "keyword" value if it was found."""
-		# Empty list of metadata value(s) to return.
-		return_metadata_value_list = []
-
 		if self.print_all_info is True:
 			print('\n' + filter_output, end='')
 
-		# Boolean value stating if the metadata keyword value was found in the file at all.
-		keyword_value_exists = keyword in filter_output
-
-		# If the metadata keyword value isn't in the input file then print an error.
-		if keyword_value_exists is False:
-			if self.print_meta_value is True:
-					print(f'\nError, metadata value "{keyword}" not found.')
-			return None
-		
-		# The metadata keyword was found so append that value to return_metadata_value_list.
-		# Create a list where each line in filter_output is an element, then remove all of the file info before that.
-		file_info_after_keyword_list = filter_output.split(keyword, 1)[1].split('\n')
-		# Add ' ' to the list so it's sure to iterate through the whole list.
-		file_info_after_keyword_list.append(' ')
-		# Empty string that will be replaced with the value of the specified metadata keyword.
-		# (if the keyword is "title" then keyword_value will become something like "Song title"
-		keyword_value = ''
-		complete_key_value = ''
-		
-		# For loop going over every string in file_info_after_keyword_list
-		#   to return metadata values that span more than one line.
-		for info_after_key_list_index, info_line_str, in enumerate(file_info_after_keyword_list):
-			# For loop that goes over every character in the filter_output line
-			# (which starts at the line where the metadata keyword was found.)
-			for info_line_str_index, info_line_str_value, in enumerate(info_line_str):
-				# The "Stream" keyword has the index info before the : so don't start after:
-				# Stream [AFTER HERE]#0:1(und): Audio: aac...
-				if keyword == 'Stream':
-					# The first input starts like " #0:1(und): Audio: aac..." so to start begin at #.
-					if info_line_str_value == '#':
-						keyword_value = info_line_str[info_line_str_index + 1:] + '\n'
-						complete_key_value += keyword_value
-						break
-					# See if the current line starts with "Stream" and if so get the info from it.
-					elif info_line_str[info_line_str_index:info_line_str_index + 6] == 'Stream':
-						keyword_value = info_line_str[info_line_str_index + 8:] + '\n'
-						complete_key_value += keyword_value
-						break
-					# The loop got to ' ' so if it looped again it would terminate without
-					# adding the value(s) to the list, so add the Stream info to the return list
-					# and stop the loop by clearing the lines list and string.
-					elif info_after_key_list_index + 1 == len(file_info_after_keyword_list):
-						if self.print_meta_value is True:
-							print(f'\n{keyword}(s):\n{complete_key_value[:-1]}', end='')
-						return_metadata_value_list.append(complete_key_value)
-						file_info_after_keyword_list.clear()
-						break
-					elif info_line_str_value != ' ':
-						break
-				
-				elif keyword == 'crop':
-					if info_line_str[info_line_str_index:info_line_str_index + 4] == 'crop':
-						keyword_value = info_line_str[info_line_str_index + 5:]
-						if self.print_meta_value is True:
-							# Don't print the "\n" on the end of the string.
-							print(f'{keyword}:\n{keyword_value}', end='')
-						return_metadata_value_list.append(keyword_value)
-						file_info_after_keyword_list.clear()
-						break
+		if keyword == 'Stream':
+			# Every "Stream #0:1(und): Audio: aac..." line without the "Stream #" at the beginning.
+			strm_lines = _STREAM_RE.findall(filter_output)
+			keyword_value = ''.join(strm_line + '\n' for strm_line in strm_lines) if strm_lines != [] else None
+		else:
+			# crop, max_volume and Duration have their own patterns, otherwise match a "keyword : value" line.
+			keyword_re = _META_VALUE_RES.get(keyword)
+			if keyword_re is None:
+				keyword_re = re.compile(rf'{re.escape(keyword)}\s*:\s*(.*)')
+			keyword_match = keyword_re.search(filter_output)
+			keyword_value = keyword_match.group(1).strip() if keyword_match is not None else None
+			if keyword == 'Duration' and keyword_value is not None:
+				# Remove the leading zeros so an input less than an hour long is "03:25.12" instead of "00:03:25.12".
+				keyword_value = keyword_value.lstrip('0')
+				if keyword_value[:1] == ':':
+					keyword_value = keyword_value[1:]
+			if keyword_value == '':
+				keyword_value = None
 
-				# ffprobe returns excess spaces (which ffprobe uses to center values when printing)
-				# so scan the line string until a : is encountered because the actual value begins after that.
-				elif info_line_str_value == ':':
-					keyword_value = keyword_value + info_line_str[info_line_str_index + 2:] + '\n'
-					break
-				
-				# If the metadata value spans multiple lines then there will only be spaces between
-				# each line with a : before the value of each line.
-				# (description  : Description Line 1\n      : Description Line 2\n     [HERE]purl    :)
-				# however if a different character is encountered then that's the beginning of the next metadata
-				# keyword returned (see [HERE],) so ignore all characters for that line onward by clearing
-				# the list because the complete value for the keyword has been saved in complete_keyword_value.
-				# Plus if self.print_meta_value is True print the metadata value keyword followed by the value.
-				elif info_line_str_value != ' ':
-					complete_keyword_value = keyword_value.rstrip('\n')
-					if keyword == 'start' or keyword == 'Duration':
-						# The bitrate is specified after the timecode so split list at the comma and use first string in
-						# list. (0.023021[HERE], bitrate: 122 kb/s)
-						complete_keyword_value = complete_keyword_value.split(',')
-						complete_keyword_value = complete_keyword_value[0].lstrip('0')
-					# The metadata value wasn't found so print Null and/or return None.
-					if keyword == 'Duration':
-						# The duration returns an extra colon at the beginning because the input is not at least one
-						# hour in length so remove it.
-						if complete_keyword_value[:1] == ':':
-							complete_keyword_value = complete_keyword_value[1:]
-					if complete_keyword_value == '':
-						if self.print_meta_value is True:
-							print(f'{keyword}:\nError, metadata value "{keyword}" not found.')
-						return_metadata_value_list.append(None)
-					else:
-						if self.print_meta_value is True:
-							print(f'\n{keyword}:\n{complete_keyword_value}', end='')
-						return_metadata_value_list.append(complete_keyword_value)
-						file_info_after_keyword_list.clear()
-						break
 		if self.print_meta_value is True:
-			print()
-		# I think this only does one keyword at a time so return that one item
-		# because I don't want to redo everything right now.
-		return return_metadata_value_list[0]
+			if keyword_value is None:
+				print(f'\nError, metadata value "{keyword}" not found.')
+			else:
+				print(f'\n{keyword}:\n{keyword_value}')
+		return keyword_value
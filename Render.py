@@ -1,17 +1,110 @@
+import contextlib
+import os
 import pathlib as paths
-import subprocess as sub
 import time
 
-# NOTE: the FileOperations class is imported below.
+# NOTE: subprocess and the FileOperations class are imported inside the methods that use them
+# so importing this module (e.g. for a short lived command line call) stays cheap.
+
+# Both concrete path types so one isinstance call can confirm a path is valid.
+_PATH = (paths.PosixPath, paths.WindowsPath)
+# The terminal keyword to open a file with its default application ("start" on Windows, otherwise "open").
+_OPEN_KW = 'start' if os.name == 'nt' else 'open'
+# '-movflags +faststart' only does something for these (MP4 style) outputs, for anything else it's wasted work.
+_FASTSTART_EXTS = ('.mp4', '.m4a', '.mov')
+# Metadata tags ffmpeg writes for the container itself (the output gets its own so they don't need to be copied.)
+_CONTAINER_TAGS = frozenset({'major_brand', 'minor_version', 'compatible_brands', 'encoder'})
+# The suffix for a singular (index False/0) or plural (index True/1) unit of time in terminal_render_timer.
+_PLURAL = ('', 's')
+# The most bytes of a render's stderr that are kept (a long render's progress output could be huge otherwise.)
+_STDERR_TAIL_BYTES = 1024 * 1024
+# How many bytes of stderr are read at a time.
+_STDERR_CHUNK_BYTES = 64 * 1024
+
+
+@contextlib.contextmanager
+def _advise_sequential(in_paths):
+	"""Context manager that tells the OS the input file(s) will be read from start to finish (so it reads further ahead)
+	and afterwards that they're no longer needed (so they don't push other files out of the page cache.)\n
+	This only does something on systems with posix_fadvise (Linux), otherwise it does nothing."""
+	file_descriptors = []
+	if hasattr(os, 'posix_fadvise'):
+		for in_path in in_paths:
+			try:
+				file_descriptor = os.open(in_path, os.O_RDONLY)
+			except OSError:
+				continue
+			file_descriptors.append(file_descriptor)
+			os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+	try:
+		yield
+	finally:
+		for file_descriptor in file_descriptors:
+			os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_DONTNEED)
+			os.close(file_descriptor)
+
+
+def _drain_stderr(stderr_pipe, stderr_tail):
+	"""Read a render's stderr pipe into the stderr_tail bytearray until the render closes it
+	(so the pipe never fills up and blocks ffmpeg.) Only the last _STDERR_TAIL_BYTES are kept, counted in bytes
+	instead of lines because ffmpeg's progress stats are separated by "\\r" so a whole render could be one "line"."""
+	with stderr_pipe:
+		for chunk in iter(lambda: stderr_pipe.read1(_STDERR_CHUNK_BYTES), b''):
+			stderr_tail += chunk
+			if len(stderr_tail) > _STDERR_TAIL_BYTES:
+				del stderr_tail[:len(stderr_tail) - _STDERR_TAIL_BYTES]
+
+
+class RenderPool:
+	"""A pool of worker threads that renders queued commands in the background so the next command can be built
+	(and scanned with ffprobe) while ffmpeg is still rendering the previous one.\n
+	Pass it to FileOperations(..., pool=RenderPool()) or Render(..., pool=pool) and the render methods will return a
+	Future instead of waiting for the render to finish. Call join() to wait for everything that was submitted."""
+	def __init__(self, max_workers=None):
+		from concurrent.futures import ThreadPoolExecutor
+		
+		# The work is done by the ffmpeg child processes so threads are enough to keep several of them running.
+		self._executor = ThreadPoolExecutor(max_workers=max_workers or os.cpu_count())
+		# Every Future that hasn't been joined yet.
+		self._futures = []
+	
+	def submit(self, render_method, *args, **kwargs):
+		"""Queue a render method to run in the pool and return its Future."""
+		future = self._executor.submit(render_method, *args, **kwargs)
+		self._futures.append(future)
+		return future
+	
+	def join(self):
+		"""Wait for every submitted render to finish and return their results in the order they were submitted."""
+		results = [future.result() for future in self._futures]
+		self._futures = []
+		return results
+	
+	def shutdown(self):
+		"""Wait for every submitted render to finish then stop the worker threads."""
+		self._executor.shutdown(wait=True)
+	
+	def __enter__(self):
+		return self
+	
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.shutdown()
+		return False
+
 
 class Render:
 	"""This class runs the terminal command to achieve the desired output."""
 	def __init__(self, input_path__pathlib_object_or_list, out_file_or_out_list, render_cmd, print_success=True,
-				 print_err=True, print_ren_info=False, print_ren_time=True, open_after_ren=False):
+				 print_err=True, print_ren_info=False, print_ren_time=True, open_after_ren=False, pool=None,
+				 tmpfs_dir=None):
+		"""tmpfs_dir can be a path to a RAM backed directory (e.g. pathlib.Path('/dev/shm') on Linux) to render into
+		when the output has to be rendered again to embed the original metadata, so only the final output is written to
+		the drive. It's only used for one input and one output that will fit in it (see
+		_ren_in_tmpfs_then_embed_metadata), the default None always renders to the output directory."""
 		# Path to input file or list.
 		self.in_path = input_path__pathlib_object_or_list
 		# Path to output file (for printing success/error messages) but can be a list for multiple outputs.
-		if type(out_file_or_out_list) is not list:
+		if not isinstance(out_file_or_out_list, list):
 			self.out_paths_list = [out_file_or_out_list]
 		else:
 			self.out_paths_list = out_file_or_out_list
@@ -29,21 +122,52 @@ class Render:
 		self.print_ren_time = print_ren_time
 		# Toggle opening the file in the default application after it finishes rendering.
 		self.open_after_ren = open_after_ren
+		# Optional RenderPool to render in the background (the render methods then return a Future.)
+		self.pool = pool
+		# Directory in RAM to render the output into before the metadata is embedded (None to render to the drive.)
+		self.tmpfs_dir = tmpfs_dir
 
 	def check_depend_then_ren(self, append_faststart=True):
 		"""Confirm the file dependencies exist, and if they do then call run_terminal_cmd.\n
 		append_faststart is an option to optimize video playback,
 		but if the command is for AtomicParsley omit this option."""
 		
+		# Render in the background if there's a pool.
+		if self.pool is not None:
+			return self._submit_to_pool(self.check_depend_then_ren, append_faststart=append_faststart)
+		
+		self._check_depend()
+		exists_result = self.run_terminal_cmd(append_faststart=append_faststart)
+		return exists_result
+	
+	async def check_depend_then_ren_async(self, append_faststart=True):
+		"""Async version of check_depend_then_ren so multiple renders can run at the same time from one event loop
+		(e.g. with asyncio.gather.)"""
+		
+		self._check_depend()
+		exists_result = await self.run_terminal_cmd_async(append_faststart=append_faststart)
+		return exists_result
+	
+	def _check_depend(self):
+		"""Local method to confirm the input path(s) exist and the output path(s) don't, otherwise print an error and quit."""
+		
 		# Make input a list (if it isn't already one) to use in a for loop.
-		if type(self.in_path) is not list:
+		if not isinstance(self.in_path, list):
 			input_path_list = [self.in_path]
 		else:
 			input_path_list = self.in_path
+		# Convert the input(s) to paths once (most callers already pass pathlib paths so those are reused as is.)
+		# Only concrete paths are reused because pure paths (PurePosixPath etc.) can't check .exists() or .is_file().
+		# (The class is looked up once instead of for every input.)
+		path_type = paths.Path
+		input_path_list = [in_path if isinstance(in_path, path_type) else path_type(in_path)
+		                   for in_path in input_path_list]
+		# Save the converted list back so the embed method can use self.in_path[0] without converting it again.
+		if isinstance(self.in_path, list):
+			self.in_path = input_path_list
 		
 		# Confirm input path(s) exist.
 		for in_path in input_path_list:
-			in_path = paths.Path(in_path)
 			if in_path.exists() is False:
 				print(f'Error, input file, "{in_path}" not found.')
 				quit()
@@ -51,16 +175,16 @@ class Render:
 				print(f'Error, input "{in_path}" is not a file.')
 				quit()
 		
-		# Confirm the output file doesn't already exist, and if it doesn't then render.
+		# Confirm the output file doesn't already exist.
 		for out_path in self.out_paths_list:
 			if out_path.is_file():
 				print(f'Error, target output file, "{out_path}" already exists.')
 				quit()
-			elif out_path.parent.exists() is False:
-				print(f'Error, "{out_path.parent}" is not a valid output directory.')
-				quit()
-		exists_result = self.run_terminal_cmd(append_faststart=append_faststart)
-		return exists_result
+			else:
+				out_dir = out_path.parent
+				if out_dir.exists() is False:
+					print(f'Error, "{out_dir}" is not a valid output directory.')
+					quit()
 	
 	def run_terminal_cmd(self, append_hide_banner=True, append_faststart=True):
 		"""This method runs the actual command to render the output within the terminal.\n
@@ -68,48 +192,94 @@ class Render:
 		AtomicParsley is used once there's an option to set append_hide_banner to False.\n
 		append_faststart is an option to optimize video playback, so if the output file is
 		something other than a video then specify append_faststart=False in the method call."""
-		# Potentially add keywords to render command.
-		if append_hide_banner is True:
-			self.ren_cmd.append('-hide_banner')
-		if append_faststart is True:
-			self.ren_cmd += ('-movflags', '+faststart')
+		import subprocess as sub
+		import threading
+		
+		ren_cmd = self._return_ren_cmd_with_keywords(append_hide_banner, append_faststart)
 		# Run the actual terminal command and keep a timer for how long it takes to render.
-		try:
-			# Start of timer.
-			start_time = time.perf_counter()
-			# Render process.
-			render_process = sub.run(self.ren_cmd, stdout=sub.PIPE, stderr=sub.PIPE, universal_newlines=True)
-			# Stop timer.
-			end_time = time.perf_counter()
-			# Check command output and potentially print more info.
-			sub.CompletedProcess.check_returncode(render_process)
-			if self.print_ren_info is True and self.out_paths_list[0].exists():
-				print(f'\n{render_process.stderr}', end='')
-			# Print what the output is supposed to be since AtomicParsley
-			# was used and the actual output overwrote a temporary file.
-			if self.print_success is True and append_faststart is False and append_hide_banner is False:
-				for out_path in self.out_paths_list:
-					print(f'"{out_path}" was rendered successfully!')
-			elif self.print_success is True and self.out_paths_list[0].exists():
-				for out_path in self.out_paths_list:
-					print(f'"{out_path}" was rendered successfully!')
-			if self.print_ren_time is True:
-				# Run method to get the text to print how long it took to render.
-				duration = Render.terminal_render_timer(start_time, end_time)
-				print(duration)
-			# If self.open_after_ren is True then open the output file in the default application.
-			Render._check_open_after_ren(self)
-			# Return True (it worked.)
-			return True
+		# Start of timer.
+		start_time = time.perf_counter()
+		# Render process.
+		with _advise_sequential(self.in_path if isinstance(self.in_path, list) else [self.in_path]):
+			# close_fds=False lets subprocess use the faster vfork/posix_spawn path
+			# (Python's own file descriptors aren't inheritable anyway.)
+			# stderr is read by a separate thread that only keeps the end of it so memory use doesn't grow with the
+			# length of the render, and it's kept as bytes that are only decoded if printed (see _check_ren_result.)
+			render_process = sub.Popen(ren_cmd, stdout=sub.DEVNULL, stderr=sub.PIPE, close_fds=False)
+			stderr_tail = bytearray()
+			drain_thread = threading.Thread(target=_drain_stderr, args=(render_process.stderr, stderr_tail), daemon=True)
+			drain_thread.start()
+			render_process.wait()
+			drain_thread.join()
+		# Stop timer.
+		end_time = time.perf_counter()
+		return self._check_ren_result(ren_cmd, render_process.returncode, bytes(stderr_tail), start_time, end_time,
+		                              append_hide_banner, append_faststart)
+	
+	async def run_terminal_cmd_async(self, append_hide_banner=True, append_faststart=True):
+		"""Async version of run_terminal_cmd (the render is a subprocess of the event loop instead of blocking.)"""
+		import asyncio
+		
+		ren_cmd = self._return_ren_cmd_with_keywords(append_hide_banner, append_faststart)
+		start_time = time.perf_counter()
+		render_process = await asyncio.create_subprocess_exec(*[str(cmd_word) for cmd_word in ren_cmd],
+		                                                      stdout=asyncio.subprocess.DEVNULL,
+		                                                      stderr=asyncio.subprocess.PIPE, close_fds=False)
+		_, stderr = await render_process.communicate()
+		end_time = time.perf_counter()
+		return self._check_ren_result(ren_cmd, render_process.returncode, stderr, start_time, end_time,
+		                              append_hide_banner, append_faststart)
+	
+	def _return_ren_cmd_with_keywords(self, append_hide_banner, append_faststart):
+		"""Local method to return a copy of the render command with the keywords potentially added to it
+		(self.ren_cmd isn't changed so running it again doesn't add the keywords twice.)"""
+		ren_cmd = list(self.ren_cmd)
+		if append_hide_banner is True:
+			# Only log errors (unless all the render info will be printed anyway) so ffmpeg doesn't spend time writing
+			# the banner, stream info and progress stats that are never read.
+			if self.print_ren_info is True:
+				quiet_cmd = ['-hide_banner']
+			else:
+				quiet_cmd = ['-hide_banner', '-loglevel', 'error', '-nostats']
+			# These are global options so put them right after the program name.
+			ren_cmd[1:1] = quiet_cmd
+		if append_faststart is True and paths.PurePath(self.out_paths_list[0]).suffix.lower() in _FASTSTART_EXTS:
+			ren_cmd += ('-movflags', '+faststart')
+		return ren_cmd
+	
+	def _check_ren_result(self, ren_cmd, returncode, stderr, start_time, end_time, append_hide_banner, append_faststart):
+		"""Local method to print the result of a finished render and return True if it worked, otherwise False.\n
+		ren_cmd is the command that was run and stderr is the render's stderr bytes (it's only decoded if it's printed.)"""
+		
 		# The rendering failed, so probably print an error message.
-		except sub.CalledProcessError:
+		if returncode != 0:
 			if self.print_err is True:
 				# Return False (it didn't work).
 				print('\nError, a problem occurred while rendering:')
-				print(f'Terminal input command: {self.ren_cmd}')
-				print(render_process.stderr)
+				print(f'Terminal input command: {ren_cmd}')
+				print(stderr.decode(errors='replace'))
 				print()
 			return False
+		
+		# Check command output and potentially print more info.
+		if self.print_ren_info is True and self.out_paths_list[0].exists():
+			print(f"\n{stderr.decode(errors='replace')}", end='')
+		# Print what the output is supposed to be since AtomicParsley
+		# was used and the actual output overwrote a temporary file.
+		if self.print_success is True and append_faststart is False and append_hide_banner is False:
+			for out_path in self.out_paths_list:
+				print(f'"{out_path}" was rendered successfully!')
+		elif self.print_success is True and self.out_paths_list[0].exists():
+			for out_path in self.out_paths_list:
+				print(f'"{out_path}" was rendered successfully!')
+		if self.print_ren_time is True:
+			# Run method to get the text to print how long it took to render.
+			duration = Render.terminal_render_timer(start_time, end_time)
+			print(duration)
+		# If self.open_after_ren is True then open the output file in the default application.
+		Render._check_open_after_ren(self)
+		# Return True (it worked.)
+		return True
 	
 	def check_depend_then_ren_and_embed_original_metadata(self, append_faststart=True, artwork=False,
 	                                                      copy_chapters=False):
@@ -118,62 +288,244 @@ class Render:
 		if artwork is True it will try to embed artwork from the input into the output specifically.
 		This may happen if ffmpeg tries to output artwork to the first stream of an audio only file."""
 		
-		# Run standard command to render output.
-		out_file_exists_result = self.check_depend_then_ren(append_faststart=append_faststart)
+		# Render in the background if there's a pool.
+		if self.pool is not None:
+			return self._submit_to_pool(self.check_depend_then_ren_and_embed_original_metadata,
+			                            append_faststart=append_faststart, artwork=artwork, copy_chapters=copy_chapters)
 		
-		if type(self.in_path) is list:
+		if isinstance(self.in_path, list):
 			in_meta_file = self.in_path[0]
 		else:
 			in_meta_file = self.in_path
 		
+		# Copy the original metadata in the render command itself if possible so the output doesn't have to be
+		# rendered a second time just to add the metadata.
+		metadata_fused = self._fuse_metadata_into_ren_cmd(in_meta_file, copy_chapters)
+		# If the original file doesn't have any metadata to copy then there's nothing to embed either.
+		if metadata_fused is False and artwork is False:
+			if self._has_metadata_to_embed(in_meta_file, copy_chapters) is False:
+				metadata_fused = True
+		
+		# The output has to be rendered again so render it into RAM first if possible.
+		if metadata_fused is False or artwork is True:
+			tmpfs_result = self._ren_in_tmpfs_then_embed_metadata(in_meta_file, append_faststart, artwork, copy_chapters,
+			                                                      metadata_fused)
+			if tmpfs_result is not None:
+				return tmpfs_result
+		
+		# Run standard command to render output.
+		out_file_exists_result = self.check_depend_then_ren(append_faststart=append_faststart)
+		
 		# If the output file exists then run the attempt_embed_metadata_silently method.
 		if out_file_exists_result is True:
+			# The metadata was already copied and there's no artwork to add so there's nothing left to do.
+			if metadata_fused is True and artwork is False:
+				return True
 			# NOTE: This import is down here to avoid an infinite import.
 			from FileOperations import FileOperations
+			import tempfile
 			# This will attempt to embed any metadata (mainly for artwork) from the original file into the output.
 			# (Due to how ffmpeg works, the artwork can't always be copied in one command.)
 			# Create temporary output file with the original metadata embedded, delete the original output without the metadata,
 			# and rename this temporary output to the desired output.
+			# The outputs that need AtomicParsley to embed the artwork (it's extracted once for all of them.)
+			atomic_out_paths = []
 			for out_path in self.out_paths_list:
-				temp_directory_to_embed_metadata = paths.Path().joinpath(out_path.parent,
-				                                                         '--temp_dir_to_embed_metadata_silently')
-				paths.Path.mkdir(temp_directory_to_embed_metadata)
-				temp_out_file = paths.Path().joinpath(temp_directory_to_embed_metadata, out_path.stem + out_path.suffix)
-				FileOperations(out_path, temp_directory_to_embed_metadata, False,
-				               self.print_ren_info, False, False).copy_over_metadata(in_meta_file, copy_chapters)
-				if temp_out_file.exists() is False:
-					if self.print_err is True:
+				# The temporary directory is in the output directory so renaming the temporary output to the output
+				# doesn't have to copy it to another drive, and it's removed even if something goes wrong.
+				with tempfile.TemporaryDirectory(prefix='--temp_dir_to_embed_metadata_silently',
+				                                 dir=out_path.parent) as temp_directory_to_embed_metadata:
+					temp_directory_to_embed_metadata = paths.Path(temp_directory_to_embed_metadata)
+					temp_out_file = temp_directory_to_embed_metadata / out_path.name
+					# Copy the metadata and artwork in one render if possible.
+					art_copied = FileOperations(out_path, temp_directory_to_embed_metadata, False, self.print_ren_info,
+					                            False, False).copy_metadata_and_artwork(in_meta_file, copy_chapters,
+					                                                                    metadata_fused is False, artwork)
+					# Replace the output in one step so there's never a moment without it.
+					if temp_out_file.exists():
+						temp_out_file.replace(out_path)
+					elif metadata_fused is False and self.print_err is True:
 						print(f'Error, input file to extract metadata silently from "{out_path}" not found.')
-					paths.Path(temp_directory_to_embed_metadata).rmdir()
-				else:
-					out_path.unlink()
-					temp_out_file.rename(out_path)
-				if artwork is True:
-					temp_art = FileOperations(in_meta_file, temp_directory_to_embed_metadata, False,
-								self.print_ren_info, False, False).extract_artwork()
-					if temp_art is not False:
-						if temp_art.exists():
-							FileOperations(out_path, temp_directory_to_embed_metadata, False,
-										   self.print_ren_info, False, False).embed_artwork(temp_art)
-							temp_art.unlink()
-							out_path.unlink()
-							temp_out_file.rename(out_path)
-				temp_directory_to_embed_metadata.rmdir()
-				return True
+					# The output needs AtomicParsley to embed the artwork so embed it separately.
+					if art_copied is False:
+						atomic_out_paths.append(out_path)
+			if atomic_out_paths != []:
+				self._embed_original_artwork_in_place(in_meta_file, atomic_out_paths)
+			return True
 
 		else:
 			# A problem occurred while rendering and no output file was created so quit.
 			return False
 
+	@staticmethod
+	def _has_metadata_to_embed(in_meta_file, copy_chapters):
+		"""Local method to return True if in_meta_file has any metadata tags (or chapters if copy_chapters is True)
+		to copy to the output, otherwise False (the scan is cached by MetadataAcquisition.)"""
+		# NOTE: This import is down here to avoid an infinite import.
+		from MetadataAcquisition import MetadataAcquisition
+		
+		probe = MetadataAcquisition(paths.Path(in_meta_file)).probe_all()
+		# ffprobe couldn't read it so assume there's metadata (the embed render will print any error.)
+		if probe == {}:
+			return True
+		if any(tag.lower() not in _CONTAINER_TAGS for tag in probe.get('format', {}).get('tags', {})):
+			return True
+		return copy_chapters is True and probe.get('chapters', []) != []
+	
+	def _ren_in_tmpfs_then_embed_metadata(self, in_meta_file, append_faststart, artwork, copy_chapters, metadata_fused):
+		"""Local method to render the output into self.tmpfs_dir and then embed the metadata/artwork from in_meta_file
+		while copying it to the actual output (so the output without the metadata is never written to the drive.)\n
+		Returns None if it can't be done this way (no tmpfs_dir, more than one input or output, the output path isn't
+		the end of the command, the output size can't be estimated or it might not fit in RAM), otherwise True if it
+		worked or False if it didn't."""
+		import shutil
+		import tempfile
+		
+		if self.tmpfs_dir is None or len(self.out_paths_list) != 1 or self.ren_cmd[-1] != self.out_paths_list[0]:
+			return None
+		# With more than one input (or a concat list/protocol as the input) the output is the size of every input
+		# combined so it isn't estimated from in_meta_file.
+		if isinstance(self.in_path, list) and len(self.in_path) != 1:
+			return None
+		if 'concat' in self.ren_cmd or any(str(cmd_word).startswith('concat:') for cmd_word in self.ren_cmd):
+			return None
+		# The output is probably about the size of the input (times how many times it's looped with -stream_loop.)
+		out_size_multiplier = 1
+		if '-stream_loop' in self.ren_cmd:
+			loop_times = int(self.ren_cmd[self.ren_cmd.index('-stream_loop') + 1])
+			# -1 loops forever so the output size isn't known.
+			if loop_times < 0:
+				return None
+			out_size_multiplier += loop_times
+		# Only use RAM if it has twice the estimated output size free.
+		try:
+			est_out_size = paths.Path(in_meta_file).stat().st_size * out_size_multiplier
+			if est_out_size * 2 > shutil.disk_usage(self.tmpfs_dir).free:
+				return None
+		except OSError:
+			return None
+		out_path = self.out_paths_list[0]
+		
+		# NOTE: This import is down here to avoid an infinite import.
+		from FileOperations import FileOperations
+		
+		# Confirm the dependencies for the actual output before rendering to the temporary output instead.
+		self._check_depend()
+		print_success = self.print_success
+		open_after_ren = self.open_after_ren
+		with tempfile.TemporaryDirectory(dir=self.tmpfs_dir) as tmpfs_directory:
+			tmpfs_out_path = paths.Path(tmpfs_directory) / out_path.name
+			self.ren_cmd[-1] = tmpfs_out_path
+			self.out_paths_list = [tmpfs_out_path]
+			# The success message and opening the output are for the actual output once it's done.
+			self.print_success = False
+			self.open_after_ren = False
+			try:
+				ren_result = self.check_depend_then_ren(append_faststart=append_faststart)
+			finally:
+				self.ren_cmd[-1] = out_path
+				self.out_paths_list = [out_path]
+				self.print_success = print_success
+				self.open_after_ren = open_after_ren
+			if ren_result is not True:
+				return False
+			
+			# Render the output from RAM to the output directory with the metadata and artwork.
+			art_copied = FileOperations(tmpfs_out_path, out_path.parent, False, self.print_ren_info,
+			                            False, False).copy_metadata_and_artwork(in_meta_file, copy_chapters,
+			                                                                    metadata_fused is False, artwork)
+			# There was nothing to copy (or it didn't work) so just move the output out of RAM.
+			if out_path.exists() is False:
+				if metadata_fused is False and self.print_err is True:
+					print(f'Error, input file to extract metadata silently from "{out_path}" not found.')
+				shutil.move(tmpfs_out_path, out_path)
+		
+		# The output needs AtomicParsley to embed the artwork so extract it and embed it separately.
+		if art_copied is False:
+			self._embed_original_artwork_in_place(in_meta_file, [out_path])
+		
+		if self.print_success is True:
+			print(f'"{out_path}" was rendered successfully!')
+		Render._check_open_after_ren(self)
+		return True
+	
+	def _embed_original_artwork_in_place(self, in_meta_file, out_paths):
+		"""Local method to embed the artwork from in_meta_file into every path in out_paths for outputs ffmpeg can't
+		embed artwork in (.m4a/.m4v.) AtomicParsley changes each output directly so it doesn't have to be copied to a
+		temporary file and renamed, but it can only read the artwork from a file so that's extracted (once for every
+		output) to a temporary directory.\n
+		Returns True if it worked for every output, otherwise False."""
+		import tempfile
+		# NOTE: This import is down here to avoid an infinite import.
+		from FileOperations import FileOperations
+		
+		# (AtomicParsley's resized copies of the artwork are also written here so they're deleted with it.)
+		with tempfile.TemporaryDirectory() as temp_art_directory:
+			temp_art = FileOperations(in_meta_file, paths.Path(temp_art_directory), False,
+			                          self.print_ren_info, False, False).extract_artwork()
+			if temp_art is False or temp_art.exists() is False:
+				return False
+			embed_results = []
+			for out_path in out_paths:
+				atomic_parsley_cmd = ['AtomicParsley', out_path, '--artwork', 'REMOVE_ALL',
+				                      '--artwork', temp_art, '--overWrite']
+				embed_results.append(Render(in_meta_file, out_path, atomic_parsley_cmd, False, self.print_err,
+				                            self.print_ren_info, False).run_terminal_cmd(append_hide_banner=False,
+				                                                                         append_faststart=False))
+			return all(embed_results)
+	
+	async def check_depend_then_ren_and_embed_original_metadata_async(self, append_faststart=True, artwork=False,
+	                                                                  copy_chapters=False):
+		"""Async version of check_depend_then_ren_and_embed_original_metadata.\n
+		If the metadata can be copied in the render command itself then the render is awaited directly, otherwise
+		the renders to embed the metadata/artwork afterwards are run in a separate thread."""
+		import asyncio
+		
+		if isinstance(self.in_path, list):
+			in_meta_file = self.in_path[0]
+		else:
+			in_meta_file = self.in_path
+		
+		if artwork is False and self._fuse_metadata_into_ren_cmd(in_meta_file, copy_chapters) is True:
+			return await self.check_depend_then_ren_async(append_faststart=append_faststart)
+		return await asyncio.to_thread(self.check_depend_then_ren_and_embed_original_metadata,
+		                               append_faststart, artwork, copy_chapters)
+	
+	def _fuse_metadata_into_ren_cmd(self, in_meta_file, copy_chapters=False):
+		"""Add '-map_metadata 0' (and '-map_chapters -1' if copy_chapters is False) to self.ren_cmd so the metadata from
+		in_meta_file is copied while rendering instead of with another render afterwards.\n
+		This only works if in_meta_file is the first input, there's one output path at the end of the command,
+		and the command doesn't already choose what to do with the metadata. Returns True if the command was changed."""
+		
+		if len(self.out_paths_list) != 1 or '-i' not in self.ren_cmd or '-map_metadata' in self.ren_cmd:
+			return False
+		# The first input ("-i X") has to be the file to copy the metadata from because it's mapped as input 0.
+		if self.ren_cmd[self.ren_cmd.index('-i') + 1] != in_meta_file or self.ren_cmd[-1] != self.out_paths_list[0]:
+			return False
+		
+		meta_cmd = ['-map_metadata', '0']
+		if copy_chapters is False and '-map_chapters' not in self.ren_cmd:
+			meta_cmd += ('-map_chapters', '-1')
+		# Insert the options right before the output path.
+		self.ren_cmd[-1:-1] = meta_cmd
+		return True
+	
+	def _submit_to_pool(self, render_method, **kwargs):
+		"""Submit render_method to self.pool and return the Future.
+		The pool is cleared first so the render method actually renders when the pool runs it."""
+		pool = self.pool
+		self.pool = None
+		return pool.submit(render_method, **kwargs)
+	
 	@staticmethod
 	def terminal_render_timer(start, end, operation_keyword=''):
 		"""Determine the appropriate text for printing how long it took the terminal to render."""
 		
-		total_ren_dur = f'{start - end:0.2f}'.lstrip('-')
+		# How many seconds and hundredths of a second it took
+		# (rounded to hundredths first so e.g. 59.999 seconds is 1 minute and 0.00 seconds.)
+		seconds, hundredths = divmod(round(abs(end - start) * 100), 100)
 		# How many fractions of a second it took.
-		frac_sec = total_ren_dur[-3:]
-		# How many seconds it took.
-		seconds = int(total_ren_dur[:-3])
+		frac_sec = f'.{hundredths:02d}'
 		# Assign how many minutes it took to render by taking the total amount of seconds
 		# divided by 60 (60 seconds in a minute.)
 		minutes, seconds = divmod(seconds, 60)
@@ -188,18 +540,9 @@ class Render:
 			begin_word = 'Over the course of'
 		
 		# It will either be a singular or plural of minutes, hours, and seconds so print the correct one.
-		if hours == 1:
-			hours_plural = ''
-		else:
-			hours_plural = 's'
-		if minutes == 1:
-			minutes_plural = ''
-		else:
-			minutes_plural = 's'
-		if seconds == 1 and frac_sec == '.00':
-			seconds_plural = ''
-		else:
-			seconds_plural = 's'
+		hours_plural = _PLURAL[hours != 1]
+		minutes_plural = _PLURAL[minutes != 1]
+		seconds_plural = _PLURAL[seconds != 1 or hundredths != 0]
 		
 		# Strings to display the render duration.
 		total_sec = f'{seconds:d}{frac_sec} second{seconds_plural}{operation_keyword}.'
@@ -220,33 +563,36 @@ class Render:
 		"""Open the output file if self.open_after_ren=True.\n
 		If True then it opens with the default application, or if it's set to a string it attempts to open
 		it with the application specified in the string."""
-		
+		# The application to open the output(s) with (None to use the default application.)
+		custom_app = self.open_after_ren if isinstance(self.open_after_ren, str) else None
+		if custom_app is None and self.open_after_ren is not True:
+			return True
+		# (The class is looked up once instead of for every output.)
+		windows_path_type = paths.WindowsPath
 		for out_path in self.out_paths_list:
-			if type(self.open_after_ren) is str and type(out_path) == paths.WindowsPath:
+			if not isinstance(out_path, _PATH):
+				print("Error, output path is not a PosixPath or WindowsPath so it can't be opened automatically.")
+				quit()
+			if custom_app is not None and isinstance(out_path, windows_path_type):
 				print('Error, a custom application for opening a video after it finishes rendering is not available'
 				      ' for WindowsPath so self.open_after_ren must be True or False, not',
 				      self.open_after_ren)
 				return False
-			
-			# Determine which terminal keyword to use based on the path type.
-			elif self.open_after_ren is True or type(self.open_after_ren) is str:
-				# If the output path is a PosixPath then the keyword is "open" in the terminal.
-				if type(out_path) is paths.PosixPath:
-					open_keyword = 'open'
-				# If the output path is a WindowsPath then the keyword is "start" in the terminal.
-				elif type(out_path) is paths.WindowsPath:
-					open_keyword = 'start'
-				else:
-					print("Error, output path is not a PosixPath or WindowsPath so it can't be opened automatically.")
-					quit()
-				
-				# A custom application was specified to the Mac/Linux terminal to add that string to the command.
-				if type(self.open_after_ren) is str and type(out_path) == paths.PosixPath:
-					open_cmd = [open_keyword, '-a', str(self.open_after_ren), out_path]
-				# No specific application was specified so just open with the default application.
-				else:
-					open_cmd = [open_keyword, out_path]
-				
-				# Run terminal command to open the output file.
-				sub.run(open_cmd)
+		
+		# "start" can only open one file at a time (and it's a cmd builtin) so open each file directly on Windows.
+		if _OPEN_KW == 'start':
+			for out_path in self.out_paths_list:
+				os.startfile(out_path)
+			return True
+		import subprocess as sub
+		
+		# "open" can open every output at once so only one terminal command is run.
+		# A custom application was specified to the Mac/Linux terminal to add that string to the command.
+		if custom_app is not None:
+			open_cmd = [_OPEN_KW, '-a', custom_app, *self.out_paths_list]
+		# No specific application was specified so just open with the default application.
+		else:
+			open_cmd = [_OPEN_KW, *self.out_paths_list]
+		# Run terminal command to open the output file(s).
+		sub.run(open_cmd)
 		return True
@@ -1,28 +1,57 @@
+import functools
+import inspect
 import pathlib as paths
 
+# Both concrete path types so one isinstance call can confirm a path is valid (cross-platform.)
+_PATH_TYPES = (paths.PosixPath, paths.WindowsPath)
+# Text describing each type that can be checked for the error message.
+_TYPE_ERR_STRS = {
+	paths.Path: 'a pathlib PosixPath or WindowsPath',
+	int: 'an int',
+	float: 'a float',
+	bool: 'True or False',
+	str: 'a str',
+	list: 'a list',
+}
+
 class VerifyInputType:
-	def is_type_or_print_err_and_quit(self, in_type, target_type, in_type_str):
-		"""Function to confirm method input(s) are the correct type """
-		if in_type is not target_type:
-			if target_type is paths.Path:
-				# To keep this cross-platform the target_type = paths.Path() so it knows which type to check
-				# and then confrim it's actually a Posix or Windows path.
-				if in_type is not paths.PosixPath and in_type is not paths.WindowsPath:
-					target_type_err_str = 'a pathlib PosixPath or WindowsPath'
-				else:
-					return False
-			elif target_type is int:
-				target_type_err_str = 'an int'
-			elif target_type is float:
-				target_type_err_str = 'a float'
-			elif target_type is bool:
-				target_type_err_str = 'True or False'
-			elif target_type is str:
-				target_type_err_str = 'a str'
-			elif target_type is list:
-				target_type_err_str = 'a list'
-			else:
-				print(f'Error, "{target_type}," is not a type that can be checked in _is_type_or_print_err yet.')
-				quit()
-			print(f'Error, {in_type_str} must be {target_type_err_str} not "{in_type}"')
+	@staticmethod
+	def is_type_or_print_err_and_quit(in_value, target_type, in_type_str):
+		"""Function to confirm method input(s) are the correct type
+		(a staticmethod so classmethods can call it too, e.g. cls.is_type_or_print_err_and_quit(...))"""
+		if target_type is paths.Path:
+			# To keep this cross-platform the target_type = paths.Path() so it knows which type to check
+			# and then confirm it's actually a Posix or Windows path.
+			if isinstance(in_value, _PATH_TYPES):
+				return
+		# True and False are also ints so don't let them pass as an int.
+		elif isinstance(in_value, target_type) and not (target_type is int and isinstance(in_value, bool)):
+			return
+		
+		target_type_err_str = _TYPE_ERR_STRS.get(target_type)
+		if target_type_err_str is None:
+			print(f'Error, "{target_type}," is not a type that can be checked in _is_type_or_print_err yet.')
 			quit()
+		print(f'Error, {in_type_str} must be {target_type_err_str} not "{type(in_value)}"')
+		quit()
+
+
+def validate_types(**arg_types):
+	"""Decorator to confirm a method's arguments are the correct type before it runs
+	(see VerifyInputType.is_type_or_print_err_and_quit), e.g. @validate_types(shortest=bool, pan_strm=list)\n
+	The checks are skipped when Python is run with -O (like assert statements.)"""
+	def decorator(method):
+		if not __debug__:
+			return method
+		# The signature only needs to be read once (not every time the method is called.)
+		signature = inspect.signature(method)
+		
+		@functools.wraps(method)
+		def wrapper(self, *args, **kwargs):
+			bound_args = signature.bind(self, *args, **kwargs)
+			bound_args.apply_defaults()
+			for arg_name, target_type in arg_types.items():
+				self.is_type_or_print_err_and_quit(bound_args.arguments[arg_name], target_type, arg_name)
+			return method(*bound_args.args, **bound_args.kwargs)
+		return wrapper
+	return decorator
@@ -1,5 +1,24 @@
 import pathlib as paths
-import subprocess as sub
+
+# Both concrete path types so one isinstance call can confirm a path is valid.
+_PATH = (paths.PosixPath, paths.WindowsPath)
+
+# Dictionary to hold RGB values so they can easily be called by using a color keyword
+# (any other string is used as a custom RGB color.)
+_RGB_VALUES = {
+	'Green': 'green rgb',
+	'Black': 'Black',
+	'Yellow': 'yellow rgb',
+}
+
+
+def _escape_filter_path(path):
+	"""Return path escaped so it can be used as a filter option value inside a filtergraph string.
+	The filter option parser needs \\, ' and : backslash-escaped, then the whole value is single quoted for the
+	filtergraph parser so , ; [ and ] are literal (a ' ends the quote so it's written as '\\'' to continue it.)"""
+	opt_escaped = str(path).replace('\\', '\\\\').replace("'", "\\'").replace(':', '\\:')
+	return "'" + opt_escaped.replace("'", "'\\''") + "'"
+
 
 class Visualizer:
 	def __init__(self, in_path, out_dir, resolution='1920x1080', background=True, background_rgb='Default',
@@ -13,7 +32,7 @@ class Visualizer:
 			background_rgb and background_artwork_or_video are mutually exclusive.\n
 			freq_rgb and background_rgb can change the color of the frequency indicator and background respectively,\n
 			    Certain color keywords provide the rgb value, otherwise rgb input is treated as a rgb code
-			    (see rgb_value_dict for keywords, but only one color can be set at a time.)\n
+			    (see _RGB_VALUES for keywords, but only one color can be set at a time.)\n
 			file_artwork default ('Input Artwork') gets any potential file_artwork from the input,
 				but can also be set to an artwork_file path.\n
 			open_after_ren can be set to True (open output file with default application) False (don't open at all) or
@@ -26,7 +45,7 @@ class Visualizer:
 		# Path to output directory for ffmpeg cmd.
 		self.out_dir = paths.Path(out_dir)
 		# Path to standard ffmpeg output path which is just the original name of the input in a new directory.
-		self.out_path = paths.Path.joinpath(self.out_dir, self.in_path.stem + '.mp4')
+		self.out_path = self.out_dir / (self.in_path.stem + '.mp4')
 		# Set the resolution of the output video file (default is 1920x1080).
 		self.resolution = resolution
 		
@@ -41,36 +60,20 @@ class Visualizer:
 			print(f'Error, background must be True or False, not {background}')
 			quit()
 		
-		# Dictionary to hold RGB values so they can easily be called by using a color keyword.
-		rgb_value_dict = dict([
-			('Green', 'green rgb'),
-			('Black', 'Black'),
-			('Yellow', 'yellow rgb'),
-		])
-		
-		# Local method to return the RGB value if the rgb_keyword matches, otherwise just return rgb_keyword
-		# (which is supposed to be a custom RGB color.)
-		def get_rgb_value(rgb_keyword):
-			for rgb_color_code in rgb_value_dict.keys():
-				if rgb_keyword == rgb_color_code:
-					return rgb_value_dict[rgb_color_code]
-			else:
-				return rgb_keyword
-		
 		# The video background can either be an image or an RGB color, so print an error if both are specified.
 		if background_rgb != 'Default' and background_artwork_or_video is not None:
 			print(f'Error, background_rgb and background_artwork_or_video are mutually exclusive.')
 			quit()
 		
-		# Set video background to a custom RGB value with certain color presets available (see rgb_value_dict).
+		# Set video background to a custom RGB value with certain color presets available (see _RGB_VALUES).
 		if background is False and background_rgb != 'Default':
 			print(f'Error, background is set to False (transparent), background must be set to True to change the RGB value.')
 			quit()
 		elif background_rgb == 'Default':
 			# Nothing was specified so set background_rgb to default Black.
-			self.background_rgb = rgb_value_dict['Black']
-		elif type(background_rgb) is str and background_rgb != 'Default':
-			self.background_rgb = get_rgb_value(background_rgb)
+			self.background_rgb = _RGB_VALUES['Black']
+		elif isinstance(background_rgb, str) and background_rgb != 'Default':
+			self.background_rgb = _RGB_VALUES.get(background_rgb, background_rgb)
 		# This is supposed to be a custom RGB input color.
 		else:
 			print(f'Error, background_rgb must be a RGB string, not "{background_rgb}"')
@@ -94,30 +97,31 @@ class Visualizer:
 				print(f'Error, background_artwork_or_video must be a file path,'
 				      f'not {type(background_artwork_or_video)} "{background_artwork_or_video}"')
 		
-		# String to change the frequency rgb value with certain color presets available (see rgb_value_dict).
+		# String to change the frequency rgb value with certain color presets available (see _RGB_VALUES).
 		if freq_rgb == 'Default':
 			# Set frequency RGB value to the default (Green).
-			self.freq_rgb = rgb_value_dict['Green']
-		elif type(freq_rgb) is not str:
+			self.freq_rgb = _RGB_VALUES['Green']
+		elif not isinstance(freq_rgb, str):
 			# Input is not type string so print an error.
 			print(f'Error, freq_rgb needs to be a string, not {type(freq_rgb)}')
-		elif freq_rgb != 'Default' and type(freq_rgb) is str:
-			# A string value was specified so run get_rgb_value to see if freq_rgb is a valid RGB color keyword.
-			self.freq_rgb = get_rgb_value(freq_rgb)
+		elif freq_rgb != 'Default' and isinstance(freq_rgb, str):
+			# A string value was specified so use the RGB value if freq_rgb is a color keyword (otherwise it's a custom RGB value.)
+			self.freq_rgb = _RGB_VALUES.get(freq_rgb, freq_rgb)
 		else:
 			print(f'Error, "{freq_rgb}"" is not a valid RGB frequency value.')
 			quit()
 		
 		# Attempt to set the output file artwork to the artwork from the input.
+		# Only check if the artwork exists once (it's a filesystem call.)
+		artwork_is_path = isinstance(file_artwork, _PATH)
+		artwork_exists = artwork_is_path and file_artwork.exists()
 		if file_artwork is True:
 			self.file_artwork = True
 		elif file_artwork is False:
 			self.file_artwork = False
-		elif type(file_artwork) is paths.PosixPath and file_artwork.exists() is True \
-				or type(file_artwork) is paths.WindowsPath and file_artwork.exists() is True:
+		elif artwork_is_path is True and artwork_exists is True:
 			self.file_artwork = file_artwork
-		elif type(file_artwork) is paths.PosixPath and file_artwork.exists() is False \
-				or type(file_artwork) is paths.WindowsPath and file_artwork.exists() is False:
+		elif artwork_is_path is True:
 			print(f'Error, input file: "{file_artwork}"', "doesn't exist.")
 		else:
 			print(f'Error, file_artwork must be True (default, embed input artwork to output artwork),'
@@ -131,7 +135,7 @@ class Visualizer:
 		
 		# open_after_ren will atomically open the output file if set to True,
 		# with a specific application if set a string, or not at all if set to False.
-		if type(open_after_ren) is bool or type(open_after_ren) is str:
+		if isinstance(open_after_ren, (bool, str)):
 			self.open_after_ren = open_after_ren
 		else:
 			print(f'Error, open_after_ren must be True, False, or string of application name, not {type(open_after_ren)}'
@@ -144,6 +148,9 @@ class Visualizer:
 	def _eval_ren_cmd(self, render_cmd):
 		"""This local method determines which rendering class/method to use based on the self.file_artwork and opens the
 		output if self.open_after_ren is True/string"""
+		# NOTE: These imports are down here so importing the Visualizer doesn't load every rendering module.
+		from Render import Render
+		from FileOperations import FileOperations
 		
 		if self.file_artwork is True:
 			# Attempt to embed the artwork from the input file.
@@ -171,8 +178,11 @@ class Visualizer:
 	
 	def showfreqs(self):
 		
-		render_cmd = ['ffmpeg', '-f', 'lavfi', 'amovie=', self.in_path, 'asplit', '[a][out1];',
-		              '[a]', 'showvolume=f=1:b=4:w=800:h=70', '[out0]', self.out_path]
+		# The lavfi graph has to be a single argument (each output pad is labelled out0, out1, ...)
+		# with the input file passed to the amovie source inside the graph (escaped for the filtergraph syntax.)
+		render_cmd = ['ffmpeg', '-f', 'lavfi', '-i',
+		              f'amovie={_escape_filter_path(self.in_path)},asplit[a][out1];[a]showvolume=f=1:b=4:w=800:h=70[out0]',
+		              str(self.out_path)]
 		# render_cmd = ['ffmpeg', '-i', self.in_path, '-filter_complex',
 		#               "[0:a]showspatial=win_func=bartlett,format=yuv420p[v]",
 		#               '-map', '[v]', '-map', '0:a', '-c:a', 'aac', self.out_path]
@@ -3,3 +3,4 @@
 
 from MetadataAcquisition import MetadataAcquisition
 from FileOperations import FileOperations
+from Render import RenderPool